@@ -6,5 +6,5 @@ class ApiAppConfig(AppConfig):
     name = 'api_app'
 
     def ready(self):
-        from . import signals
+        from . import checks, signals
         
\ No newline at end of file
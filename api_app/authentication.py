@@ -0,0 +1,48 @@
+from drf_spectacular.contrib.rest_framework_simplejwt import SimpleJWTScheme
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from api_app.models import TokenUser
+from api_app.services.token_service import is_token_revoked
+
+
+class StatelessJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication without the per-request user query.
+
+    Tokens issued by sign_token carry username/is_active/is_staff, which is
+    all most endpoints read, so request.user is a TokenUser built from the
+    claims. Older tokens without those claims fall back to the database.
+
+    Trade-off: deactivating an account, a staff change or a rename takes
+    effect for its access tokens only when they expire
+    (ACCESS_TOKEN_LIFETIME). FilteredTokenRefreshSerializer re-stamps the
+    claims from the user row on every refresh. Requests of a deleted account
+    fail when they reach the missing row; stateless_exception_handler turns
+    that into a 401 (api_app/exceptions.py).
+    """
+
+    def get_user(self, validated_token):
+        claims = (api_settings.USER_ID_CLAIM, *TokenUser.CLAIM_FIELDS)
+        if any(claim not in validated_token for claim in claims):
+            return super().get_user(validated_token)
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not validated_token["is_active"]:
+            raise AuthenticationFailed("User is inactive", code="user_inactive")
+        return TokenUser.from_claims(validated_token[api_settings.USER_ID_CLAIM], validated_token)
+
+
+class StatelessJWTScheme(SimpleJWTScheme):
+    """Document StatelessJWTAuthentication as the same `jwtAuth` bearer scheme."""
+
+    target_class = "api_app.authentication.StatelessJWTAuthentication"
+
+
+class FilteredRefreshToken(RefreshToken):
+    """RefreshToken whose blacklist check goes through the revocation filter."""
+
+    def check_blacklist(self):
+        if is_token_revoked(self.payload[api_settings.JTI_CLAIM]):
+            raise TokenError("Token is blacklisted")
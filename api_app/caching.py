@@ -0,0 +1,325 @@
+import hashlib
+import logging
+import math
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.signals import setting_changed
+from django.db import transaction
+from django.dispatch import receiver
+
+logger = logging.getLogger(__name__)
+
+MISS = object()
+
+
+class LRUCache:
+    """Thread-safe, size-bounded LRU with a per-entry TTL (seconds)."""
+
+    def __init__(self, max_size, ttl):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return MISS
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return MISS
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + self.ttl)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def delete_many(self, keys):
+        with self._lock:
+            for key in keys:
+                self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+class SharedCache:
+    """Adapter exposing a Django cache alias with the LRUCache interface."""
+
+    def __init__(self, alias, ttl, prefix):
+        self.cache = caches[alias]
+        self.ttl = ttl
+        self.prefix = prefix
+
+    def _key(self, key):
+        return f"{self.prefix}:{':'.join(str(part) for part in key)}"
+
+    def get(self, key):
+        return self.cache.get(self._key(key), MISS)
+
+    def set(self, key, value):
+        self.cache.set(self._key(key), value, self.ttl)
+
+    def delete(self, key):
+        self.cache.delete(self._key(key))
+
+    def delete_many(self, keys):
+        self.cache.delete_many([self._key(key) for key in keys])
+
+    def clear(self):
+        # Entries expire through their TTL; a shared cache is never flushed wholesale.
+        pass
+
+
+class BloomFilter:
+    """
+    Fixed-size set of strings with false positives but no false negatives.
+
+    Sized for `capacity` items at `error_rate`. Items cannot be removed;
+    rebuild the filter instead. Not thread-safe.
+    """
+
+    def __init__(self, capacity, error_rate=0.01):
+        self.capacity = max(capacity, 1)
+        self.size = max(int(-self.capacity * math.log(error_rate) / math.log(2) ** 2), 8)
+        self.hash_count = max(round(self.size / self.capacity * math.log(2)), 1)
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item):
+        # Double hashing: the i-th position is h1 + i * h2.
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def add(self, item):
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item):
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+
+# ---------- role cache: (user_id, task_id) -> role ----------
+
+# Stored in place of None so "not a member" can be cached too.
+_NO_ROLE = ""
+
+_role_cache = None
+_role_cache_lock = threading.Lock()
+
+
+def role_cache_staleness_warning():
+    """
+    Explain why the configured role cache goes stale across processes, or
+    return None. Used by the api_app.W001 system check and at cache creation.
+    """
+    workers = getattr(settings, "WEB_CONCURRENCY", 1)
+    if workers <= 1 or not getattr(settings, "ROLE_CACHE_BACKEND", ""):
+        return None
+    if settings.ROLE_CACHE_BACKEND == "local":
+        where = 'ROLE_CACHE_BACKEND="local" keeps roles in each process'
+    else:
+        alias = getattr(settings, "ROLE_CACHE_ALIAS", "default")
+        if not isinstance(caches[alias], LocMemCache):
+            return None
+        where = f"ROLE_CACHE_ALIAS {alias!r} is a per-process LocMemCache"
+    return (
+        f"{where}, but WEB_CONCURRENCY is {workers}: a revoked or downgraded role "
+        "stays cached in the other workers for up to ROLE_CACHE_TTL seconds."
+    )
+
+
+def get_role_cache():
+    """
+    Return the configured role cache, or None when ROLE_CACHE_BACKEND is unset.
+
+    - "local": per-process LRU. Invalidation only reaches the process that
+      wrote the membership, so other workers keep a revoked role for up to
+      ROLE_CACHE_TTL seconds. Use it with a single worker process.
+    - any other value ("shared"): Django cache alias ROLE_CACHE_ALIAS, safe
+      across workers when the alias is (Redis, Memcached, database).
+    """
+    global _role_cache
+    backend = getattr(settings, "ROLE_CACHE_BACKEND", "")
+    if not backend:
+        return None
+    if _role_cache is None:
+        with _role_cache_lock:
+            if _role_cache is None:
+                warning = role_cache_staleness_warning()
+                if warning:
+                    logger.warning(warning)
+                ttl = getattr(settings, "ROLE_CACHE_TTL", 60)
+                if backend == "local":
+                    _role_cache = LRUCache(getattr(settings, "ROLE_CACHE_MAX_SIZE", 10000), ttl)
+                else:
+                    _role_cache = SharedCache(
+                        getattr(settings, "ROLE_CACHE_ALIAS", "default"), ttl, prefix="task-role"
+                    )
+    return _role_cache
+
+
+def get_cached_role(user_id, task_id):
+    """Return the cached role, None for a cached non-member, or MISS."""
+    cache = get_role_cache()
+    if cache is None:
+        return MISS
+    value = cache.get((user_id, task_id))
+    if value is MISS:
+        return MISS
+    return value or None
+
+
+def cache_role(user_id, task_id, role):
+    cache = get_role_cache()
+    if cache is not None:
+        cache.set((user_id, task_id), role or _NO_ROLE)
+
+
+def invalidate_role(user_id, task_id):
+    cache = get_role_cache()
+    if cache is not None:
+        cache.delete((user_id, task_id))
+
+
+def invalidate_role_on_commit(user_id, task_id):
+    """
+    invalidate_role now and again when the current transaction commits: a
+    concurrent request can read the old role before the commit and cache it.
+    """
+    invalidate_role(user_id, task_id)
+    transaction.on_commit(lambda: invalidate_role(user_id, task_id))
+
+
+def clear_role_cache():
+    global _role_cache
+    with _role_cache_lock:
+        if _role_cache is not None:
+            _role_cache.clear()
+        _role_cache = None
+
+
+@receiver(setting_changed)
+def reset_role_cache(setting, **kwargs):
+    if setting.startswith("ROLE_CACHE_") or setting == "WEB_CONCURRENCY":
+        clear_role_cache()
+
+
+# ---------- dashboard cache: user_id -> aggregate ----------
+
+
+def get_dashboard_cache():
+    """
+    Django cache alias DASHBOARD_CACHE_ALIAS, or None when DASHBOARD_CACHE_TTL
+    is 0 (the default). Invalidation is explicit, so the alias must be shared
+    by all workers.
+    """
+    ttl = getattr(settings, "DASHBOARD_CACHE_TTL", 0)
+    if not ttl:
+        return None
+    return SharedCache(getattr(settings, "DASHBOARD_CACHE_ALIAS", "default"), ttl, prefix="dashboard")
+
+
+def get_cached_dashboard(user_id):
+    cache = get_dashboard_cache()
+    if cache is None:
+        return MISS
+    return cache.get((user_id,))
+
+
+def cache_dashboard(user_id, value):
+    cache = get_dashboard_cache()
+    if cache is not None:
+        cache.set((user_id,), value)
+
+
+def invalidate_dashboards(user_ids):
+    """
+    Drop the users' dashboards now and again when the current transaction
+    commits: a concurrent request can cache counts from before the commit.
+    """
+    cache = get_dashboard_cache()
+    if cache is None:
+        return
+    keys = [(user_id,) for user_id in set(user_ids)]
+    cache.delete_many(keys)
+    transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+# ---------- user directory search: query -> response page ----------
+
+
+def get_user_search_cache():
+    """Short-TTL cache of /api/users/?q= pages (the same for every caller)."""
+    ttl = getattr(settings, "USER_SEARCH_CACHE_TTL", 30)
+    if not ttl:
+        return None
+    return SharedCache(getattr(settings, "USER_SEARCH_CACHE_ALIAS", "default"), ttl, prefix="user-search")
+
+
+# ---------- token users: user_id -> user fields not carried in the JWT ----------
+
+_user_field_cache = None
+_user_field_cache_lock = threading.Lock()
+
+
+def get_user_field_cache():
+    """Per-process LRU of user rows, or None when TOKEN_USER_CACHE_TTL is 0."""
+    global _user_field_cache
+    ttl = getattr(settings, "TOKEN_USER_CACHE_TTL", 60)
+    if not ttl:
+        return None
+    if _user_field_cache is None:
+        with _user_field_cache_lock:
+            if _user_field_cache is None:
+                _user_field_cache = LRUCache(getattr(settings, "TOKEN_USER_CACHE_SIZE", 1000), ttl)
+    return _user_field_cache
+
+
+def get_cached_user_fields(user_id):
+    cache = get_user_field_cache()
+    if cache is None:
+        return MISS
+    return cache.get(user_id)
+
+
+def cache_user_fields(user_id, values):
+    cache = get_user_field_cache()
+    if cache is not None:
+        cache.set(user_id, values)
+
+
+def invalidate_user_fields(user_id):
+    cache = get_user_field_cache()
+    if cache is not None:
+        cache.delete(user_id)
+
+
+@receiver(setting_changed)
+def reset_user_field_cache(setting, **kwargs):
+    global _user_field_cache
+    if setting.startswith("TOKEN_USER_CACHE_"):
+        with _user_field_cache_lock:
+            _user_field_cache = None
@@ -0,0 +1,17 @@
+from django.core.checks import Tags, Warning, register
+
+from api_app.caching import role_cache_staleness_warning
+
+
+@register(Tags.caches)
+def check_role_cache(app_configs, **kwargs):
+    message = role_cache_staleness_warning()
+    if message is None:
+        return []
+    return [
+        Warning(
+            message,
+            hint='Set ROLE_CACHE_BACKEND="shared" with a ROLE_CACHE_ALIAS shared by all workers (e.g. Redis).',
+            id="api_app.W001",
+        )
+    ]
@@ -0,0 +1,145 @@
+import hashlib
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from rest_framework import status
+from rest_framework.response import Response
+
+from api_app.services.sync_service import get_sync_token, parse_updated_since
+
+
+def make_etag(*parts):
+    raw = "|".join("" if part is None else str(part) for part in parts)
+    return '"%s"' % hashlib.md5(raw.encode("utf-8"), usedforsecurity=False).hexdigest()
+
+
+def set_validators(response, etag, last_modified):
+    if etag:
+        response["ETag"] = etag
+    if last_modified:
+        response["Last-Modified"] = http_date(last_modified.timestamp())
+    return response
+
+
+def conditional_response(request, etag, last_modified):
+    """
+    Evaluate If-None-Match / If-Modified-Since / If-Match / If-Unmodified-Since.
+    Return the 304 or 412 response to send, or None to carry on.
+    """
+    timestamp = int(last_modified.timestamp()) if last_modified else None
+    response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+    if response is not None:
+        set_validators(response, etag, last_modified)
+    return response
+
+
+class ConditionalObjectMixin:
+    """
+    Conditional requests for detail views of models with `updated_at`.
+
+    GET answers 304 when the client's ETag still matches, without serializing.
+    PATCH/PUT/DELETE honour If-Match and answer 412 when the row changed since
+    the client read it.
+    """
+
+    def get_object(self):
+        # retrieve/update/destroy would otherwise load the row twice.
+        if not hasattr(self, "_conditional_object"):
+            self._conditional_object = super().get_object()
+        return self._conditional_object
+
+    def get_object_validators(self, obj):
+        return make_etag(obj.pk, obj.updated_at.isoformat()), obj.updated_at
+
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+        etag, last_modified = self.get_object_validators(instance)
+        response = conditional_response(request, etag, last_modified)
+        if response is not None:
+            return response
+        return set_validators(Response(self.get_serializer(instance).data), etag, last_modified)
+
+    def update(self, request, *args, **kwargs):
+        response = conditional_response(request, *self.get_object_validators(self.get_object()))
+        if response is not None:
+            return response
+        response = super().update(request, *args, **kwargs)
+        return set_validators(response, *self.get_object_validators(self.get_object()))
+
+    def destroy(self, request, *args, **kwargs):
+        response = conditional_response(request, *self.get_object_validators(self.get_object()))
+        if response is not None:
+            return response
+        return super().destroy(request, *args, **kwargs)
+
+
+class ConditionalListMixin:
+    """
+    Conditional GET for list views, validated by one aggregate query
+    (row count + max(updated_at)) instead of rendering the list.
+
+    Lists send an ETag only. Deleting a row does not move max(updated_at), so
+    a Last-Modified built from it would answer If-Modified-Since with a 304
+    for a list that lost rows; the count in the ETag does change.
+    """
+
+    def get_list_validators(self):
+        stats = self.filter_queryset(self.get_queryset()).order_by().aggregate(
+            count=Count("pk"), last_modified=Max("updated_at")
+        )
+        last_modified = stats["last_modified"]
+        etag = make_etag(stats["count"], last_modified.isoformat() if last_modified else None)
+        return etag, None
+
+    def list(self, request, *args, **kwargs):
+        # Delta responses depend on the watermark, not just on the rows.
+        if getattr(self, "updated_since", None) is not None:
+            return super().list(request, *args, **kwargs)
+
+        etag, last_modified = self.get_list_validators()
+        response = conditional_response(request, etag, last_modified)
+        if response is not None:
+            return response
+        return set_validators(super().list(request, *args, **kwargs), etag, last_modified)
+
+
+class DeltaSyncListMixin:
+    """
+    Adds `?updated_since=` to a list view. get_queryset() narrows to changed
+    rows when `self.updated_since` is set, and get_deleted_ids(since) reports
+    the ids of rows the caller could see that were deleted at or after the
+    watermark, from the view's tombstones. Delta responses are not paginated.
+
+    Views must define get_deleted_ids(); this is checked when the view class
+    is created.
+    """
+
+    updated_since = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if not callable(getattr(cls, "get_deleted_ids", None)):
+            raise ImproperlyConfigured(f"{cls.__name__} must define get_deleted_ids(since).")
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        if request.method == "GET":
+            self.updated_since = parse_updated_since(request.query_params)
+
+    def list(self, request, *args, **kwargs):
+        if self.updated_since is None:
+            return super().list(request, *args, **kwargs)
+
+        sync_token = get_sync_token()
+        queryset = self.filter_queryset(self.get_queryset())
+        serializer = self.get_serializer(queryset, many=True)
+        return Response(
+            {
+                "results": serializer.data,
+                "deleted": self.get_deleted_ids(self.updated_since),
+                "sync_token": sync_token.isoformat(),
+            },
+            status=status.HTTP_200_OK,
+        )
@@ -0,0 +1,19 @@
+from django.contrib.auth import get_user_model
+from django.db import IntegrityError
+from rest_framework.views import exception_handler
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+
+from api_app.models import TokenUser
+
+
+def stateless_exception_handler(exc, context):
+    """
+    DRF exception handler: a write referencing a TokenUser whose account was
+    deleted fails its foreign key, and loading the user's deferred fields
+    finds no row. Answer 401 like JWTAuthentication does for a missing user.
+    """
+    if isinstance(exc, (IntegrityError, get_user_model().DoesNotExist)):
+        user = getattr(context.get("request"), "user", None)
+        if isinstance(user, TokenUser) and not get_user_model()._base_manager.filter(pk=user.pk).exists():
+            exc = AuthenticationFailed("User not found", code="user_not_found")
+    return exception_handler(exc, context)
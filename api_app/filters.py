@@ -0,0 +1,104 @@
+from django.db.models import Case, IntegerField, Q, Value, When
+from django.utils.dateparse import parse_date
+from rest_framework.exceptions import ValidationError
+
+from api_app.models import TaskPriority, TaskStatus, UserTaskRole
+
+# Public ordering names -> model/annotation field. `id` is appended as tie-breaker.
+TASK_ORDERING_FIELDS = {
+    "created_at": "created_at",
+    "updated_at": "updated_at",
+    "deadline": "deadline",
+    "priority": "priority_rank",
+}
+DEFAULT_TASK_ORDERING = ("-created_at", "-id")
+
+
+def _choice_values(params, name, choices):
+    values = [value for value in params.getlist(name) if value != ""]
+    invalid = [value for value in values if value not in choices.values]
+    if invalid:
+        raise ValidationError({name: [f'"{value}" is not a valid choice.' for value in invalid]})
+    return values
+
+
+def _date_value(params, name):
+    raw = params.get(name)
+    if not raw:
+        return None
+    try:
+        value = parse_date(raw)
+    except ValueError:
+        value = None
+    if value is None:
+        raise ValidationError({name: ["Date has wrong format. Use YYYY-MM-DD."]})
+    return value
+
+
+def annotate_priority_rank(queryset):
+    """Priority as a sortable rank: Low=1, Medium=2, High=3."""
+    return queryset.annotate(
+        priority_rank=Case(
+            When(priority=TaskPriority.HIGH, then=Value(3)),
+            When(priority=TaskPriority.MEDIUM, then=Value(2)),
+            When(priority=TaskPriority.LOW, then=Value(1)),
+            default=Value(0),
+            output_field=IntegerField(),
+        )
+    )
+
+
+def get_task_membership_filters(params, user, updated_since=None):
+    """
+    Conditions on the user_tasks join. They must be applied in one filter()
+    call so that they all constrain the caller's own membership row.
+    """
+    condition = Q(memberships__user=user)
+    roles = _choice_values(params, "role", UserTaskRole)
+    if roles:
+        condition &= Q(memberships__role__in=roles)
+    if updated_since is not None:
+        # A task also counts as changed when the caller's membership did.
+        condition &= Q(updated_at__gte=updated_since) | Q(memberships__updated_at__gte=updated_since)
+    return condition
+
+
+def get_task_filters(params):
+    condition = Q()
+
+    statuses = _choice_values(params, "status", TaskStatus)
+    if statuses:
+        condition &= Q(status__in=statuses)
+
+    priorities = _choice_values(params, "priority", TaskPriority)
+    if priorities:
+        condition &= Q(priority__in=priorities)
+
+    deadline_after = _date_value(params, "deadline_after")
+    if deadline_after is not None:
+        condition &= Q(deadline__gte=deadline_after)
+
+    deadline_before = _date_value(params, "deadline_before")
+    if deadline_before is not None:
+        condition &= Q(deadline__lte=deadline_before)
+
+    search = params.get("search", "").strip()
+    if search:
+        condition &= Q(title__icontains=search) | Q(description__icontains=search)
+
+    return condition
+
+
+def get_task_ordering(params):
+    raw = params.get("ordering", "").strip()
+    if not raw:
+        return DEFAULT_TASK_ORDERING
+
+    descending = raw.startswith("-")
+    field = TASK_ORDERING_FIELDS.get(raw.lstrip("-"))
+    if field is None:
+        allowed = ", ".join(sorted(TASK_ORDERING_FIELDS))
+        raise ValidationError({"ordering": [f"Unknown ordering. Allowed: {allowed} (prefix with - for descending)."]})
+
+    prefix = "-" if descending else ""
+    return (f"{prefix}{field}", f"{prefix}id")
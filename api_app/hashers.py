@@ -0,0 +1,129 @@
+"""
+Password hashers with environment-tuned cost, run in a bounded thread pool.
+
+PASSWORD_HASHERS (backend/settings.py) lists these instead of Django's
+classes. They keep Django's algorithm names, so existing hashes still verify;
+when the configured cost or algorithm changes, Django re-hashes the password
+on the next successful login.
+
+With PASSWORD_HASH_WORKERS > 0, every hash and verification runs on a pool of
+that many threads (hashlib and argon2 release the GIL), with at most
+PASSWORD_HASH_QUEUE_SIZE more waiting. Anything beyond that is rejected with
+503 and Retry-After instead of queueing, so a login burst cannot tie up every
+request thread. The limit applies per process.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from django.conf import settings
+from django.contrib.auth import hashers
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+
+class PasswordHashingBusy(APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = "Too many sign-ins in progress; try again shortly."
+    default_code = "password_hashing_busy"
+    # DRF's exception handler sends this as Retry-After.
+    wait = 1
+
+
+_pool = None
+_pool_lock = threading.Lock()
+_worker = threading.local()
+
+
+def _get_pool():
+    global _pool
+    workers = getattr(settings, "PASSWORD_HASH_WORKERS", 0)
+    if workers <= 0:
+        return None
+    with _pool_lock:
+        if _pool is None:
+            queue_size = getattr(settings, "PASSWORD_HASH_QUEUE_SIZE", 0)
+            _pool = (
+                ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hash"),
+                threading.BoundedSemaphore(workers + queue_size),
+            )
+        return _pool
+
+
+def _run_in_worker(slots, func, args):
+    _worker.active = True
+    try:
+        return func(*args)
+    finally:
+        _worker.active = False
+        slots.release()
+
+
+def run_hashing(func, *args):
+    """
+    Call func(*args) on the hashing pool and wait for the result, or inline
+    when the pool is disabled. Raises PasswordHashingBusy when it is full.
+    """
+    pool = _get_pool()
+    # verify() calls encode(); the nested call stays on the worker thread.
+    if pool is None or getattr(_worker, "active", False):
+        return func(*args)
+    executor, slots = pool
+    if not slots.acquire(blocking=False):
+        raise PasswordHashingBusy()
+    try:
+        future = executor.submit(_run_in_worker, slots, func, args)
+    except BaseException:
+        slots.release()
+        raise
+    return future.result()
+
+
+@receiver(setting_changed)
+def reset_hashing_pool(setting, **kwargs):
+    global _pool
+    if setting.startswith("PASSWORD_HASH_"):
+        with _pool_lock:
+            if _pool is not None:
+                _pool[0].shutdown(wait=False)
+            _pool = None
+
+
+def _cost(setting, default):
+    # Read on every use so changes to the setting trigger must_update().
+    return property(lambda self: getattr(settings, setting, 0) or default)
+
+
+class PooledHasherMixin:
+    def encode(self, password, salt, *args, **kwargs):
+        return run_hashing(partial(super().encode, password, salt, *args, **kwargs))
+
+    def verify(self, password, encoded):
+        return run_hashing(super().verify, password, encoded)
+
+    def harden_runtime(self, password, encoded):
+        return run_hashing(super().harden_runtime, password, encoded)
+
+
+class PBKDF2PasswordHasher(PooledHasherMixin, hashers.PBKDF2PasswordHasher):
+    iterations = _cost("PBKDF2_ITERATIONS", hashers.PBKDF2PasswordHasher.iterations)
+
+
+class ScryptPasswordHasher(PooledHasherMixin, hashers.ScryptPasswordHasher):
+    work_factor = _cost("SCRYPT_WORK_FACTOR", hashers.ScryptPasswordHasher.work_factor)
+
+    @property
+    def maxmem(self):
+        # OpenSSL's default limit (32 MiB) is exactly the default cost; leave
+        # headroom for a larger work factor.
+        return 2 * 128 * self.work_factor * self.block_size * self.parallelism
+
+
+class Argon2PasswordHasher(PooledHasherMixin, hashers.Argon2PasswordHasher):
+    """Needs the argon2-cffi package."""
+
+    time_cost = _cost("ARGON2_TIME_COST", hashers.Argon2PasswordHasher.time_cost)
+    memory_cost = _cost("ARGON2_MEMORY_COST", hashers.Argon2PasswordHasher.memory_cost)
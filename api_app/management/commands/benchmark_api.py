@@ -0,0 +1,78 @@
+import json
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from api_app.models import Subtask, Task, UserTask
+from api_app.services.benchmark_service import (
+    compare_results,
+    default_scenarios,
+    pick_benchmark_user,
+    run_benchmark,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the API routes in-process against the current database and print "
+        "p50/p95/p99 latency, queries per request and throughput per endpoint as JSON."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=50, help="Measured requests per endpoint.")
+        parser.add_argument("--warmup", type=int, default=5, help="Unmeasured requests per endpoint first.")
+        parser.add_argument("--username", help="Benchmark as this user (default: busiest generated user).")
+        parser.add_argument("--prefix", default="load", help="Prefix given to generate_load_data.")
+        parser.add_argument("--only", help="Only endpoints whose name contains this, e.g. 'GET task'.")
+        parser.add_argument("--output", help="Write the JSON report here instead of stdout.")
+        parser.add_argument("--compare", help="Earlier JSON report to compare p95 and queries against.")
+
+    def handle(self, *args, **options):
+        if options["requests"] <= 0:
+            raise CommandError("--requests must be positive.")
+        if options["username"]:
+            user = get_user_model().objects.filter(username=options["username"]).first()
+        else:
+            user = pick_benchmark_user(options["prefix"])
+        if user is None:
+            raise CommandError("No user to benchmark as; run generate_load_data first or pass --username.")
+
+        try:
+            scenarios = default_scenarios(user)
+        except ValueError as exc:
+            raise CommandError(str(exc))
+        if options["only"]:
+            scenarios = [scenario for scenario in scenarios if options["only"] in scenario.name]
+
+        report = {
+            "user": user.username,
+            "data": {
+                "users": get_user_model().objects.count(),
+                "tasks": Task.objects.count(),
+                "subtasks": Subtask.objects.count(),
+                "memberships": UserTask.objects.count(),
+                "user_memberships": UserTask.objects.filter(user=user).count(),
+            },
+            "endpoints": run_benchmark(user, scenarios, options["requests"], options["warmup"]),
+        }
+
+        output = json.dumps(report, indent=2, sort_keys=True)
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8") as file:
+                file.write(output + "\n")
+        else:
+            self.stdout.write(output)
+
+        for name, stats in report["endpoints"].items():
+            self.stderr.write(
+                f"{name:32} p50={stats['p50_ms']:8.2f}ms p95={stats['p95_ms']:8.2f}ms "
+                f"p99={stats['p99_ms']:8.2f}ms queries={stats['queries_per_request']:6.1f} "
+                f"{stats['throughput_rps']:8.1f} req/s errors={stats['errors']}"
+            )
+        if options["compare"]:
+            with open(options["compare"], encoding="utf-8") as file:
+                baseline = json.load(file)["endpoints"]
+            self.stderr.write("\nCompared with " + options["compare"] + ":")
+            for name, metric, before, after, ratio in compare_results(baseline, report["endpoints"]):
+                change = f"x{ratio:.2f}" if ratio is not None else "n/a"
+                self.stderr.write(f"{name:32} {metric:20} {before:10} -> {after:10} {change}")
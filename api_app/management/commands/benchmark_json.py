@@ -0,0 +1,32 @@
+import json
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from api_app.models import Task
+from api_app.serializers import TaskSerializer
+from api_app.services.benchmark_service import benchmark_json
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare stdlib and orjson rendering/parsing of a task list payload "
+        "(run generate_load_data first for a realistic size)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--tasks", type=int, default=1000, help="Tasks in the payload.")
+        parser.add_argument("--rounds", type=int, default=20)
+
+    def handle(self, *args, **options):
+        tasks = list(Task.objects.select_related("assigned_by").order_by("id")[: options["tasks"]])
+        if not tasks:
+            raise CommandError("No tasks in the database; run generate_load_data first.")
+
+        start = time.perf_counter()
+        payload = TaskSerializer(tasks, many=True).data
+        serialize_ms = (time.perf_counter() - start) * 1000
+
+        report = {"tasks": len(tasks), "serialize_ms": round(serialize_ms, 3)}
+        report.update(benchmark_json(payload, rounds=options["rounds"]))
+        self.stdout.write(json.dumps(report, indent=2, sort_keys=True))
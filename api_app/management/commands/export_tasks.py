@@ -0,0 +1,32 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from api_app.services.export_service import EXPORT_FORMATS, iter_export_records, render_export
+
+
+class Command(BaseCommand):
+    help = "Stream tasks with their subtasks and memberships as NDJSON or CSV."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--user", help="Only export tasks this username is a member of.")
+        parser.add_argument("--format", dest="export_format", choices=sorted(EXPORT_FORMATS), default="ndjson")
+        parser.add_argument("--output", help="File to write to (default: stdout).")
+        parser.add_argument("--batch-size", type=int, default=None)
+
+    def handle(self, *args, **options):
+        user = None
+        if options["user"]:
+            User = get_user_model()
+            try:
+                user = User.objects.get(username=options["user"])
+            except User.DoesNotExist as exc:
+                raise CommandError(f"User {options['user']!r} does not exist.") from exc
+
+        records = iter_export_records(user=user, batch_size=options["batch_size"])
+        chunks = render_export(records, options["export_format"])
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8", newline="") as handle:
+                handle.writelines(chunks)
+        else:
+            for chunk in chunks:
+                self.stdout.write(chunk, ending="")
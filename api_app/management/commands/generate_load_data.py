@@ -0,0 +1,52 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from api_app.services.load_data_service import DEFAULT_PASSWORD, generate_load_data
+
+
+class Command(BaseCommand):
+    help = (
+        "Create synthetic users, tasks, subtasks and memberships for benchmarking "
+        "(see benchmark_api). The same --seed produces the same data."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=100)
+        parser.add_argument("--tasks-per-user", type=int, default=20)
+        parser.add_argument("--members-per-task", type=int, default=3, help="Members besides the owner.")
+        parser.add_argument("--subtasks-per-task", type=int, default=5)
+        parser.add_argument("--prefix", default="load", help="Usernames are <prefix>_user_NNNNNN.")
+        parser.add_argument("--password", default=DEFAULT_PASSWORD)
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--copy",
+            action="store_true",
+            help="On PostgreSQL, load tasks and subtasks with COPY instead of INSERT.",
+        )
+
+    def handle(self, *args, **options):
+        for name in ("users", "tasks_per_user", "members_per_task", "subtasks_per_task"):
+            if options[name] < 0:
+                raise CommandError(f"--{name.replace('_', '-')} must not be negative.")
+        if options["batch_size"] <= 0:
+            raise CommandError("--batch-size must be positive.")
+
+        started = time.monotonic()
+        counts = generate_load_data(
+            users=options["users"],
+            tasks_per_user=options["tasks_per_user"],
+            members_per_task=options["members_per_task"],
+            subtasks_per_task=options["subtasks_per_task"],
+            prefix=options["prefix"],
+            password=options["password"],
+            seed=options["seed"],
+            batch_size=options["batch_size"],
+            use_copy=options["copy"],
+        )
+        elapsed = time.monotonic() - started
+        self.stdout.write(self.style.SUCCESS(
+            f"users={counts['users']} tasks={counts['tasks']} subtasks={counts['subtasks']} "
+            f"memberships={counts['memberships']} in {elapsed:.1f}s"
+        ))
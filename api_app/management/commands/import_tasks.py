@@ -0,0 +1,72 @@
+import sys
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from api_app.services.import_service import DEFAULT_TASK_WINDOW, TaskImporter, read_csv, read_ndjson
+
+
+class Command(BaseCommand):
+    help = (
+        "Import tasks, subtasks and memberships from NDJSON or CSV in the format "
+        "produced by export_tasks. Users are matched by username."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Input file, or - for stdin.")
+        parser.add_argument("--format", dest="input_format", choices=["ndjson", "csv"])
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument("--owner", help="Username to use for tasks without assigned_by.")
+        parser.add_argument(
+            "--task-window",
+            type=int,
+            default=DEFAULT_TASK_WINDOW,
+            help="How many recent source task ids to remember for resolving subtasks and memberships.",
+        )
+        parser.add_argument(
+            "--copy",
+            action="store_true",
+            help="On PostgreSQL, load tasks and subtasks with COPY instead of INSERT.",
+        )
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        input_format = options["input_format"] or ("csv" if path.endswith(".csv") else "ndjson")
+        if options["batch_size"] <= 0:
+            raise CommandError("--batch-size must be positive.")
+
+        importer = TaskImporter(
+            batch_size=options["batch_size"],
+            default_owner=options["owner"],
+            use_copy=options["copy"],
+            task_window=options["task_window"],
+        )
+        if options["copy"] and not importer.use_copy:
+            self.stderr.write("--copy needs PostgreSQL; falling back to bulk INSERT.")
+
+        started = time.monotonic()
+        stream = sys.stdin if path == "-" else open(path, encoding="utf-8", newline="")
+        try:
+            reader = read_csv(stream) if input_format == "csv" else read_ndjson(stream)
+            for line_no, record in enumerate(reader, start=1):
+                importer.feed(record, line_no)
+                if line_no % (options["batch_size"] * 10) == 0:
+                    self._report(importer.counts, started)
+            counts = importer.finish()
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+
+        for error in importer.errors:
+            self.stderr.write(error)
+        self._report(counts, started, style=self.style.SUCCESS)
+
+    def _report(self, counts, started, style=None):
+        elapsed = max(time.monotonic() - started, 1e-6)
+        rows = counts["tasks"] + counts["subtasks"] + counts["memberships"]
+        message = (
+            f"tasks={counts['tasks']} subtasks={counts['subtasks']} "
+            f"memberships={counts['memberships']} skipped={counts['skipped']} "
+            f"({rows / elapsed:,.0f} rows/s)"
+        )
+        self.stdout.write(style(message) if style else message)
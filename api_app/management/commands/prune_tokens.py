@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from api_app.services.token_service import prune_expired_tokens
+
+
+class Command(BaseCommand):
+    help = "Delete expired JWT outstanding tokens and their blacklist entries in batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=None)
+
+    def handle(self, *args, **options):
+        deleted = prune_expired_tokens(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} expired tokens."))
@@ -0,0 +1,27 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from api_app.services.outbox_service import relay_outbox
+
+
+class Command(BaseCommand):
+    help = "Publish pending outbox messages to the Celery broker."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=None)
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep relaying every OUTBOX_RELAY_INTERVAL seconds instead of draining once.",
+        )
+
+    def handle(self, *args, **options):
+        interval = getattr(settings, "OUTBOX_RELAY_INTERVAL", 5)
+        while True:
+            published = relay_outbox(batch_size=options["batch_size"])
+            self.stdout.write(f"Published {published} outbox messages.")
+            if not options["loop"]:
+                break
+            time.sleep(interval)
@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+
+from api_app.models import Task
+from api_app.services.subtask_service import recount_subtask_counters
+
+
+class Command(BaseCommand):
+    help = "Recompute Task.subtask_total/subtask_done from the subtasks table."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        checked = 0
+        repaired = 0
+        last_id = 0
+        while True:
+            task_ids = list(
+                Task.objects.filter(id__gt=last_id).order_by("id").values_list("id", flat=True)[:batch_size]
+            )
+            if not task_ids:
+                break
+            repaired += recount_subtask_counters(task_ids)
+            checked += len(task_ids)
+            last_id = task_ids[-1]
+        self.stdout.write(self.style.SUCCESS(f"Checked {checked} tasks, repaired {repaired}."))
@@ -0,0 +1,104 @@
+"""
+In-process request metrics, exposed in Prometheus text format at /api/metrics/.
+
+Each process keeps its own histograms; with several worker processes scrape
+each one (or run a single process) to see all traffic.
+"""
+
+import bisect
+import threading
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100, 250)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class Histogram:
+    """Prometheus-style histogram with fixed upper bounds, one series per label set."""
+
+    def __init__(self, name, help_text, buckets, label_names):
+        self.name = name
+        self.help_text = help_text
+        self.buckets = tuple(buckets)
+        self.label_names = tuple(label_names)
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, labels, value):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                # Per-bucket counts (not cumulative), plus +Inf, sum.
+                series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][index] += 1
+            series[1] += value
+
+    def clear(self):
+        with self._lock:
+            self._series.clear()
+
+    def _label_text(self, labels, extra=()):
+        pairs = [*zip(self.label_names, labels), *extra]
+        return ",".join(f'{name}="{_escape(value)}"' for name, value in pairs)
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            series = sorted((labels, list(counts), total) for labels, (counts, total) in self._series.items())
+        for labels, counts, total in series:
+            cumulative = 0
+            for bound, count in zip((*self.buckets, "+Inf"), counts):
+                cumulative += count
+                lines.append(f"{self.name}_bucket{{{self._label_text(labels, [('le', bound)])}}} {cumulative}")
+            lines.append(f"{self.name}_sum{{{self._label_text(labels)}}} {total}")
+            lines.append(f"{self.name}_count{{{self._label_text(labels)}}} {cumulative}")
+        return lines
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+REQUEST_LABELS = ("view", "method")
+
+# Label values must stay bounded: anything else becomes OTHER_METHOD.
+KNOWN_METHODS = frozenset({"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"})
+OTHER_METHOD = "OTHER"
+
+request_duration = Histogram(
+    "http_request_duration_seconds", "Time to build the response, by view.", LATENCY_BUCKETS, REQUEST_LABELS
+)
+request_queries = Histogram(
+    "http_request_db_queries", "Database queries per request, by view.", QUERY_COUNT_BUCKETS, REQUEST_LABELS
+)
+request_db_duration = Histogram(
+    "http_request_db_duration_seconds", "Time spent in database queries per request, by view.",
+    LATENCY_BUCKETS, REQUEST_LABELS,
+)
+
+REQUEST_HISTOGRAMS = (request_duration, request_queries, request_db_duration)
+
+
+def method_label(method):
+    return method if method in KNOWN_METHODS else OTHER_METHOD
+
+
+def observe_request(view, method, duration, queries, db_duration):
+    labels = (view, method_label(method))
+    request_duration.observe(labels, duration)
+    request_queries.observe(labels, queries)
+    request_db_duration.observe(labels, db_duration)
+
+
+def render_metrics():
+    lines = []
+    for histogram in REQUEST_HISTOGRAMS:
+        lines.extend(histogram.render())
+    return "\n".join(lines) + "\n"
+
+
+def clear_metrics():
+    for histogram in REQUEST_HISTOGRAMS:
+        histogram.clear()
@@ -0,0 +1,91 @@
+import logging
+import random
+import time
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.db import connections
+
+from api_app.metrics import observe_request
+
+logger = logging.getLogger("api_app.metrics")
+
+
+class QueryRecorder:
+    """execute_wrapper that counts and times the queries of one request."""
+
+    def __init__(self, keep_statements):
+        self.count = 0
+        self.duration = 0.0
+        self.statements = [] if keep_statements else None
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = time.perf_counter() - start
+            self.count += 1
+            self.duration += elapsed
+            if self.statements is not None:
+                self.statements.append((elapsed, context["connection"].alias, sql))
+
+
+UNRESOLVED_VIEW = "<unresolved>"
+
+
+def _view_label(request):
+    """The route name, or UNRESOLVED_VIEW for 404s and unnamed routes."""
+    match = getattr(request, "resolver_match", None)
+    if match is None or not match.url_name:
+        return UNRESOLVED_VIEW
+    return match.url_name
+
+
+class MetricsMiddleware:
+    """
+    Record latency, query count and DB time per resolved URL name into the
+    histograms of api_app.metrics. Unnamed or unresolved routes share one
+    view label and unknown verbs one method label, so clients cannot grow
+    the series without bound.
+
+    METRICS_SQL_SAMPLE_RATE of requests also log their METRICS_SQL_TOP
+    slowest statements to the "api_app.metrics" logger. For streaming
+    responses only the time to the first byte is measured.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not getattr(settings, "METRICS_ENABLED", True):
+            return self.get_response(request)
+
+        sampled = random.random() < getattr(settings, "METRICS_SQL_SAMPLE_RATE", 0.0)
+        recorder = QueryRecorder(keep_statements=sampled)
+        start = time.perf_counter()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(recorder))
+            response = self.get_response(request)
+        duration = time.perf_counter() - start
+
+        view = _view_label(request)
+        observe_request(view, request.method, duration, recorder.count, recorder.duration)
+        if sampled and recorder.statements:
+            self.log_slowest(request, view, duration, recorder)
+        return response
+
+    def log_slowest(self, request, view, duration, recorder):
+        top = sorted(recorder.statements, key=lambda statement: statement[0], reverse=True)
+        top = top[: getattr(settings, "METRICS_SQL_TOP", 5)]
+        logger.info(
+            "%s %s (%s): %.1f ms, %d queries, %.1f ms in SQL; slowest:\n%s",
+            request.method,
+            request.path,
+            view,
+            duration * 1000,
+            recorder.count,
+            recorder.duration * 1000,
+            "\n".join(f"  {elapsed * 1000:8.2f} ms [{alias}] {sql}" for elapsed, alias, sql in top),
+        )
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.7 on 2026-10-18 04:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api_app', '0003_task_list_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='subtask',
+            name='position',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name='subtask',
+            index=models.Index(fields=['task', 'position'], name='subtasks_task_position_idx'),
+        ),
+    ]
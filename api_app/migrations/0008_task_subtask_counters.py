@@ -0,0 +1,43 @@
+# Generated by Django 5.2.7 on 2026-10-18 05:02
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_counters(apps, schema_editor):
+    Task = apps.get_model("api_app", "Task")
+    Subtask = apps.get_model("api_app", "Subtask")
+
+    def count(condition=Q()):
+        counts = (
+            Subtask.objects.filter(condition, task_id=OuterRef("pk"))
+            .order_by()
+            .values("task_id")
+            .annotate(n=Count("id"))
+            .values("n")
+        )
+        return Coalesce(Subquery(counts, output_field=IntegerField()), 0)
+
+    Task.objects.update(subtask_total=count(), subtask_done=count(Q(status="Done")))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api_app', '0007_deadline_reminders'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='subtask_done',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='subtask_total',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
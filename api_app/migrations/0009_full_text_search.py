@@ -0,0 +1,109 @@
+"""
+Full-text search over task and subtask titles/descriptions.
+
+- PostgreSQL: a generated `search_vector tsvector` column (title weighted A,
+  description B) with a GIN index on both tables. The database keeps it
+  current on every INSERT/UPDATE, including bulk_create and COPY.
+- SQLite (local development): external-content FTS5 tables kept current by
+  triggers. Django rebuilds SQLite tables for some ALTERs, which drops their
+  triggers; a post_migrate handler (search_service.restore_sqlite_search)
+  calls create_sqlite_search() again whenever one is missing.
+
+The columns are not on the models; api_app.services.search_service queries
+them with raw SQL.
+"""
+
+from django.db import migrations
+
+# Must match SEARCH_CONFIG in api_app.services.search_service.
+SEARCH_CONFIG = "english"
+SEARCH_TABLES = ("tasks", "subtasks")
+
+
+def _postgresql_forward(schema_editor):
+    for table in SEARCH_TABLES:
+        schema_editor.execute(
+            f"""
+            ALTER TABLE {table} ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+                setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(title, '')), 'A') ||
+                setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(description, '')), 'B')
+            ) STORED
+            """
+        )
+        schema_editor.execute(f"CREATE INDEX {table}_search_idx ON {table} USING GIN (search_vector)")
+
+
+def _postgresql_backward(schema_editor):
+    for table in SEARCH_TABLES:
+        schema_editor.execute(f"DROP INDEX IF EXISTS {table}_search_idx")
+        schema_editor.execute(f"ALTER TABLE {table} DROP COLUMN IF EXISTS search_vector")
+
+
+def create_sqlite_search(schema_editor):
+    # Only execute() is used, so a cursor works too (restore_sqlite_search).
+    for table in SEARCH_TABLES:
+        fts = f"{table}_fts"
+        schema_editor.execute(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5("
+            f"title, description, content='{table}', content_rowid='id', tokenize='porter unicode61')"
+        )
+        schema_editor.execute(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN
+                INSERT INTO {fts}(rowid, title, description) VALUES (new.id, new.title, new.description);
+            END
+            """
+        )
+        schema_editor.execute(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN
+                INSERT INTO {fts}({fts}, rowid, title, description)
+                VALUES ('delete', old.id, old.title, old.description);
+            END
+            """
+        )
+        schema_editor.execute(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF title, description ON {table} BEGIN
+                INSERT INTO {fts}({fts}, rowid, title, description)
+                VALUES ('delete', old.id, old.title, old.description);
+                INSERT INTO {fts}(rowid, title, description) VALUES (new.id, new.title, new.description);
+            END
+            """
+        )
+        schema_editor.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+
+
+def _sqlite_backward(schema_editor):
+    for table in SEARCH_TABLES:
+        fts = f"{table}_fts"
+        for suffix in ("ai", "ad", "au"):
+            schema_editor.execute(f"DROP TRIGGER IF EXISTS {fts}_{suffix}")
+        schema_editor.execute(f"DROP TABLE IF EXISTS {fts}")
+
+
+def forward(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        _postgresql_forward(schema_editor)
+    elif vendor == "sqlite":
+        create_sqlite_search(schema_editor)
+
+
+def backward(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        _postgresql_backward(schema_editor)
+    elif vendor == "sqlite":
+        _sqlite_backward(schema_editor)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api_app', '0008_task_subtask_counters'),
+    ]
+
+    operations = [
+        migrations.RunPython(forward, backward),
+    ]
@@ -0,0 +1,50 @@
+"""
+Prefix indexes for the /api/users/?q= autocomplete.
+
+Django compiles `istartswith` on PostgreSQL to
+UPPER("auth_user"."username"::text) LIKE UPPER('q%'), which neither the
+unique index nor its varchar_pattern_ops twin can serve. These expression
+indexes with text_pattern_ops can, without needing the pg_trgm extension.
+Other databases keep their existing indexes.
+"""
+
+from django.conf import settings
+from django.db import migrations
+
+PREFIX_INDEXES = {
+    "users_username_prefix_idx": "username",
+    "users_email_prefix_idx": "email",
+}
+
+
+def _user_table(apps):
+    return apps.get_model(settings.AUTH_USER_MODEL)._meta.db_table
+
+
+def forward(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    table = schema_editor.quote_name(_user_table(apps))
+    for name, column in PREFIX_INDEXES.items():
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {name} ON {table} (UPPER({column}::text) text_pattern_ops)"
+        )
+
+
+def backward(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name in PREFIX_INDEXES:
+        schema_editor.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api_app', '0009_full_text_search'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(forward, backward),
+    ]
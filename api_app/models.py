@@ -1,7 +1,10 @@
-from django.db import models
+from django.contrib.auth import get_user_model
+from django.db import models, router
 from django.conf import settings
 from django.utils import timezone
 
+from .caching import MISS, cache_user_fields, get_cached_user_fields
+
 
 class TaskPriority(models.TextChoices):
     HIGH = "High", "High"
@@ -74,13 +77,36 @@ class Task(models.Model):
         related_name="created_tasks",
         db_column="id_assigned_by",
     )
+    # Deadline the last reminder went out for; a moved deadline is reminded again.
+    reminder_sent_for = models.DateField(blank=True, null=True)
+    # Denormalized subtask progress, kept in step by services.subtask_service.
+    subtask_total = models.PositiveIntegerField(default=0)
+    subtask_done = models.PositiveIntegerField(default=0)
 
     class Meta:
         db_table = "tasks"
+        indexes = [
+            # Keyset pagination of the task list walks (created_at, id) descending.
+            models.Index(fields=["-created_at", "-id"], name="tasks_created_id_idx"),
+            models.Index(fields=["status", "deadline"], name="tasks_status_deadline_idx"),
+            models.Index(fields=["priority", "deadline"], name="tasks_priority_deadline_idx"),
+            models.Index(fields=["updated_at"], name="tasks_updated_at_idx"),
+            # Deadline reminders only ever scan open tasks.
+            models.Index(
+                fields=["deadline", "id"],
+                condition=~models.Q(status=TaskStatus.DONE),
+                name="tasks_open_deadline_idx",
+            ),
+        ]
+
+    # Fields the per-user dashboard aggregates over.
+    DASHBOARD_FIELDS = frozenset({"status", "priority", "deadline"})
 
     def save(self, *args, **kwargs):
         # Mimics legacy trigger update_updated_at_column
         self.updated_at = timezone.now()
+        if kwargs.get("update_fields") is not None:
+            kwargs["update_fields"] = {*kwargs["update_fields"], "updated_at"}
         super().save(*args, **kwargs)
 
     def __str__(self) -> str:
@@ -109,12 +135,23 @@ class UserTask(models.Model):
         choices=UserTaskRole.choices,
         default=UserTaskRole.ASSIGNED,
     )
+    # Lets delta sync pick up tasks a user was just added to or had their role changed on.
+    updated_at = models.DateTimeField(default=timezone.now)
 
     class Meta:
         db_table = "user_tasks"
         constraints = [
             models.UniqueConstraint(fields=["task", "user"], name="task_user_unique")
         ]
+        indexes = [
+            # "Tasks where I have role X": resolves task ids from the index alone.
+            models.Index(fields=["user", "role", "task"], name="user_tasks_user_role_task_idx"),
+            models.Index(fields=["user", "updated_at"], name="user_tasks_user_updated_idx"),
+        ]
+
+    def save(self, *args, **kwargs):
+        self.updated_at = timezone.now()
+        super().save(*args, **kwargs)
 
     def __str__(self) -> str:
         return f"{self.user_id} -> {self.task_id} ({self.role})"
@@ -137,16 +174,130 @@ class Subtask(models.Model):
         choices=TaskStatus.choices,
         default=TaskStatus.TODO,
     )
+    # Manual order within the task; 0 until the subtasks are reordered, so new
+    # subtasks show up first as they always have.
+    position = models.PositiveIntegerField(default=0)
     created_at = models.DateTimeField(default=timezone.now)
     updated_at = models.DateTimeField(default=timezone.now)
 
     class Meta:
         db_table = "subtasks"
+        indexes = [
+            models.Index(fields=["task", "position"], name="subtasks_task_position_idx"),
+            models.Index(fields=["task", "updated_at"], name="subtasks_task_updated_idx"),
+        ]
 
     def save(self, *args, **kwargs):
         self.updated_at = timezone.now()
+        if kwargs.get("update_fields") is not None:
+            kwargs["update_fields"] = {*kwargs["update_fields"], "updated_at"}
         super().save(*args, **kwargs)
 
     def __str__(self) -> str:
         return self.title
 
+
+class TombstoneKind(models.TextChoices):
+    SUBTASK = "subtask", "Subtask"
+    MEMBERSHIP = "membership", "Membership"
+
+
+class Tombstone(models.Model):
+    """
+    Record of a deleted subtask or membership, so delta sync (`?updated_since=`)
+    can tell clients what to drop. A deleted task shows up as membership
+    tombstones for each of its former members.
+    """
+    kind = models.CharField(max_length=20, choices=TombstoneKind.choices)
+    object_id = models.BigIntegerField()
+    task_id = models.BigIntegerField()
+    user_id = models.BigIntegerField(blank=True, null=True)
+    deleted_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        db_table = "sync_tombstones"
+        indexes = [
+            models.Index(fields=["kind", "task_id", "deleted_at"], name="tombstones_task_idx"),
+            models.Index(fields=["kind", "user_id", "deleted_at"], name="tombstones_user_idx"),
+            models.Index(fields=["deleted_at"], name="tombstones_deleted_at_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.kind} {self.object_id} deleted at {self.deleted_at}"
+
+
+class OutboxMessage(models.Model):
+    """
+    A Celery task call written in the same transaction as the rows it is about.
+
+    The relay (`relay_outbox`) publishes pending messages to the broker and
+    deletes them, so a rolled-back transaction never notifies and a broker
+    outage delays notifications instead of losing them.
+    """
+    task_name = models.CharField(max_length=200)
+    args = models.JSONField(default=list)
+    kwargs = models.JSONField(default=dict)
+    created_at = models.DateTimeField(default=timezone.now)
+    available_at = models.DateTimeField(default=timezone.now)
+    attempts = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(blank=True, default="")
+
+    class Meta:
+        db_table = "outbox_messages"
+        indexes = [
+            models.Index(fields=["available_at", "id"], name="outbox_available_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.task_name} #{self.id}"
+
+
+class TokenUser(get_user_model()):
+    """
+    The authenticated user rebuilt from JWT claims, without a query.
+
+    Only the claim fields are loaded; every other field is deferred. The
+    first access to one loads all of them at once from a short-lived
+    per-process cache, or with a single query. The password hash is never
+    cached and is always read from the database.
+    """
+
+    # Claims written by api_app.utils.sign_token, besides the user id.
+    CLAIM_FIELDS = ("username", "is_active", "is_staff")
+
+    class Meta:
+        proxy = True
+
+    @classmethod
+    def from_claims(cls, user_id, claims):
+        # Some setups issue the id claim as a string; compare by the real pk type.
+        values = {cls._meta.pk.attname: cls._meta.pk.to_python(user_id), **{name: claims[name] for name in cls.CLAIM_FIELDS}}
+        field_names = [f.attname for f in cls._meta.concrete_fields if f.attname in values]
+        return cls.from_db(
+            router.db_for_read(cls), field_names, [values[name] for name in field_names]
+        )
+
+    def _load_deferred_fields(self):
+        deferred = self.get_deferred_fields() - {"password"}
+        values = get_cached_user_fields(self.pk)
+        if values is MISS:
+            names = [
+                f.attname for f in self._meta.concrete_fields
+                if f.attname not in self.CLAIM_FIELDS and f.attname != "password"
+            ]
+            values = type(self)._base_manager.filter(pk=self.pk).values(*names).first()
+            if values is None:
+                return
+            cache_user_fields(self.pk, values)
+        for name in deferred:
+            if name in values:
+                setattr(self, name, values[name])
+
+    def refresh_from_db(self, using=None, fields=None, from_queryset=None):
+        # Deferred attribute access lands here with fields=[name].
+        if fields is not None and from_queryset is None and "password" not in fields:
+            self._load_deferred_fields()
+            fields = [name for name in fields if name in self.get_deferred_fields()]
+            if not fields:
+                return
+        super().refresh_from_db(using=using, fields=fields, from_queryset=from_queryset)
@@ -0,0 +1,211 @@
+import base64
+import datetime
+import json
+from collections import OrderedDict
+from functools import partial
+
+from django.conf import settings
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+def _encode_value(value):
+    # isoformat() keeps microseconds, which keyset comparisons depend on.
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    return value
+
+
+class KeysetPagination(BasePagination):
+    """
+    Forward-only keyset (cursor) pagination.
+
+    The cursor is an opaque token holding the ordering key values of the last
+    row on the previous page, so every page is a single indexed range scan
+    instead of OFFSET over the whole result set. The ordering must end with a
+    unique column (usually `id`) to keep pages stable.
+
+    Pagination is opt-in: without `cursor` or `page_size` in the query string
+    the view returns a plain list, as it always has.
+    """
+
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    ordering = ("-created_at", "-id")
+    invalid_cursor_message = "Invalid cursor"
+
+    def get_page_size(self, request):
+        default = getattr(settings, "API_PAGE_SIZE", 50)
+        maximum = getattr(settings, "API_MAX_PAGE_SIZE", 200)
+        raw = request.query_params.get(self.page_size_query_param)
+        if raw is None:
+            return default
+        try:
+            size = int(raw)
+        except (TypeError, ValueError):
+            return default
+        if size <= 0:
+            return default
+        return min(size, maximum)
+
+    def get_ordering(self, view):
+        get_keyset_ordering = getattr(view, "get_keyset_ordering", None)
+        if get_keyset_ordering is not None:
+            return tuple(get_keyset_ordering())
+        return self.ordering
+
+    def encode_cursor(self, values):
+        payload = {"o": ",".join(self.ordering_fields), "v": [_encode_value(v) for v in values]}
+        raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+    def decode_cursor(self, token):
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+            values = payload["v"]
+            ordering = payload["o"]
+        except (TypeError, ValueError, KeyError, UnicodeError):
+            raise NotFound(self.invalid_cursor_message)
+
+        if not isinstance(values, list):
+            raise NotFound(self.invalid_cursor_message)
+
+        if ordering != ",".join(self.ordering_fields) or len(values) != len(self.ordering_fields):
+            raise NotFound(self.invalid_cursor_message)
+        return values
+
+    def build_keyset_filter(self, values):
+        """
+        Lexicographic "strictly after" predicate, e.g. for (-created_at, -id):
+        created_at < c OR (created_at = c AND id < i)
+        """
+        condition = Q()
+        equal_prefix = {}
+        for field, value in zip(self.ordering_fields, values):
+            name = field.lstrip("-")
+            lookup = "lt" if field.startswith("-") else "gt"
+            condition |= Q(**equal_prefix, **{f"{name}__{lookup}": value})
+            equal_prefix[name] = value
+        return condition
+
+    def is_requested(self, request):
+        params = request.query_params
+        return self.cursor_query_param in params or self.page_size_query_param in params
+
+    def paginate_queryset(self, queryset, request, view=None):
+        params = request.query_params
+        if not self.is_requested(request):
+            return None
+
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        self.ordering_fields = self.get_ordering(view)
+
+        queryset = queryset.order_by(*self.ordering_fields)
+        token = params.get(self.cursor_query_param)
+        if token:
+            values = self.decode_cursor(token)
+            try:
+                queryset = queryset.filter(self.build_keyset_filter(values))
+            except (DjangoValidationError, TypeError, ValueError):
+                # A tampered cursor with values the ordering columns cannot hold.
+                raise NotFound(self.invalid_cursor_message)
+
+        rows = list(queryset[: self.page_size + 1])
+        self.has_next = len(rows) > self.page_size
+        self.page = rows[: self.page_size]
+        return self.page
+
+    def get_next_cursor(self):
+        if not self.has_next:
+            return None
+        last = self.page[-1]
+        # Rows are model instances or, for `.values()` querysets, dicts.
+        get = last.__getitem__ if isinstance(last, dict) else partial(getattr, last)
+        return self.encode_cursor([get(field.lstrip("-")) for field in self.ordering_fields])
+
+    def get_next_link(self):
+        next_cursor = self.get_next_cursor()
+        if next_cursor is None:
+            return None
+        return replace_query_param(self.base_url, self.cursor_query_param, next_cursor)
+
+    def get_paginated_response(self, data):
+        return Response(OrderedDict([
+            ("next", self.get_next_link()),
+            ("results", data),
+        ]))
+
+    def get_page_schema(self, schema):
+        """OpenAPI schema of one page: `next` link plus `results`."""
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_paginated_response_schema(self, schema):
+        # Opt-in, so the response is either the plain list or a page.
+        # drf-spectacular also calls this with a placeholder to shape list
+        # examples; returning it unchanged keeps them in the plain-list form.
+        if not isinstance(schema, dict):
+            return schema
+        return {"oneOf": [schema, self.get_page_schema(schema)]}
+
+
+class UserSearchPagination(KeysetPagination):
+    """
+    Keyset pages of the user directory. Autocomplete (`?q=`) is always
+    paginated, with pages capped at USER_SEARCH_MAX_RESULTS.
+    """
+
+    ordering = ("username", "id")
+
+    def is_requested(self, request):
+        return "q" in request.query_params or super().is_requested(request)
+
+    def get_page_size(self, request):
+        size = super().get_page_size(request)
+        if "q" in request.query_params:
+            size = min(size, getattr(settings, "USER_SEARCH_MAX_RESULTS", 20))
+        return size
+
+
+class RankedHitPagination(KeysetPagination):
+    """
+    Keyset pagination over rows produced by a search function rather than a
+    queryset. Always on: `search(limit, after)` must return dicts ordered by
+    `ordering` and `after` holds the key values of the previous page's last row,
+    each converted by the matching callable in `types`.
+    """
+
+    def paginate_hits(self, search, ordering, types, request):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        self.ordering_fields = tuple(ordering)
+
+        token = request.query_params.get(self.cursor_query_param)
+        after = None
+        if token:
+            try:
+                after = [cast(value) for cast, value in zip(types, self.decode_cursor(token))]
+            except (TypeError, ValueError):
+                raise NotFound(self.invalid_cursor_message)
+
+        rows = search(limit=self.page_size + 1, after=after)
+        self.has_next = len(rows) > self.page_size
+        self.page = rows[: self.page_size]
+        return self.page
+
+    def get_paginated_response_schema(self, schema):
+        return self.get_page_schema(schema)
@@ -1,5 +1,8 @@
+from django.conf import settings
+from django.utils.crypto import constant_time_compare
 from rest_framework.permissions import BasePermission, SAFE_METHODS
-from .models import UserTask, UserTaskRole
+from .models import UserTaskRole
+from .services.membership_service import get_membership_resolver
 
 
 class TaskRolePermission(BasePermission):
@@ -11,18 +14,18 @@ class TaskRolePermission(BasePermission):
     """
 
     def has_object_permission(self, request, view, obj):
-        membership = UserTask.objects.filter(task=obj, user=request.user).first()
-        if membership is None:
+        role = get_membership_resolver(request).role_for_task(obj)
+        if role is None:
             return False
 
         if request.method in SAFE_METHODS:
             return True
 
         if request.method in ("PUT", "PATCH"):
-            return membership.role in (UserTaskRole.OWNER, UserTaskRole.ASSIGNED)
+            return role in (UserTaskRole.OWNER, UserTaskRole.ASSIGNED)
 
         if request.method == "DELETE":
-            return membership.role == UserTaskRole.OWNER
+            return role == UserTaskRole.OWNER
 
         return False
 
@@ -33,21 +36,30 @@ class TaskMembershipPermission(BasePermission):
         if not task_id:
             return False
 
-        membership = UserTask.objects.filter(task_id=task_id, user=request.user).first()
-        if membership is None:
+        role = get_membership_resolver(request).get_role(task_id)
+        if role is None:
             return False
 
         if request.method in SAFE_METHODS:
             return True
 
-        return membership.role == UserTaskRole.OWNER
+        return role == UserTaskRole.OWNER
 
     def has_object_permission(self, request, view, obj):
         if request.method in SAFE_METHODS:
             return True
 
-        return UserTask.objects.filter(
-            task=obj.task,
-            user=request.user,
-            role=UserTaskRole.OWNER,
-        ).exists()
+        return get_membership_resolver(request).get_role(obj.task_id) == UserTaskRole.OWNER
+
+
+class HasMetricsToken(BasePermission):
+    """
+    `Authorization: Bearer <METRICS_TOKEN>`. With METRICS_TOKEN unset the
+    endpoint is closed: route names and traffic are not public.
+    """
+
+    def has_permission(self, request, view):
+        token = getattr(settings, "METRICS_TOKEN", "")
+        if not token:
+            return False
+        return constant_time_compare(request.META.get("HTTP_AUTHORIZATION", ""), f"Bearer {token}")
@@ -0,0 +1,47 @@
+"""
+JSON renderer backed by orjson when it is installed (`pip install orjson`).
+
+Output parses to the same document as DRF's JSONRenderer for the default
+COMPACT_JSON/UNICODE_JSON settings: values orjson has no native encoding for
+(and date/time values, so their format stays DRF's) go through DRF's
+JSONEncoder.default. Anything orjson cannot encode, `?indent=` requests and
+non-default JSON settings fall back to the stdlib renderer.
+
+It is not byte-for-byte the same: orjson spells some floats differently
+(1e-6 for 1e-06, 1e16 for 1e+16), and where the stdlib with STRICT_JSON
+raises on NaN and infinity, orjson writes null.
+"""
+
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+    # Kept out of JSON so it is a strict JavaScript subset, like JSONRenderer.
+    _LINE_SEPARATORS = ((b"\xe2\x80\xa8", b"\\u2028"), (b"\xe2\x80\xa9", b"\\u2029"))
+
+
+class FastJSONRenderer(JSONRenderer):
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if (
+            orjson is None
+            or not self.compact
+            or self.ensure_ascii
+            or self.get_indent(accepted_media_type, renderer_context or {}) is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+        if data is None:
+            return b""
+        try:
+            ret = orjson.dumps(data, default=self.encoder_class().default, option=ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits, which the stdlib handles.
+            return super().render(data, accepted_media_type, renderer_context)
+        for raw, escaped in _LINE_SEPARATORS:
+            if raw in ret:
+                ret = ret.replace(raw, escaped)
+        return ret
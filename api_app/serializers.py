@@ -1,5 +1,16 @@
-from rest_framework import serializers
+from operator import itemgetter
+
+from django.conf import settings
+from django.utils import timezone
+from rest_framework import ISO_8601, serializers
+from rest_framework.settings import api_settings
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+from .authentication import FilteredRefreshToken
 from .models import Task, Subtask, UserTask
+from .services.membership_service import get_membership_resolver
+from .utils import stamp_user_claims
 from django.contrib.auth import get_user_model
 
 User = get_user_model()
@@ -11,27 +22,174 @@ class TaskSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Task
-        fields = "__all__"
-        read_only_fields = ("created_at", "updated_at")
-
-    def get_current_user_role(self, obj):
-        prefetched = getattr(obj, "current_user_memberships", None)
-        if prefetched:
-            return prefetched[0].role
+        exclude = ("reminder_sent_for",)
+        read_only_fields = ("created_at", "updated_at", "subtask_total", "subtask_done")
 
+    def get_current_user_role(self, obj) -> str | None:
         request = self.context.get("request")
         if not request or not request.user.is_authenticated:
             return None
 
-        membership = UserTask.objects.filter(task=obj, user=request.user).only("role").first()
-        return membership.role if membership else None
+        return get_membership_resolver(request).role_for_task(obj)
+
+    def update(self, instance, validated_data):
+        changed = [attr for attr, value in validated_data.items() if getattr(instance, attr) != value]
+        for attr in changed:
+            setattr(instance, attr, validated_data[attr])
+        # A full save would write back the subtask counters read with the row,
+        # undoing concurrent F() updates from adjust_subtask_counters.
+        instance.save(update_fields=changed)
+        return instance
+
+
+# Formatter placeholder in LeanListSerializer.columns for DateTimeField output.
+DATETIME = "datetime"
+
+
+def _datetime_formatter(tz):
+    """
+    DateTimeField.to_representation for ISO 8601 output, with the time zone
+    looked up once per list rather than once per value.
+    """
+    if api_settings.DATETIME_FORMAT != ISO_8601 or not settings.USE_TZ:
+        return serializers.DateTimeField().to_representation
+
+    def format_datetime(value):
+        if value is None:
+            return None
+        text = value.astimezone(tz).isoformat()
+        return text[:-6] + "Z" if text.endswith("+00:00") else text
+
+    return format_datetime
+
+
+class LeanListSerializer(serializers.BaseSerializer):
+    """
+    Read-only serializer for GET lists over `.values()` rows instead of model
+    instances. Each entry of `columns` is (output key, values() column or
+    tuple of columns, formatter); the formatter is a callable, DATETIME or
+    None. The accessors are built once per class. Output must match the full
+    serializer it stands in for.
+    """
+
+    columns = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.accessors = tuple(
+            (name, itemgetter(*source) if isinstance(source, tuple) else itemgetter(source), formatter)
+            for name, source, formatter in cls.columns
+        )
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        format_datetime = _datetime_formatter(timezone.get_current_timezone())
+        self.accessors = tuple(
+            (name, get, format_datetime if formatter == DATETIME else formatter)
+            for name, get, formatter in self.accessors
+        )
+
+    @classmethod
+    def value_names(cls):
+        names = []
+        for _, source, _ in cls.columns:
+            names.extend(source if isinstance(source, tuple) else (source,))
+        return names
+
+    def to_representation(self, row):
+        return {
+            name: formatter(get(row)) if formatter else get(row)
+            for name, get, formatter in self.accessors
+        }
+
+
+_date = serializers.DateField().to_representation
+
+
+class TaskListSerializer(LeanListSerializer):
+    """TaskSerializer for list rows; the caller's role comes from `membership_role`."""
+
+    columns = (
+        ("id", "id", None),
+        ("assigned_by", "assigned_by__username", None),
+        ("current_user_role", "membership_role", None),
+        ("title", "title", None),
+        ("description", "description", None),
+        ("created_at", "created_at", DATETIME),
+        ("updated_at", "updated_at", DATETIME),
+        ("deadline", "deadline", _date),
+        ("priority", "priority", None),
+        ("status", "status", None),
+        ("subtask_total", "subtask_total", None),
+        ("subtask_done", "subtask_done", None),
+    )
+
+
+class TaskBulkDeleteSerializer(serializers.Serializer):
+    ids = serializers.ListField(child=serializers.IntegerField(), allow_empty=False)
+
+    def validate_ids(self, value):
+        if len(set(value)) != len(value):
+            raise serializers.ValidationError("Each task may appear only once.")
+        return value
 
 
 class SubtaskSerializer(serializers.ModelSerializer):
     class Meta:
         model = Subtask
         fields = "__all__"
-        read_only_fields = ("created_at", "updated_at", "task")
+        read_only_fields = ("created_at", "updated_at", "task", "position")
+
+    def update(self, instance, validated_data):
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        # Only the submitted columns: a full save would write back a status
+        # read before a concurrent change, bypassing the subtask counters.
+        instance.save(update_fields=list(validated_data))
+        return instance
+
+
+class SubtaskListSerializer(LeanListSerializer):
+    columns = (
+        ("id", "id", None),
+        ("title", "title", None),
+        ("description", "description", None),
+        ("status", "status", None),
+        ("position", "position", None),
+        ("created_at", "created_at", DATETIME),
+        ("updated_at", "updated_at", DATETIME),
+        ("task", "task_id", None),
+    )
+
+
+class SubtaskBatchRequestSerializer(serializers.Serializer):
+    create = SubtaskSerializer(many=True, required=False)
+    update = serializers.ListField(child=serializers.DictField(), required=False)
+    order = serializers.ListField(child=serializers.IntegerField(), required=False)
+    delete = serializers.ListField(child=serializers.IntegerField(), required=False)
+
+
+class SubtaskBatchResultSerializer(serializers.Serializer):
+    created = SubtaskSerializer(many=True)
+    updated = SubtaskSerializer(many=True)
+    deleted = serializers.ListField(child=serializers.IntegerField())
+
+
+class DashboardSerializer(serializers.Serializer):
+    total = serializers.IntegerField()
+    by_status = serializers.DictField(child=serializers.IntegerField())
+    by_priority = serializers.DictField(child=serializers.IntegerField())
+    by_role = serializers.DictField(child=serializers.IntegerField())
+    overdue = serializers.IntegerField()
+    due_this_week = serializers.IntegerField()
+
+
+class SearchHitSerializer(serializers.Serializer):
+    type = serializers.ChoiceField(choices=["task", "subtask"])
+    id = serializers.IntegerField()
+    task_id = serializers.IntegerField()
+    title = serializers.CharField()
+    rank = serializers.FloatField()
 
 
 class UserSerializer(serializers.ModelSerializer):
@@ -63,6 +221,35 @@ class TokenPairSerializer(serializers.Serializer):
     refresh = serializers.CharField()
 
 
+class FilteredTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    Refresh through the revocation filter. The user claims are re-stamped
+    from the current user row, so a new access token never carries a stale
+    username or is_staff.
+    """
+
+    token_class = FilteredRefreshToken
+
+    def validate(self, attrs):
+        refresh = self.token_class(attrs["refresh"])
+        user_id = refresh.payload.get(jwt_settings.USER_ID_CLAIM)
+        user = User._default_manager.filter(**{jwt_settings.USER_ID_FIELD: user_id}).first()
+        if user is None or not jwt_settings.USER_AUTHENTICATION_RULE(user):
+            raise AuthenticationFailed(self.error_messages["no_active_account"], "no_active_account")
+        stamp_user_claims(refresh, user)
+
+        data = {"access": str(refresh.access_token)}
+        if jwt_settings.ROTATE_REFRESH_TOKENS:
+            if jwt_settings.BLACKLIST_AFTER_ROTATION:
+                refresh.blacklist()
+            refresh.set_jti()
+            refresh.set_exp()
+            refresh.set_iat()
+            refresh.outstand()
+            data["refresh"] = str(refresh)
+        return data
+
+
 class RegisterResponseSerializer(serializers.Serializer):
     id = serializers.IntegerField()
     username = serializers.CharField()
@@ -102,3 +289,16 @@ class UserTaskSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("Changing user is not allowed.")
         return attrs
         
+
+
+class UserTaskListSerializer(LeanListSerializer):
+    columns = (
+        ("id", "id", None),
+        ("task", "task_id", None),
+        (
+            "user",
+            ("user_id", "user__username", "user__email"),
+            lambda user: {"id": user[0], "username": user[1], "email": user[2]},
+        ),
+        ("role", "role", None),
+    )
@@ -0,0 +1,213 @@
+import io
+import json
+import math
+import time
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import connections, transaction
+from django.db.models import Count
+from django.urls import reverse
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from api_app.middleware import QueryRecorder
+from api_app.parsers import FastJSONParser
+from api_app.renderers import FastJSONRenderer, orjson
+from api_app.models import Subtask, UserTask, UserTaskRole
+from api_app.utils import sign_token
+
+
+class Scenario:
+    """One benchmarked request: `method` on the URL named `url_name`."""
+
+    def __init__(self, url_name, method="GET", kwargs=None, query=None, data=None):
+        self.url_name = url_name
+        self.method = method
+        self.path = reverse(url_name, kwargs=kwargs)
+        self.query = query or {}
+        self.data = data
+
+    @property
+    def name(self):
+        return f"{self.method} {self.url_name}"
+
+    @property
+    def writes(self):
+        return self.method not in ("GET", "HEAD")
+
+
+def pick_benchmark_user(prefix=None):
+    """The user with the most task memberships (optionally among <prefix>_user_*)."""
+    memberships = UserTask.objects.all()
+    if prefix:
+        memberships = memberships.filter(user__username__startswith=f"{prefix}_user_")
+    row = memberships.values("user").annotate(tasks=Count("id")).order_by("-tasks", "user").first()
+    if row is None:
+        return None
+    return get_user_model().objects.get(pk=row["user"])
+
+
+def default_scenarios(user):
+    """A read and (where the route has one) a write request per route, on the user's own data."""
+    membership = UserTask.objects.filter(user=user, role=UserTaskRole.OWNER).order_by("task_id").first()
+    if membership is None:
+        raise ValueError(f"{user.username} owns no tasks to benchmark against.")
+    task_id = membership.task_id
+    subtask = Subtask.objects.filter(task_id=task_id).order_by("id").first()
+    search_word = membership.task.title.split()[0]
+
+    scenarios = [
+        Scenario("tasks_list_create"),
+        Scenario("tasks_list_create", "POST", data={
+            "title": "Benchmark task", "deadline": "2030-01-01", "priority": "Medium",
+        }),
+        Scenario("task_detail", kwargs={"pk": task_id}),
+        Scenario("task_detail", "PATCH", kwargs={"pk": task_id}, data={"title": "Benchmark title"}),
+        Scenario("task_subtasks", kwargs={"task_id": task_id}),
+        Scenario("task_subtasks", "POST", kwargs={"task_id": task_id}, data={"title": "Benchmark subtask"}),
+        Scenario("task_memberships", kwargs={"task_id": task_id}),
+        Scenario("users_list", query={"q": user.username[:3]}),
+        Scenario("profile"),
+        Scenario("dashboard"),
+        Scenario("search", query={"q": search_word}),
+        Scenario("tasks_export"),
+    ]
+    if subtask is not None:
+        scenarios += [
+            Scenario("subtask_detail", kwargs={"pk": subtask.pk}),
+            Scenario("subtask_detail", "PATCH", kwargs={"pk": subtask.pk}, data={"status": "Done"}),
+        ]
+    return scenarios
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(pct / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+def _benchmark_host():
+    for host in settings.ALLOWED_HOSTS:
+        if host != "*":
+            return host.lstrip(".")
+    return "localhost"
+
+
+def _send(client, scenario):
+    method = getattr(client, scenario.method.lower())
+    if scenario.method == "GET":
+        response = method(scenario.path, scenario.query)
+    else:
+        response = method(scenario.path, scenario.data, format="json")
+    if response.streaming:
+        # Export streams lazily; its queries run while the body is consumed.
+        b"".join(response.streaming_content)
+    return response
+
+
+def _timed_request(client, scenario):
+    recorder = QueryRecorder(keep_statements=False)
+    with ExitStack() as stack:
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(recorder))
+        # Writes are rolled back so every run (and iteration) sees the same data.
+        if scenario.writes:
+            stack.enter_context(transaction.atomic())
+        start = time.perf_counter()
+        response = _send(client, scenario)
+        elapsed = time.perf_counter() - start
+        if scenario.writes:
+            transaction.set_rollback(True)
+    return elapsed, recorder.count, response.status_code
+
+
+def run_benchmark(user, scenarios, requests=50, warmup=5):
+    """
+    Send each scenario `warmup` + `requests` times through the test client
+    (the full middleware/URL/view stack, without a network hop) as `user`.
+
+    Returns {scenario name: stats} with latency percentiles in ms, mean and
+    max queries per request, serial throughput and the count of non-2xx
+    responses.
+    """
+    client = APIClient(HTTP_HOST=_benchmark_host())
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {sign_token(user)['access']}")
+
+    results = {}
+    for scenario in scenarios:
+        for _ in range(warmup):
+            _timed_request(client, scenario)
+        latencies, queries, errors = [], [], 0
+        for _ in range(requests):
+            elapsed, query_count, status_code = _timed_request(client, scenario)
+            latencies.append(elapsed)
+            queries.append(query_count)
+            errors += not 200 <= status_code < 300
+        latencies.sort()
+        total = sum(latencies)
+        results[scenario.name] = {
+            "path": scenario.path,
+            "requests": requests,
+            "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+            "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+            "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+            "queries_per_request": round(sum(queries) / max(requests, 1), 2),
+            "max_queries": max(queries, default=0),
+            "throughput_rps": round(requests / total, 1) if total else 0.0,
+            "errors": errors,
+        }
+    return results
+
+
+def compare_results(baseline, current, metrics=("p95_ms", "queries_per_request")):
+    """Rows of (scenario, metric, before, after, ratio) for scenarios in both runs."""
+    rows = []
+    for name in sorted(baseline.keys() & current.keys()):
+        for metric in metrics:
+            before, after = baseline[name][metric], current[name][metric]
+            ratio = after / before if before else None
+            rows.append((name, metric, before, after, ratio))
+    return rows
+
+
+def _best_of(func, rounds):
+    best = math.inf
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def benchmark_json(payload, rounds=20):
+    """
+    Render `payload` (and parse the result) with DRF's stdlib JSON classes and
+    with FastJSONRenderer/FastJSONParser. Times are the best of `rounds`, in ms.
+    """
+    body = JSONRenderer().render(payload)
+    # Compared as documents: orjson may spell floats differently.
+    if json.loads(FastJSONRenderer().render(payload)) != json.loads(body):
+        raise AssertionError("FastJSONRenderer output differs from JSONRenderer.")
+
+    def parse(parser):
+        return lambda: parser.parse(io.BytesIO(body), parser_context={"encoding": "utf-8"})
+
+    timings = {
+        "render_stdlib_ms": _best_of(lambda: JSONRenderer().render(payload), rounds),
+        "render_fast_ms": _best_of(lambda: FastJSONRenderer().render(payload), rounds),
+        "parse_stdlib_ms": _best_of(parse(JSONParser()), rounds),
+        "parse_fast_ms": _best_of(parse(FastJSONParser()), rounds),
+    }
+    report = {name: round(value * 1000, 3) for name, value in timings.items()}
+    report.update({
+        "orjson": orjson is not None,
+        "bytes": len(body),
+        "render_speedup": round(timings["render_stdlib_ms"] / timings["render_fast_ms"], 2),
+        "parse_speedup": round(timings["parse_stdlib_ms"] / timings["parse_fast_ms"], 2),
+    })
+    return report
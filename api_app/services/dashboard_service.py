@@ -0,0 +1,73 @@
+from datetime import timedelta
+
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from api_app.caching import (
+    MISS,
+    cache_dashboard,
+    get_cached_dashboard,
+    get_dashboard_cache,
+    invalidate_dashboards,
+)
+from api_app.models import TaskPriority, TaskStatus, UserTask, UserTaskRole
+
+
+def compute_dashboard(user, today):
+    """
+    Counts of the user's tasks by status, priority and role, plus overdue and
+    due-this-week (today through Sunday) among tasks not Done. One grouped
+    query over user_tasks joined to tasks; the roll-up happens in Python.
+    """
+    week_end = today + timedelta(days=6 - today.weekday())
+    open_tasks = ~Q(task__status=TaskStatus.DONE)
+    groups = (
+        UserTask.objects.filter(user=user)
+        .values("task__status", "task__priority", "role")
+        .annotate(
+            count=Count("id"),
+            overdue=Count("id", filter=open_tasks & Q(task__deadline__lt=today)),
+            due_this_week=Count(
+                "id", filter=open_tasks & Q(task__deadline__gte=today, task__deadline__lte=week_end)
+            ),
+        )
+        .order_by()
+    )
+
+    data = {
+        "total": 0,
+        "by_status": dict.fromkeys(TaskStatus.values, 0),
+        "by_priority": dict.fromkeys(TaskPriority.values, 0),
+        "by_role": dict.fromkeys(UserTaskRole.values, 0),
+        "overdue": 0,
+        "due_this_week": 0,
+    }
+    for group in groups:
+        data["total"] += group["count"]
+        data["by_status"][group["task__status"]] += group["count"]
+        data["by_priority"][group["task__priority"]] += group["count"]
+        data["by_role"][group["role"]] += group["count"]
+        data["overdue"] += group["overdue"]
+        data["due_this_week"] += group["due_this_week"]
+    return data
+
+
+def get_dashboard(user):
+    # Overdue/due-this-week depend on the date, so a cached entry from
+    # yesterday is treated as a miss.
+    today = timezone.localdate()
+    cached = get_cached_dashboard(user.pk)
+    if cached is not MISS and cached["date"] == today.isoformat():
+        return cached["data"]
+
+    data = compute_dashboard(user, today)
+    cache_dashboard(user.pk, {"date": today.isoformat(), "data": data})
+    return data
+
+
+def invalidate_task_dashboards(task_ids):
+    """Drop the cached dashboards of every member of the given tasks."""
+    if get_dashboard_cache() is None:
+        return
+    user_ids = UserTask.objects.filter(task_id__in=task_ids).values_list("user_id", flat=True)
+    invalidate_dashboards(user_ids)
@@ -0,0 +1,108 @@
+import csv
+import datetime
+import json
+
+from django.conf import settings
+from django.db.models import F
+
+from api_app.models import Subtask, Task, UserTask
+
+TASK_FIELDS = (
+    "id", "title", "description", "deadline", "priority", "status",
+    "assigned_by_id", "assigned_by__username", "created_at", "updated_at",
+)
+SUBTASK_FIELDS = (
+    "id", "task_id", "title", "description", "status", "position", "created_at", "updated_at",
+)
+MEMBERSHIP_FIELDS = ("id", "task_id", "user_id", "role", "updated_at")
+
+CSV_COLUMNS = (
+    "type", "id", "task_id", "title", "description", "deadline", "priority", "status",
+    "position", "assigned_by_id", "assigned_by", "user_id", "username", "role",
+    "created_at", "updated_at",
+)
+
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def get_export_batch_size():
+    return getattr(settings, "EXPORT_BATCH_SIZE", 500)
+
+
+def _iter_task_batches(user, batch_size):
+    queryset = Task.objects.all() if user is None else Task.objects.filter(memberships__user=user)
+    last_id = 0
+    while True:
+        batch = list(
+            queryset.filter(id__gt=last_id).order_by("id").values(*TASK_FIELDS)[:batch_size]
+        )
+        if not batch:
+            return
+        yield batch
+        last_id = batch[-1]["id"]
+
+
+def iter_export_records(user=None, batch_size=None):
+    """
+    Yield task, subtask and membership records as flat dicts with a `type` key.
+
+    Tasks are walked in keyset batches on id; each batch's subtasks and
+    memberships are streamed with iterator(), so memory use does not grow
+    with the size of the export. `user=None` exports every task.
+    """
+    batch_size = batch_size or get_export_batch_size()
+    for tasks in _iter_task_batches(user, batch_size):
+        task_ids = [task["id"] for task in tasks]
+        for task in tasks:
+            task["assigned_by"] = task.pop("assigned_by__username")
+            yield {"type": "task", **task}
+
+        subtasks = (
+            Subtask.objects.filter(task_id__in=task_ids)
+            .order_by("task_id", "position", "-created_at", "-id")
+            .values(*SUBTASK_FIELDS)
+        )
+        for subtask in subtasks.iterator(chunk_size=batch_size):
+            yield {"type": "subtask", **subtask}
+
+        memberships = (
+            UserTask.objects.filter(task_id__in=task_ids)
+            .order_by("task_id", "id")
+            .values(*MEMBERSHIP_FIELDS, username=F("user__username"))
+        )
+        for membership in memberships.iterator(chunk_size=batch_size):
+            yield {"type": "membership", **membership}
+
+
+def _encode_value(value):
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    return value
+
+
+def render_ndjson(records):
+    for record in records:
+        yield json.dumps({key: _encode_value(value) for key, value in record.items()}) + "\n"
+
+
+class _Echo:
+    """File-like object whose write() hands the line back to the caller."""
+
+    def write(self, value):
+        return value
+
+
+def render_csv(records):
+    writer = csv.DictWriter(_Echo(), fieldnames=CSV_COLUMNS, extrasaction="ignore")
+    yield writer.writeheader()
+    for record in records:
+        yield writer.writerow({key: _encode_value(value) for key, value in record.items()})
+
+
+def render_export(records, export_format):
+    if export_format == "csv":
+        return render_csv(records)
+    return render_ndjson(records)
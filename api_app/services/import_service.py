@@ -0,0 +1,328 @@
+import csv
+import io
+import json
+from collections import Counter, OrderedDict
+
+from django.contrib.auth import get_user_model
+from django.db import connection, transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from api_app.caching import invalidate_dashboards, invalidate_role_on_commit
+from api_app.models import Subtask, Task, TaskPriority, TaskStatus, UserTask, UserTaskRole
+from api_app.services.subtask_service import recount_subtask_counters
+
+MAX_REPORTED_ERRORS = 20
+# Source task ids remembered for resolving children; see TaskImporter.
+DEFAULT_TASK_WINDOW = 100_000
+# Upper bound of a PositiveIntegerField on PostgreSQL.
+MAX_POSITION = 2_147_483_647
+
+
+class ImportRecordError(ValueError):
+    pass
+
+
+def read_ndjson(stream):
+    for line in stream:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError:
+            # Reported by TaskImporter.feed as a skipped record.
+            yield None
+
+
+def read_csv(stream):
+    for row in csv.DictReader(stream):
+        # CSV has no null; an empty cell means "not set".
+        yield {key: (value if value != "" else None) for key, value in row.items()}
+
+
+def _text(record, name, required=False, max_length=None):
+    # "" stays "" so NDJSON round-trips; only a missing or null value is None.
+    value = record.get(name)
+    if required and (value is None or value == ""):
+        raise ImportRecordError(f"{name} is required")
+    if value is None:
+        return None
+    value = str(value)
+    # SQLite ignores max_length; PostgreSQL would fail the whole batch.
+    if max_length is not None and len(value) > max_length:
+        raise ImportRecordError(f"{name} is longer than {max_length} characters")
+    return value
+
+
+def _max_length(model, name):
+    return model._meta.get_field(name).max_length
+
+
+def _choice(record, name, choices, default=None):
+    value = record.get(name) or default
+    if value not in choices.values:
+        raise ImportRecordError(f"invalid {name} {value!r}")
+    return value
+
+
+def _position(record):
+    value = int(record.get("position") or 0)
+    if not 0 <= value <= MAX_POSITION:
+        raise ImportRecordError(f"invalid position {value!r}")
+    return value
+
+
+def _copy_field(value):
+    # In COPY's CSV format an unquoted empty field is NULL and a quoted one
+    # ("") is an empty string, so every non-NULL value is quoted.
+    if value is None:
+        return ""
+    return '"' + str(value).replace('"', '""') + '"'
+
+
+def _timestamp(record, name, default):
+    value = record.get(name)
+    if not value:
+        return default
+    parsed = parse_datetime(value)
+    if parsed is None:
+        raise ImportRecordError(f"invalid {name} {value!r}")
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
+
+class TaskImporter:
+    """
+    Load task/subtask/membership records (the export format) in batches.
+
+    Records reference their task by the source system's id (`id` on tasks,
+    `task_id` on children) and users by username. A task must appear before
+    its children. Each flush is one transaction: tasks, their Owner
+    memberships, subtasks, then explicit memberships, each with a single
+    bulk INSERT (or COPY on PostgreSQL when `use_copy` is set).
+
+    Only the last `task_window` source task ids are remembered (at least
+    one batch), so memory stays flat on large imports. The export puts each
+    task's children right after its batch of tasks. Children of an older
+    task are reported as skipped.
+
+    With COPY, all deferrable constraints are checked at commit instead of
+    per row. Django creates foreign keys as DEFERRABLE on PostgreSQL.
+    Indexes are left in place: dropping them would block or slow every
+    other query on a live database.
+    """
+
+    def __init__(self, batch_size=1000, default_owner=None, use_copy=False, task_window=DEFAULT_TASK_WINDOW):
+        self.batch_size = batch_size
+        self.default_owner = default_owner
+        self.use_copy = use_copy and connection.vendor == "postgresql"
+        self.task_window = max(task_window, batch_size)
+        self.task_ids = OrderedDict()
+        self.user_ids = {}
+        self.pending_tasks = []
+        self.pending_subtasks = []
+        self.pending_memberships = []
+        self.counts = Counter()
+        self.errors = []
+
+    # ---------- input ----------
+
+    def feed(self, record, line_no):
+        try:
+            kind = record.get("type") if isinstance(record, dict) else None
+            if kind == "task":
+                self._add_task(record)
+            elif kind == "subtask":
+                self._add_subtask(record)
+            elif kind == "membership":
+                self._add_membership(record)
+            elif record is None:
+                raise ImportRecordError("not a valid JSON object")
+            else:
+                raise ImportRecordError(f"unknown record type {kind!r}")
+        except (ImportRecordError, TypeError, ValueError) as exc:
+            self._error(f"record {line_no}: {exc}")
+            return
+
+        pending = len(self.pending_tasks) + len(self.pending_subtasks) + len(self.pending_memberships)
+        if pending >= self.batch_size:
+            self.flush()
+
+    def _error(self, message):
+        self.counts["skipped"] += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(message)
+
+    def _add_task(self, record):
+        now = timezone.now()
+        deadline = parse_date(_text(record, "deadline", required=True))
+        if deadline is None:
+            raise ImportRecordError(f"invalid deadline {record.get('deadline')!r}")
+        attrs = {
+            "title": _text(record, "title", required=True, max_length=_max_length(Task, "title")),
+            "description": _text(record, "description"),
+            "deadline": deadline,
+            "priority": _choice(record, "priority", TaskPriority),
+            "status": _choice(record, "status", TaskStatus, default=TaskStatus.TODO),
+            "created_at": _timestamp(record, "created_at", now),
+            "updated_at": _timestamp(record, "updated_at", now),
+        }
+        owner = _text(record, "assigned_by") or self.default_owner
+        if owner is None:
+            raise ImportRecordError("assigned_by is required")
+        self.pending_tasks.append((_text(record, "id") or None, attrs, owner))
+
+    def _add_subtask(self, record):
+        now = timezone.now()
+        attrs = {
+            "title": _text(record, "title", required=True, max_length=_max_length(Subtask, "title")),
+            "description": _text(record, "description"),
+            "status": _choice(record, "status", TaskStatus, default=TaskStatus.TODO),
+            "position": _position(record),
+            "created_at": _timestamp(record, "created_at", now),
+            "updated_at": _timestamp(record, "updated_at", now),
+        }
+        self.pending_subtasks.append((_text(record, "task_id", required=True), attrs))
+
+    def _add_membership(self, record):
+        role = _choice(record, "role", UserTaskRole, default=UserTaskRole.ASSIGNED)
+        username = _text(record, "username", required=True)
+        self.pending_memberships.append((_text(record, "task_id", required=True), username, role))
+
+    # ---------- output ----------
+
+    def _resolve_users(self):
+        wanted = {owner for _, _, owner in self.pending_tasks}
+        wanted |= {username for _, username, _ in self.pending_memberships}
+        wanted -= self.user_ids.keys()
+        if not wanted:
+            return
+        found = dict(
+            get_user_model().objects.filter(username__in=wanted).values_list("username", "id")
+        )
+        for username in wanted:
+            self.user_ids[username] = found.get(username)
+
+    def _allocate_ids(self, table, count):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT nextval(pg_get_serial_sequence(%s, 'id')) FROM generate_series(1, %s)",
+                [table, count],
+            )
+            return [row[0] for row in cursor.fetchall()]
+
+    def _copy_buffer(self, fields, objs):
+        buffer = io.StringIO()
+        for obj in objs:
+            values = (field.get_db_prep_value(field.value_from_object(obj), connection) for field in fields)
+            buffer.write(",".join(_copy_field(value) for value in values))
+            buffer.write("\n")
+        buffer.seek(0)
+        return buffer
+
+    def _copy(self, model, objs):
+        """COPY model rows (pk included) in CSV format; PostgreSQL only."""
+        fields = list(model._meta.concrete_fields)
+        buffer = self._copy_buffer(fields, objs)
+        columns = ", ".join(connection.ops.quote_name(field.column) for field in fields)
+        table = connection.ops.quote_name(model._meta.db_table)
+        with connection.cursor() as cursor:
+            cursor.copy_expert(f"COPY {table} ({columns}) FROM STDIN WITH (FORMAT csv)", buffer)
+
+    def _insert(self, model, objs):
+        if not objs:
+            return
+        if self.use_copy:
+            for obj, pk in zip(objs, self._allocate_ids(model._meta.db_table, len(objs))):
+                obj.pk = pk
+            self._copy(model, objs)
+        else:
+            model.objects.bulk_create(objs, batch_size=self.batch_size)
+
+    def _remember_task(self, legacy_id, pk):
+        self.task_ids.pop(legacy_id, None)
+        self.task_ids[legacy_id] = pk
+        if len(self.task_ids) > self.task_window:
+            self.task_ids.popitem(last=False)
+
+    def _flush_tasks(self):
+        rows = []
+        for legacy_id, attrs, owner in self.pending_tasks:
+            owner_id = self.user_ids.get(owner)
+            if owner_id is None:
+                self._error(f"task {legacy_id}: unknown user {owner!r}")
+                continue
+            rows.append((legacy_id, Task(**attrs, assigned_by_id=owner_id)))
+        self.pending_tasks = []
+
+        tasks = [task for _, task in rows]
+        self._insert(Task, tasks)
+        for legacy_id, task in rows:
+            if legacy_id is not None:
+                self._remember_task(legacy_id, task.pk)
+        self.counts["tasks"] += len(tasks)
+
+        # bulk inserts skip the ensure_task_owner signal.
+        owners = [
+            UserTask(task_id=task.pk, user_id=task.assigned_by_id, role=UserTaskRole.OWNER)
+            for task in tasks
+        ]
+        UserTask.objects.bulk_create(owners, batch_size=self.batch_size, ignore_conflicts=True)
+        for membership in owners:
+            invalidate_role_on_commit(membership.user_id, membership.task_id)
+        invalidate_dashboards(membership.user_id for membership in owners)
+
+    def _flush_subtasks(self):
+        subtasks = []
+        for legacy_task_id, attrs in self.pending_subtasks:
+            task_id = self.task_ids.get(legacy_task_id)
+            if task_id is None:
+                self._error(f"subtask of task {legacy_task_id}: unknown task")
+                continue
+            subtasks.append(Subtask(**attrs, task_id=task_id))
+        self.pending_subtasks = []
+        self._insert(Subtask, subtasks)
+        self.counts["subtasks"] += len(subtasks)
+        if subtasks:
+            recount_subtask_counters({subtask.task_id for subtask in subtasks})
+
+    def _flush_memberships(self):
+        memberships = {}
+        for legacy_task_id, username, role in self.pending_memberships:
+            task_id = self.task_ids.get(legacy_task_id)
+            user_id = self.user_ids.get(username)
+            if task_id is None or user_id is None:
+                self._error(f"membership of task {legacy_task_id}: unknown task or user {username!r}")
+                continue
+            memberships[(task_id, user_id)] = UserTask(task_id=task_id, user_id=user_id, role=role)
+        self.pending_memberships = []
+
+        # Explicit memberships win over the Owner row created with the task.
+        UserTask.objects.bulk_create(
+            list(memberships.values()),
+            batch_size=self.batch_size,
+            update_conflicts=True,
+            unique_fields=["task", "user"],
+            update_fields=["role", "updated_at"],
+        )
+        self.counts["memberships"] += len(memberships)
+        for task_id, user_id in memberships:
+            invalidate_role_on_commit(user_id, task_id)
+        invalidate_dashboards(user_id for _, user_id in memberships)
+
+    def flush(self):
+        self._resolve_users()
+        with transaction.atomic():
+            if self.use_copy:
+                with connection.cursor() as cursor:
+                    cursor.execute("SET CONSTRAINTS ALL DEFERRED")
+            self._flush_tasks()
+            self._flush_subtasks()
+            if self.pending_memberships:
+                self._flush_memberships()
+
+    def finish(self):
+        self.flush()
+        return self.counts
@@ -0,0 +1,105 @@
+import random
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.utils import timezone
+
+from api_app.models import TaskPriority, TaskStatus, UserTaskRole
+from api_app.services.import_service import TaskImporter
+
+# Titles and descriptions are drawn from this vocabulary so /api/search/ has
+# realistic hit rates.
+WORDS = (
+    "report budget review deploy release invoice meeting roadmap backlog design "
+    "migration database customer onboarding audit security payroll sprint "
+    "testing documentation hiring training vendor contract support incident "
+    "analytics dashboard marketing campaign newsletter feedback survey quarterly"
+).split()
+
+DEFAULT_PASSWORD = "LoadTest123!"
+
+
+def _sentence(rng, words):
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def load_usernames(prefix, count):
+    return [f"{prefix}_user_{index:06d}" for index in range(count)]
+
+
+def iter_load_records(usernames, tasks_per_user, members_per_task, subtasks_per_task, rng):
+    """Yield export-format task/subtask/membership records for TaskImporter."""
+    today = timezone.localdate()
+    member_roles = (UserTaskRole.ASSIGNED, UserTaskRole.VIEWER)
+    task_number = 0
+    member_count = min(members_per_task, len(usernames) - 1)
+    for owner_index, owner in enumerate(usernames):
+        for _ in range(tasks_per_user):
+            task_number += 1
+            task_id = str(task_number)
+            yield {
+                "type": "task",
+                "id": task_id,
+                "title": _sentence(rng, 4).capitalize(),
+                "description": _sentence(rng, 20),
+                "deadline": (today + timedelta(days=rng.randint(-30, 90))).isoformat(),
+                "priority": rng.choice(TaskPriority.values),
+                "status": rng.choice(TaskStatus.values),
+                "assigned_by": owner,
+            }
+            for position in range(subtasks_per_task):
+                yield {
+                    "type": "subtask",
+                    "task_id": task_id,
+                    "title": _sentence(rng, 3).capitalize(),
+                    "status": rng.choice(TaskStatus.values),
+                    "position": position,
+                }
+            # Sample among the other users without building that list per owner.
+            for index in rng.sample(range(len(usernames) - 1), member_count):
+                yield {
+                    "type": "membership",
+                    "task_id": task_id,
+                    "username": usernames[index + (index >= owner_index)],
+                    "role": rng.choice(member_roles),
+                }
+
+
+def generate_load_data(
+    users,
+    tasks_per_user,
+    members_per_task,
+    subtasks_per_task,
+    prefix="load",
+    password=DEFAULT_PASSWORD,
+    seed=0,
+    batch_size=1000,
+    use_copy=False,
+):
+    """
+    Create `users` users named <prefix>_user_NNNNNN (all with `password`),
+    each owning `tasks_per_user` tasks with `subtasks_per_task` subtasks and
+    `members_per_task` other members. Rows go through TaskImporter, so they
+    get Owner memberships, subtask counters and search indexing like an
+    import. Returns the importer's counts plus "users".
+
+    The same `seed` produces the same data. Existing usernames are reused.
+    """
+    User = get_user_model()
+    usernames = load_usernames(prefix, users)
+    # One hash for everyone: hashing per user would dominate the run.
+    password_hash = make_password(password)
+    User.objects.bulk_create(
+        [User(username=username, email=f"{username}@example.com", password=password_hash) for username in usernames],
+        batch_size=batch_size,
+        ignore_conflicts=True,
+    )
+
+    importer = TaskImporter(batch_size=batch_size, use_copy=use_copy)
+    records = iter_load_records(
+        usernames, tasks_per_user, members_per_task, subtasks_per_task, random.Random(seed)
+    )
+    for line_no, record in enumerate(records, start=1):
+        importer.feed(record, line_no)
+    return {"users": len(usernames), **importer.finish()}
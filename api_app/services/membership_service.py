@@ -1,10 +1,70 @@
 from django.db import IntegrityError
 from rest_framework.exceptions import ValidationError
 
+from api_app.caching import MISS, cache_role, get_cached_role
+from api_app.models import UserTask
+
+
+class MembershipResolver:
+    """
+    Caller's role per task, loaded from user_tasks at most once per request
+    (and not at all while the cross-request role cache holds it).
+
+    Querysets that already joined the caller's membership (see the
+    `membership_role` annotation in views) prime the resolver via
+    `role_for_task`/`role_for_subtask`, so permissions, services and
+    serializers share one lookup.
+    """
+
+    def __init__(self, user):
+        self.user = user
+        self._roles = {}
+
+    def get_role(self, task_id):
+        if task_id not in self._roles:
+            if not self.user or not self.user.is_authenticated:
+                return None
+            role = get_cached_role(self.user.pk, task_id)
+            if role is MISS:
+                role = (
+                    UserTask.objects.filter(task_id=task_id, user=self.user)
+                    .values_list("role", flat=True)
+                    .first()
+                )
+                cache_role(self.user.pk, task_id, role)
+            self._roles[task_id] = role
+        return self._roles[task_id]
+
+    def prime(self, task_id, role):
+        self._roles[task_id] = role
+
+    def forget(self, task_id):
+        self._roles.pop(task_id, None)
+
+    def role_for_task(self, task):
+        if task.pk not in self._roles and hasattr(task, "membership_role"):
+            self.prime(task.pk, task.membership_role)
+        return self.get_role(task.pk)
+
+    def role_for_subtask(self, subtask):
+        if subtask.task_id not in self._roles and hasattr(subtask, "membership_role"):
+            self.prime(subtask.task_id, subtask.membership_role)
+        return self.get_role(subtask.task_id)
+
+
+def get_membership_resolver(request):
+    """Return the resolver bound to this request, creating it on first use."""
+    # DRF's Request proxies attribute reads but not writes to the HttpRequest.
+    django_request = getattr(request, "_request", request)
+    resolver = getattr(django_request, "membership_resolver", None)
+    if resolver is None or resolver.user is not request.user:
+        resolver = MembershipResolver(request.user)
+        django_request.membership_resolver = resolver
+    return resolver
+
 
 def create_membership_for_task(serializer, task_id):
     try:
         return serializer.save(task_id=task_id)
     except IntegrityError as exc:
         raise ValidationError({"detail": "User already assigned to this task."}) from exc
-
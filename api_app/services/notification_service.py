@@ -0,0 +1,46 @@
+import logging
+
+from django.conf import settings
+
+from api_app.models import UserTask
+
+logger = logging.getLogger(__name__)
+
+
+def get_coalesce_window():
+    return getattr(settings, "NOTIFICATION_COALESCE_WINDOW", 2)
+
+
+def collect_digests(task_ids):
+    """
+    Group new tasks by recipient with a single query over the memberships
+    of the whole batch. Returns [(user, [task, ...]), ...].
+    """
+    memberships = (
+        UserTask.objects.filter(task_id__in=set(task_ids))
+        .select_related("task", "user")
+        .order_by("user_id", "task_id")
+    )
+    digests = {}
+    for membership in memberships:
+        user, tasks = digests.setdefault(membership.user_id, (membership.user, []))
+        tasks.append(membership.task)
+    return list(digests.values())
+
+
+def deliver(user, tasks):
+    titles = ", ".join(task.title for task in tasks)
+    logger.info("%d new task(s) for %s: %s", len(tasks), user.username, titles)
+
+
+def deliver_reminder(user, tasks):
+    due = ", ".join(f"{task.title} ({task.deadline})" for task in tasks)
+    logger.info("Deadline reminder for %s: %s", user.username, due)
+
+
+def send_task_created_notifications(task_ids):
+    """One notification per recipient, however many of the tasks they are on."""
+    digests = collect_digests(task_ids)
+    for user, tasks in digests:
+        deliver(user, tasks)
+    return {"tasks": len(set(task_ids)), "recipients": len(digests)}
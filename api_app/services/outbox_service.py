@@ -0,0 +1,118 @@
+from datetime import timedelta
+
+from celery import current_app
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+from api_app.models import OutboxMessage
+
+# Retry delay after a failed publish doubles per attempt, up to this cap.
+MAX_RETRY_DELAY = timedelta(minutes=5)
+
+# Tasks taking a single list argument whose pending calls the relay merges
+# into one message per NOTIFICATION_BATCH_SIZE items.
+COALESCING_TASKS = frozenset({"api_app.tasks.notify_tasks_created"})
+
+
+def enqueue(task, *args, delay=None, **kwargs):
+    """
+    Record a call to the Celery `task` in the outbox.
+
+    Call it inside the transaction that writes the rows the message is about;
+    the message then commits or rolls back together with them. `delay`
+    (seconds) holds the message back so later calls can be coalesced with it.
+    """
+    available_at = timezone.now()
+    if delay:
+        available_at += timedelta(seconds=delay)
+    return OutboxMessage.objects.create(
+        task_name=task.name, args=list(args), kwargs=kwargs, available_at=available_at
+    )
+
+
+def publish(task_name, args, kwargs):
+    current_app.send_task(task_name, args=args, kwargs=kwargs)
+
+
+def _retry_delay(attempts):
+    return min(timedelta(seconds=2 ** attempts), MAX_RETRY_DELAY)
+
+
+def _pending_batch(batch_size):
+    queryset = OutboxMessage.objects.filter(available_at__lte=timezone.now()).order_by("id")
+    if connection.features.has_select_for_update_skip_locked:
+        # Concurrent relays take disjoint batches instead of double-publishing.
+        queryset = queryset.select_for_update(skip_locked=True)
+    return list(queryset[:batch_size])
+
+
+def _coalesce(messages):
+    """
+    Turn a batch of outbox rows into (task_name, [args, ...], kwargs, rows)
+    calls. Rows of COALESCING_TASKS are merged into one call whose argument
+    list is split into chunks of NOTIFICATION_BATCH_SIZE.
+    """
+    chunk_size = getattr(settings, "NOTIFICATION_BATCH_SIZE", 500)
+    calls = []
+    merged = {}
+    for message in messages:
+        if message.task_name not in COALESCING_TASKS:
+            calls.append((message.task_name, [message.args], message.kwargs, [message]))
+            continue
+        if message.task_name not in merged:
+            merged[message.task_name] = ([], [])
+            calls.append((message.task_name, None, {}, merged[message.task_name][1]))
+        items, rows = merged[message.task_name]
+        items.extend(message.args[0])
+        rows.append(message)
+
+    for index, (task_name, arg_lists, kwargs, rows) in enumerate(calls):
+        if arg_lists is None:
+            items = list(dict.fromkeys(merged[task_name][0]))
+            arg_lists = [[items[start:start + chunk_size]] for start in range(0, len(items), chunk_size)]
+            calls[index] = (task_name, arg_lists, kwargs, rows)
+    return calls
+
+
+def relay_outbox(batch_size=None, max_batches=None):
+    """
+    Publish pending outbox messages in id order, one batch per transaction.
+
+    Delivery is at-least-once: a relay that dies between publishing and
+    committing the delete re-sends that batch. The first failed publish stops
+    the run and backs its rows off, since the broker is likely down.
+    Returns the number of outbox rows published.
+    """
+    batch_size = batch_size or getattr(settings, "OUTBOX_RELAY_BATCH_SIZE", 100)
+    published = 0
+    batches = 0
+    while max_batches is None or batches < max_batches:
+        batches += 1
+        with transaction.atomic():
+            messages = _pending_batch(batch_size)
+            sent = []
+            failed = None
+            for task_name, arg_lists, kwargs, rows in _coalesce(messages):
+                try:
+                    for args in arg_lists:
+                        publish(task_name, args, kwargs)
+                except Exception as exc:
+                    failed = (rows, exc)
+                    break
+                sent.extend(rows)
+
+            OutboxMessage.objects.filter(id__in=[message.id for message in sent]).delete()
+            if failed is not None:
+                rows, exc = failed
+                now = timezone.now()
+                for message in rows:
+                    message.attempts += 1
+                    message.last_error = repr(exc)
+                    message.available_at = now + _retry_delay(message.attempts)
+                OutboxMessage.objects.bulk_update(rows, ["attempts", "last_error", "available_at"])
+
+        published += len(sent)
+        if failed is not None or len(messages) < batch_size:
+            break
+    return published
@@ -0,0 +1,70 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import F, Q
+from django.utils import timezone
+
+from api_app.models import Task, TaskStatus, UserTask, UserTaskRole
+from api_app.services.notification_service import deliver_reminder
+
+REMINDER_ROLES = (UserTaskRole.OWNER, UserTaskRole.ASSIGNED)
+
+
+def _due_batches(today, horizon_end, batch_size):
+    """
+    Keyset walk over open tasks due in [today, horizon_end] that have not been
+    reminded for their current deadline. Served by tasks_open_deadline_idx.
+    """
+    queryset = (
+        Task.objects.exclude(status=TaskStatus.DONE)
+        .filter(deadline__gte=today, deadline__lte=horizon_end)
+        .filter(Q(reminder_sent_for__isnull=True) | ~Q(reminder_sent_for=F("deadline")))
+        .order_by("deadline", "id")
+    )
+    last = None
+    while True:
+        batch = queryset
+        if last is not None:
+            batch = batch.filter(Q(deadline__gt=last[0]) | Q(deadline=last[0], id__gt=last[1]))
+        rows = list(batch.values_list("deadline", "id")[:batch_size])
+        if not rows:
+            return
+        yield [task_id for _, task_id in rows]
+        if len(rows) < batch_size:
+            return
+        last = rows[-1]
+
+
+def send_deadline_reminders(today=None, horizon_days=None, batch_size=None):
+    """
+    Remind Owner/Assigned members of open tasks due within the horizon.
+
+    Each batch costs one keyset query, one joined membership query and one
+    UPDATE of the reminder_sent_for marker, so reruns skip what was sent.
+    """
+    today = today or timezone.localdate()
+    if horizon_days is None:
+        horizon_days = getattr(settings, "DEADLINE_REMINDER_HORIZON_DAYS", 1)
+    batch_size = batch_size or getattr(settings, "DEADLINE_REMINDER_BATCH_SIZE", 500)
+    horizon_end = today + timedelta(days=horizon_days)
+
+    tasks = 0
+    reminders = 0
+    for task_ids in _due_batches(today, horizon_end, batch_size):
+        memberships = (
+            UserTask.objects.filter(task_id__in=task_ids, role__in=REMINDER_ROLES)
+            .select_related("task", "user")
+            .order_by("user_id", "task__deadline", "task_id")
+        )
+        digests = {}
+        for membership in memberships:
+            user, due = digests.setdefault(membership.user_id, (membership.user, []))
+            due.append(membership.task)
+        for user, due in digests.values():
+            deliver_reminder(user, due)
+
+        # Marked after delivery: a crash in between re-sends rather than drops.
+        Task.objects.filter(id__in=task_ids).update(reminder_sent_for=F("deadline"))
+        tasks += len(task_ids)
+        reminders += len(digests)
+    return {"tasks": tasks, "reminders": reminders}
@@ -0,0 +1,131 @@
+import re
+from importlib import import_module
+
+from django.db import connection
+from django.db.migrations.recorder import MigrationRecorder
+from rest_framework import status
+from rest_framework.exceptions import APIException, ValidationError
+
+
+class SearchUnavailable(APIException):
+    status_code = status.HTTP_501_NOT_IMPLEMENTED
+    default_detail = "Full-text search is not available on this database."
+    default_code = "search_unavailable"
+
+
+# Text search configuration baked into the generated columns (migration 0009).
+SEARCH_CONFIG = "english"
+MAX_QUERY_LENGTH = 200
+
+# Hits are ordered by relevance, then (type, id) so pages are stable.
+SEARCH_ORDERING = ("-rank", "type", "id")
+# Types of the SEARCH_ORDERING values, for checking cursors before they reach SQL.
+SEARCH_CURSOR_TYPES = (float, str, int)
+
+SEARCH_MIGRATION = ("api_app", "0009_full_text_search")
+# Triggers that keep the SQLite FTS5 tables in step with tasks/subtasks.
+SQLITE_SEARCH_TRIGGERS = tuple(
+    f"{table}_fts_{suffix}" for table in ("tasks", "subtasks") for suffix in ("ai", "ad", "au")
+)
+
+
+def restore_sqlite_search(db):
+    """
+    Recreate the SQLite search triggers (and reindex) when they are missing.
+
+    Django rebuilds a SQLite table for many ALTERs, which silently drops its
+    triggers; the post_migrate handler calls this after every migrate.
+    Returns the names of the triggers that were missing.
+    """
+    if db.vendor != "sqlite" or SEARCH_MIGRATION not in MigrationRecorder(db).applied_migrations():
+        return []
+    with db.cursor() as cursor:
+        cursor.execute("SELECT name FROM sqlite_master WHERE type = 'trigger'")
+        present = {name for (name,) in cursor.fetchall()}
+        missing = [name for name in SQLITE_SEARCH_TRIGGERS if name not in present]
+        if missing:
+            migration = import_module(f"api_app.migrations.{SEARCH_MIGRATION[1]}")
+            migration.create_sqlite_search(cursor)
+    return missing
+
+
+_POSTGRESQL_HITS = f"""
+    WITH q AS (SELECT websearch_to_tsquery('{SEARCH_CONFIG}', %(query)s) AS query)
+    SELECT 'task' AS type, t.id AS id, t.id AS task_id, t.title AS title,
+           ts_rank_cd(t.search_vector, q.query)::float8 AS rank
+    FROM q, tasks t
+    JOIN user_tasks m ON m.id_task = t.id AND m.id_user = %(user_id)s
+    WHERE t.search_vector @@ q.query
+    UNION ALL
+    SELECT 'subtask', s.id, s.id_task, s.title, ts_rank_cd(s.search_vector, q.query)::float8
+    FROM q, subtasks s
+    JOIN user_tasks m ON m.id_task = s.id_task AND m.id_user = %(user_id)s
+    WHERE s.search_vector @@ q.query
+"""
+
+# bm25() is lower-is-better; negated so both backends rank descending.
+# Title matches weigh twice as much as description matches.
+_SQLITE_HITS = """
+    SELECT 'task' AS type, t.id AS id, t.id AS task_id, t.title AS title,
+           -bm25(tasks_fts, 2.0, 1.0) AS rank
+    FROM tasks_fts
+    JOIN tasks t ON t.id = tasks_fts.rowid
+    JOIN user_tasks m ON m.id_task = t.id AND m.id_user = %(user_id)s
+    WHERE tasks_fts MATCH %(query)s
+    UNION ALL
+    SELECT 'subtask', s.id, s.id_task, s.title, -bm25(subtasks_fts, 2.0, 1.0)
+    FROM subtasks_fts
+    JOIN subtasks s ON s.id = subtasks_fts.rowid
+    JOIN user_tasks m ON m.id_task = s.id_task AND m.id_user = %(user_id)s
+    WHERE subtasks_fts MATCH %(query)s
+"""
+
+_AFTER = """
+    WHERE rank < %(rank)s
+       OR (rank = %(rank)s AND (type > %(type)s OR (type = %(type)s AND id > %(id)s)))
+"""
+
+
+def parse_search_query(params):
+    query = params.get("q", "").strip()
+    if not query:
+        raise ValidationError({"q": ["This query parameter is required."]})
+    if len(query) > MAX_QUERY_LENGTH:
+        raise ValidationError({"q": [f"At most {MAX_QUERY_LENGTH} characters."]})
+    return query
+
+
+def _fts5_query(query):
+    # FTS5 has its own query syntax; quoting each word matches all of them
+    # as plain terms instead of failing on stray operators or quotes.
+    return " ".join(f'"{word}"' for word in re.findall(r"\w+", query))
+
+
+def search_tasks(user, query, limit, after=None):
+    """
+    Ranked full-text hits over the titles/descriptions of the user's tasks and
+    their subtasks, as dicts with type, id, task_id, title and rank.
+
+    `after` is the (rank, type, id) of the last hit of the previous page.
+    """
+    if connection.vendor == "postgresql":
+        hits = _POSTGRESQL_HITS
+    elif connection.vendor == "sqlite":
+        hits = _SQLITE_HITS
+        query = _fts5_query(query)
+        if not query:
+            return []
+    else:
+        raise SearchUnavailable()
+
+    params = {"query": query, "user_id": user.pk, "limit": limit}
+    sql = f"SELECT type, id, task_id, title, rank FROM ({hits}) hits"
+    if after is not None:
+        params.update(zip(("rank", "type", "id"), after))
+        sql += _AFTER
+    sql += " ORDER BY rank DESC, type, id LIMIT %(limit)s"
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        columns = [column[0] for column in cursor.description]
+        return [dict(zip(columns, row)) for row in cursor.fetchall()]
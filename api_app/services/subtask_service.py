@@ -1,30 +1,276 @@
-from rest_framework.exceptions import NotFound, PermissionDenied
+from collections import defaultdict
 
-from api_app.models import UserTask, UserTaskRole
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, F, Q
+from django.utils import timezone
+from rest_framework.exceptions import NotFound, PermissionDenied, ValidationError
 
+from api_app.models import Subtask, Task, TaskStatus, UserTaskRole
+from api_app.services.membership_service import MembershipResolver
+from api_app.services.sync_service import record_subtask_tombstones
+from api_app.utils import is_id
 
-def create_subtask_for_task(serializer, task_id, user):
-    membership = UserTask.objects.filter(task_id=task_id, user=user).first()
-    if membership is None:
+
+def done_count(status):
+    """1 if a subtask in this status counts towards subtask_done, else 0."""
+    return 1 if status == TaskStatus.DONE else 0
+
+
+def adjust_subtask_counters(task_id, total=0, done=0):
+    """
+    Shift a task's subtask_total/subtask_done by the given deltas in one
+    UPDATE. The counters are part of the task's representation, so
+    updated_at moves too (ETags and delta sync pick the change up).
+    """
+    if not total and not done:
+        return
+    Task.objects.filter(id=task_id).update(
+        subtask_total=F("subtask_total") + total,
+        subtask_done=F("subtask_done") + done,
+        updated_at=timezone.now(),
+    )
+
+
+def _locked_statuses(task_id, subtask_ids):
+    # Row locks keep concurrent edits of the same subtask from double-counting.
+    return dict(
+        Subtask.objects.select_for_update()
+        .filter(task_id=task_id, id__in=subtask_ids)
+        .values_list("id", "status")
+    )
+
+
+def recount_subtask_counters(task_ids):
+    """
+    Recompute the counters of the given tasks from their subtasks with one
+    grouped query and write back only the rows that drifted, with a new
+    updated_at like adjust_subtask_counters. Returns how many tasks were
+    corrected.
+    """
+    rows = (
+        Task.objects.filter(id__in=task_ids)
+        .annotate(
+            actual_total=Count("subtasks"),
+            actual_done=Count("subtasks", filter=Q(subtasks__status=TaskStatus.DONE)),
+        )
+        .only("id", "subtask_total", "subtask_done")
+    )
+    now = timezone.now()
+    drifted = []
+    for task in rows:
+        if (task.subtask_total, task.subtask_done) != (task.actual_total, task.actual_done):
+            task.subtask_total = task.actual_total
+            task.subtask_done = task.actual_done
+            task.updated_at = now
+            drifted.append(task)
+    if drifted:
+        Task.objects.bulk_update(drifted, ["subtask_total", "subtask_done", "updated_at"])
+    return len(drifted)
+
+
+def create_subtask_for_task(serializer, task_id, user, resolver=None):
+    resolver = resolver or MembershipResolver(user)
+    role = resolver.get_role(task_id)
+    if role is None:
         raise NotFound()
-    if membership.role not in (UserTaskRole.OWNER, UserTaskRole.ASSIGNED):
+    if role not in (UserTaskRole.OWNER, UserTaskRole.ASSIGNED):
         raise PermissionDenied("You don't have permission to add subtasks for this task.")
 
+    # The count_created_subtask signal bumps the task's counters.
     return serializer.save(task_id=task_id)
 
 
-def ensure_can_edit_subtask(subtask, user):
-    membership = UserTask.objects.filter(task=subtask.task, user=user).first()
-    if membership is None:
+def update_subtask(serializer):
+    subtask = serializer.instance
+    if "status" not in serializer.validated_data:
+        # SubtaskSerializer.update writes only the submitted columns, so the
+        # status (and its counter) is left to whoever last changed it.
+        return serializer.save()
+
+    with transaction.atomic():
+        before = _locked_statuses(subtask.task_id, [subtask.id]).get(subtask.id)
+        subtask = serializer.save()
+        if before is not None:
+            delta = done_count(subtask.status) - done_count(before)
+            adjust_subtask_counters(subtask.task_id, done=delta)
+    return subtask
+
+
+def ensure_can_edit_subtask(subtask, user, resolver=None):
+    resolver = resolver or MembershipResolver(user)
+    role = resolver.role_for_subtask(subtask)
+    if role is None:
         raise NotFound()
-    if membership.role not in (UserTaskRole.OWNER, UserTaskRole.ASSIGNED):
+    if role not in (UserTaskRole.OWNER, UserTaskRole.ASSIGNED):
         raise PermissionDenied("You don't have permission to edit this subtask.")
 
 
-def ensure_can_delete_subtask(subtask, user):
-    membership = UserTask.objects.filter(task=subtask.task, user=user).first()
-    if membership is None:
+def ensure_can_delete_subtask(subtask, user, resolver=None):
+    resolver = resolver or MembershipResolver(user)
+    role = resolver.role_for_subtask(subtask)
+    if role is None:
         raise NotFound()
-    if membership.role != UserTaskRole.OWNER:
+    if role != UserTaskRole.OWNER:
         raise PermissionDenied("Only the owner can delete subtasks.")
 
+
+def delete_subtask(subtask):
+    with transaction.atomic():
+        subtask_id = subtask.id
+        status = _locked_statuses(subtask.task_id, [subtask_id]).get(subtask_id)
+        subtask.delete()
+        if status is not None:
+            adjust_subtask_counters(subtask.task_id, total=-1, done=-done_count(status))
+        record_subtask_tombstones(subtask.task_id, [subtask_id])
+
+
+def _ids_in(value, name):
+    if value is None:
+        return []
+    if not isinstance(value, list) or not all(is_id(item) for item in value):
+        raise ValidationError({name: ["Expected a list of subtask ids."]})
+    if len(set(value)) != len(value):
+        raise ValidationError({name: ["Each subtask may appear only once."]})
+    return value
+
+
+def _renumbered(order, subtasks, deletes):
+    """
+    The task's subtasks in their new display order: the listed ids first,
+    then the unlisted ones in their current list order, so positions stay
+    unique when `order` names only some of them.
+    """
+    listed = set(order) | set(deletes)
+    rest = sorted(
+        (subtask for subtask_id, subtask in subtasks.items() if subtask_id not in listed),
+        key=lambda subtask: (subtask.position, -subtask.created_at.timestamp(), -subtask.id),
+    )
+    return [subtasks[subtask_id] for subtask_id in order] + rest
+
+
+def apply_subtask_batch(data, task_id, user, serializer_class, context, resolver=None):
+    """
+    Apply creates, updates, reorders and deletes to one task's subtasks.
+
+    Payload keys (all optional): `create` (list of subtasks), `update` (list of
+    partial subtasks with `id`), `order` (subtask ids in display order, stored
+    as position 1..n; subtasks left out follow as n+1.. in their current order)
+    and `delete` (list of ids). One role check covers the whole batch and
+    everything runs in one transaction; any error rolls it all back.
+
+    The touched subtasks are read under a row lock, and each row writes only
+    the columns that changed on it.
+    """
+    if not isinstance(data, dict):
+        raise ValidationError({"detail": "Expected an object."})
+    creates = data.get("create") or []
+    updates = data.get("update") or []
+    order = _ids_in(data.get("order"), "order")
+    deletes = _ids_in(data.get("delete"), "delete")
+    if not isinstance(creates, list) or not isinstance(updates, list):
+        raise ValidationError({"detail": "`create` and `update` must be lists."})
+
+    limit = getattr(settings, "TASK_BULK_MAX_ITEMS", 1000)
+    if len(creates) + len(updates) + len(order) + len(deletes) > limit:
+        raise ValidationError({"detail": f"At most {limit} items per request."})
+
+    resolver = resolver or MembershipResolver(user)
+    role = resolver.get_role(task_id)
+    if role is None:
+        raise NotFound()
+    if (creates or updates or order) and role not in (UserTaskRole.OWNER, UserTaskRole.ASSIGNED):
+        raise PermissionDenied("You don't have permission to edit subtasks for this task.")
+    if deletes and role != UserTaskRole.OWNER:
+        raise PermissionDenied("Only the owner can delete subtasks.")
+
+    update_ids = [
+        item.get("id") if isinstance(item, dict) and is_id(item.get("id")) else None
+        for item in updates
+    ]
+    known_ids = [subtask_id for subtask_id in update_ids if subtask_id is not None]
+    if len(set(known_ids)) != len(known_ids):
+        raise ValidationError({"update": ["Each subtask may appear only once."]})
+    if set(deletes) & set(known_ids + order):
+        raise ValidationError({"delete": ["Deleted subtasks cannot also be updated or reordered."]})
+
+    create_serializer = serializer_class(data=creates, many=True, context=context)
+    create_errors = [] if create_serializer.is_valid() else create_serializer.errors
+
+    with transaction.atomic():
+        # Reordering renumbers every subtask of the task, so it locks them all.
+        locked = Subtask.objects.select_for_update().filter(task_id=task_id).order_by("id")
+        subtasks = locked.in_bulk() if order else locked.in_bulk(set(known_ids + deletes))
+        missing = [sid for sid in order + deletes if sid not in subtasks]
+        if missing:
+            raise ValidationError({"detail": f"Subtasks not found in this task: {missing}"})
+        before = {subtask_id: subtask.status for subtask_id, subtask in subtasks.items()}
+
+        update_errors = []
+        update_serializers = []
+        for item, subtask_id in zip(updates, update_ids):
+            if subtask_id not in subtasks:
+                update_errors.append({"id": ["Subtask not found in this task."]})
+                continue
+            item_data = {key: value for key, value in item.items() if key != "id"}
+            serializer = serializer_class(subtasks[subtask_id], data=item_data, partial=True, context=context)
+            if serializer.is_valid():
+                update_serializers.append(serializer)
+                update_errors.append({})
+            else:
+                update_errors.append(serializer.errors)
+
+        errors = {}
+        if any(create_errors):
+            errors["create"] = create_errors
+        if any(update_errors):
+            errors["update"] = update_errors
+        if errors:
+            raise ValidationError(errors)
+
+        # subtask id -> the columns this batch changes on that row.
+        changed = {}
+        for serializer in update_serializers:
+            subtask = serializer.instance
+            fields = changed.setdefault(subtask.id, set())
+            for attr, value in serializer.validated_data.items():
+                if getattr(subtask, attr) != value:
+                    setattr(subtask, attr, value)
+                    fields.add(attr)
+        if order:
+            for position, subtask in enumerate(_renumbered(order, subtasks, deletes), start=1):
+                if subtask.position != position:
+                    subtask.position = position
+                    changed.setdefault(subtask.id, set()).add("position")
+
+        # bulk_update/bulk_create skip Subtask.save(), so updated_at is set
+        # here. Rows are grouped by changed columns: a reorder-only row must
+        # not write its title or status back.
+        now = timezone.now()
+        groups = defaultdict(list)
+        for subtask_id, fields in changed.items():
+            subtasks[subtask_id].updated_at = now
+            groups[frozenset(fields | {"updated_at"})].append(subtasks[subtask_id])
+        for fields, rows in groups.items():
+            Subtask.objects.bulk_update(rows, sorted(fields))
+
+        created = [
+            Subtask(**attrs, task_id=task_id, created_at=now, updated_at=now)
+            for attrs in create_serializer.validated_data
+        ]
+        if created:
+            Subtask.objects.bulk_create(created)
+        if deletes:
+            Subtask.objects.filter(task_id=task_id, id__in=deletes).delete()
+            record_subtask_tombstones(task_id, deletes)
+
+        done = sum(done_count(subtask.status) for subtask in created)
+        done -= sum(done_count(before[subtask_id]) for subtask_id in deletes)
+        done += sum(
+            done_count(subtasks[subtask_id].status) - done_count(before[subtask_id])
+            for subtask_id in changed
+        )
+        adjust_subtask_counters(task_id, total=len(created) - len(deletes), done=done)
+
+    updated = [subtasks[subtask_id] for subtask_id in changed]
+    return {"created": created, "updated": updated, "deleted": deletes}
@@ -0,0 +1,134 @@
+import threading
+from contextlib import contextmanager
+from datetime import timedelta, timezone as dt_timezone
+
+from django.conf import settings
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from rest_framework import status
+from rest_framework.exceptions import APIException, ValidationError
+
+from api_app.models import Tombstone, TombstoneKind, UserTask
+
+
+class SyncTokenExpired(APIException):
+    status_code = status.HTTP_410_GONE
+    default_detail = "updated_since is older than the sync history; reload the full list."
+    default_code = "sync_token_expired"
+
+
+# Rows written by transactions still in flight when a delta is read carry an
+# updated_at slightly before the read; handing out an earlier token re-sends
+# them next time instead of losing them. Clients upsert, so repeats are harmless.
+SYNC_TOKEN_OVERLAP = timedelta(seconds=5)
+
+
+def get_sync_token():
+    return timezone.now() - SYNC_TOKEN_OVERLAP
+
+
+def get_tombstone_retention():
+    return timedelta(days=getattr(settings, "SYNC_TOMBSTONE_RETENTION_DAYS", 30))
+
+
+def parse_updated_since(params):
+    """Return the `updated_since` watermark as an aware datetime, or None."""
+    raw = params.get("updated_since")
+    if not raw:
+        return None
+    # An unencoded "+00:00" offset arrives as " 00:00".
+    value = parse_datetime(raw.strip().replace(" ", "+"))
+    if value is None:
+        raise ValidationError({"updated_since": ["Datetime has wrong format. Use ISO 8601."]})
+    if timezone.is_naive(value):
+        value = timezone.make_aware(value, dt_timezone.utc)
+    if value < timezone.now() - get_tombstone_retention():
+        raise SyncTokenExpired()
+    return value
+
+
+_pending_tombstones = threading.local()
+
+
+@contextmanager
+def batched_membership_tombstones():
+    """
+    Collect the membership tombstones recorded inside the block (one per
+    post_delete signal) and write them with a single INSERT at the end.
+    Use it inside the transaction that deletes the memberships.
+    """
+    if getattr(_pending_tombstones, "rows", None) is not None:
+        yield
+        return
+    _pending_tombstones.rows = []
+    try:
+        yield
+        Tombstone.objects.bulk_create(_pending_tombstones.rows)
+    finally:
+        _pending_tombstones.rows = None
+
+
+def record_membership_tombstone(membership):
+    tombstone = Tombstone(
+        kind=TombstoneKind.MEMBERSHIP,
+        object_id=membership.id,
+        task_id=membership.task_id,
+        user_id=membership.user_id,
+    )
+    pending = getattr(_pending_tombstones, "rows", None)
+    if pending is not None:
+        pending.append(tombstone)
+    else:
+        tombstone.save()
+
+
+def record_subtask_tombstones(task_id, subtask_ids):
+    now = timezone.now()
+    Tombstone.objects.bulk_create([
+        Tombstone(kind=TombstoneKind.SUBTASK, object_id=subtask_id, task_id=task_id, deleted_at=now)
+        for subtask_id in subtask_ids
+    ])
+
+
+def get_deleted_task_ids(user, since):
+    """Tasks the user lost access to (membership removed or task deleted)."""
+    task_ids = set(
+        Tombstone.objects.filter(
+            kind=TombstoneKind.MEMBERSHIP, user_id=user.id, deleted_at__gte=since
+        ).values_list("task_id", flat=True)
+    )
+    if task_ids:
+        # Re-added since: the task is in the changed rows instead.
+        task_ids -= set(
+            UserTask.objects.filter(user=user, task_id__in=task_ids).values_list("task_id", flat=True)
+        )
+    return sorted(task_ids)
+
+
+def get_deleted_subtask_ids(task_id, since):
+    return sorted(
+        Tombstone.objects.filter(
+            kind=TombstoneKind.SUBTASK, task_id=task_id, deleted_at__gte=since
+        ).values_list("object_id", flat=True)
+    )
+
+
+def get_deleted_membership_ids(task_id, since):
+    return sorted(
+        Tombstone.objects.filter(
+            kind=TombstoneKind.MEMBERSHIP, task_id=task_id, deleted_at__gte=since
+        ).values_list("object_id", flat=True)
+    )
+
+
+def prune_tombstones(batch_size=1000):
+    """Delete tombstones past the retention window in batches; return the count."""
+    cutoff = timezone.now() - get_tombstone_retention()
+    deleted = 0
+    while True:
+        ids = list(
+            Tombstone.objects.filter(deleted_at__lt=cutoff).values_list("id", flat=True)[:batch_size]
+        )
+        if not ids:
+            return deleted
+        deleted += Tombstone.objects.filter(id__in=ids).delete()[0]
@@ -1,7 +1,18 @@
+from collections import defaultdict
+
+from django.conf import settings
 from django.db import transaction
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
 
-from api_app.models import UserTask, UserTaskRole
-from api_app.tasks import notify_task_created
+from api_app.caching import invalidate_dashboards, invalidate_role
+from api_app.models import Task, UserTask, UserTaskRole
+from api_app.services.dashboard_service import invalidate_task_dashboards
+from api_app.services.notification_service import get_coalesce_window
+from api_app.services.outbox_service import enqueue
+from api_app.services.sync_service import batched_membership_tombstones
+from api_app.tasks import notify_tasks_created
+from api_app.utils import is_id
 
 
 def create_task_for_user(serializer, user):
@@ -12,7 +23,165 @@ def create_task_for_user(serializer, user):
             user=user,
             defaults={"role": UserTaskRole.OWNER},
         )
+        enqueue(notify_tasks_created, [task.id], delay=get_coalesce_window())
 
-    notify_task_created.delay(task.id)
     return task
 
+
+def ensure_bulk_size(items):
+    limit = getattr(settings, "TASK_BULK_MAX_ITEMS", 1000)
+    if not isinstance(items, list) or not items:
+        raise ValidationError({"detail": "Expected a non-empty list."})
+    if len(items) > limit:
+        raise ValidationError({"detail": f"At most {limit} items per request."})
+
+
+def bulk_create_tasks_for_user(serializer, user):
+    """
+    Insert validated tasks and their Owner memberships with two bulk INSERTs.
+
+    bulk_create skips Task.save() and post_save, so timestamps, the owner
+    membership and role cache invalidation are handled here.
+    """
+    now = timezone.now()
+    tasks = [
+        Task(**attrs, assigned_by=user, created_at=now, updated_at=now)
+        for attrs in serializer.validated_data
+    ]
+    with transaction.atomic():
+        Task.objects.bulk_create(tasks)
+        UserTask.objects.bulk_create(
+            [UserTask(task=task, user=user, role=UserTaskRole.OWNER) for task in tasks]
+        )
+
+        enqueue(notify_tasks_created, [task.id for task in tasks], delay=get_coalesce_window())
+
+    for task in tasks:
+        invalidate_role(user.pk, task.id)
+    invalidate_dashboards([user.pk])
+    return tasks
+
+
+def _roles_for_tasks(user, task_ids):
+    """
+    The user's role per task, with the membership rows locked so the role
+    cannot change before the caller's transaction commits. Call it inside
+    transaction.atomic().
+    """
+    return dict(
+        UserTask.objects.filter(user=user, task_id__in=task_ids)
+        .select_for_update()
+        .order_by("task_id")
+        .values_list("task_id", "role")
+    )
+
+
+def _item_id(item):
+    if not isinstance(item, dict):
+        return None
+    task_id = item.get("id")
+    return task_id if is_id(task_id) else None
+
+
+def bulk_update_tasks_for_user(items, user, serializer_class, context):
+    """
+    Partially update many tasks in one transaction (Owner/Assigned only).
+
+    All-or-nothing: if any item is invalid or not editable, nothing is written
+    and ValidationError carries a per-item error list aligned with the input.
+    The caller's memberships and the tasks are read under a row lock inside
+    the transaction.
+    """
+    ids = [_item_id(item) for item in items]
+    known_ids = [task_id for task_id in ids if task_id is not None]
+    if len(set(known_ids)) != len(known_ids):
+        raise ValidationError({"detail": "Each task may appear only once."})
+
+    with transaction.atomic():
+        roles = _roles_for_tasks(user, known_ids)
+        editable = {
+            task_id for task_id, role in roles.items()
+            if role in (UserTaskRole.OWNER, UserTaskRole.ASSIGNED)
+        }
+
+        # Locked so that each row's changes apply to its current values.
+        tasks = (
+            Task.objects.select_related("assigned_by")
+            .select_for_update(of=("self",))
+            .order_by("id")
+            .in_bulk(editable)
+        )
+
+        errors = []
+        serializers = []
+        for item, task_id in zip(items, ids):
+            if task_id is None:
+                errors.append({"id": ["A valid integer is required."]})
+                continue
+            if task_id not in roles:
+                errors.append({"id": ["Task not found."]})
+                continue
+            if task_id not in editable:
+                errors.append({"detail": "You don't have permission to update this task."})
+                continue
+            data = {key: value for key, value in item.items() if key != "id"}
+            serializer = serializer_class(tasks[task_id], data=data, partial=True, context=context)
+            if serializer.is_valid():
+                serializers.append(serializer)
+                errors.append({})
+            else:
+                errors.append(serializer.errors)
+
+        if any(errors):
+            raise ValidationError(errors)
+
+        # Like TaskSerializer.update, each row writes only the columns it
+        # changes; rows are grouped so a status-only edit leaves the title,
+        # deadline and priority columns alone.
+        now = timezone.now()
+        groups = defaultdict(list)
+        for serializer in serializers:
+            task = serializer.instance
+            changed = {
+                attr for attr, value in serializer.validated_data.items() if getattr(task, attr) != value
+            }
+            for attr in changed:
+                setattr(task, attr, serializer.validated_data[attr])
+            task.updated_at = now
+            groups[frozenset(changed | {"updated_at"})].append(task)
+        for fields, rows in groups.items():
+            Task.objects.bulk_update(rows, sorted(fields))
+
+    updated = [serializer.instance for serializer in serializers]
+    dashboard_ids = [
+        task.id for fields, rows in groups.items() if Task.DASHBOARD_FIELDS & fields for task in rows
+    ]
+    if dashboard_ids:
+        invalidate_task_dashboards(dashboard_ids)
+    return updated, roles
+
+
+def delete_task(task):
+    """Delete a task; the tombstones of its memberships are written in one INSERT."""
+    with transaction.atomic(), batched_membership_tombstones():
+        task.delete()
+
+
+def bulk_delete_tasks_for_user(task_ids, user):
+    """
+    Delete many tasks at once (Owner only); all-or-nothing like bulk update.
+    Ownership is checked on locked membership rows in the deleting transaction.
+    """
+    with transaction.atomic(), batched_membership_tombstones():
+        roles = _roles_for_tasks(user, task_ids)
+        errors = {}
+        for task_id in task_ids:
+            role = roles.get(task_id)
+            if role is None:
+                errors[str(task_id)] = "Task not found."
+            elif role != UserTaskRole.OWNER:
+                errors[str(task_id)] = "Only the owner can delete this task."
+        if errors:
+            raise ValidationError({"ids": errors})
+
+        Task.objects.filter(id__in=task_ids).delete()
@@ -0,0 +1,138 @@
+import threading
+import time
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+
+from api_app.caching import BloomFilter
+
+REVOCATION_FILTER_ERROR_RATE = 0.01
+
+
+def prune_expired_tokens(batch_size=None, max_batches=None):
+    """
+    Delete expired outstanding tokens (and their blacklist rows) in batches;
+    return the number of outstanding tokens deleted.
+
+    A token past its `exp` fails signature verification before the blacklist
+    is consulted, so its rows are no longer needed.
+    """
+    batch_size = batch_size or getattr(settings, "TOKEN_PRUNE_BATCH_SIZE", 1000)
+    now = timezone.now()
+    deleted = 0
+    batches = 0
+    while max_batches is None or batches < max_batches:
+        batches += 1
+        # Tokens expire in roughly id order, so walking the primary key finds
+        # a batch near the start of the table without an index on expires_at.
+        ids = list(
+            OutstandingToken.objects.filter(expires_at__lte=now)
+            .order_by("id")
+            .values_list("id", flat=True)[:batch_size]
+        )
+        if not ids:
+            break
+        BlacklistedToken.objects.filter(token_id__in=ids).delete()
+        deleted += OutstandingToken.objects.filter(id__in=ids).delete()[0]
+    return deleted
+
+
+class RevocationFilter:
+    """
+    Bloom filter of blacklisted refresh-token jtis in front of the blacklist
+    table. A miss means "not revoked" without a query; a hit is confirmed
+    against the table.
+
+    Logouts in this process are added immediately. Logouts in other processes
+    are picked up by an incremental read every `sync_interval` seconds, which
+    is how long a token revoked elsewhere can still be refreshed here.
+    """
+
+    def __init__(self, capacity, sync_interval):
+        self.capacity = capacity
+        self.sync_interval = sync_interval
+        self._lock = threading.Lock()
+        self._bloom = None
+        self._synced_at = 0.0
+        self._seen_id = 0
+        self._previous_seen_id = 0
+
+    def _rebuild(self):
+        rows = list(
+            BlacklistedToken.objects.filter(token__expires_at__gt=timezone.now()).values_list("id", "token__jti")
+        )
+        self._bloom = BloomFilter(max(self.capacity, 2 * len(rows)), REVOCATION_FILTER_ERROR_RATE)
+        self._previous_seen_id = self._seen_id = 0
+        self._add_rows(rows)
+
+    def _sync(self):
+        # Re-read the rows seen by the previous sync too: a blacklist insert
+        # whose transaction committed late has an id below the newest one.
+        rows = BlacklistedToken.objects.filter(id__gt=self._previous_seen_id).values_list("id", "token__jti")
+        self._previous_seen_id = self._seen_id
+        self._add_rows(rows)
+        if self._bloom.count > self._bloom.capacity:
+            self._rebuild()
+
+    def _add_rows(self, rows):
+        for row_id, jti in rows:
+            self._bloom.add(jti)
+            self._seen_id = max(self._seen_id, row_id)
+        self._synced_at = time.monotonic()
+
+    def add(self, jti):
+        with self._lock:
+            if self._bloom is not None:
+                self._bloom.add(jti)
+
+    def might_contain(self, jti):
+        with self._lock:
+            if self._bloom is None:
+                self._rebuild()
+            elif time.monotonic() - self._synced_at >= self.sync_interval:
+                self._sync()
+            return jti in self._bloom
+
+
+_revocation_filter = None
+_revocation_filter_lock = threading.Lock()
+
+
+def get_revocation_filter():
+    """The per-process RevocationFilter, or None unless TOKEN_REVOCATION_FILTER is on."""
+    global _revocation_filter
+    if not getattr(settings, "TOKEN_REVOCATION_FILTER", False):
+        return None
+    if _revocation_filter is None:
+        with _revocation_filter_lock:
+            if _revocation_filter is None:
+                _revocation_filter = RevocationFilter(
+                    getattr(settings, "TOKEN_REVOCATION_FILTER_CAPACITY", 100000),
+                    getattr(settings, "TOKEN_REVOCATION_FILTER_SYNC_INTERVAL", 5),
+                )
+    return _revocation_filter
+
+
+def is_token_revoked(jti):
+    """Whether the refresh token `jti` is blacklisted, skipping the query when the filter rules it out."""
+    revocation_filter = get_revocation_filter()
+    if revocation_filter is not None and not revocation_filter.might_contain(jti):
+        return False
+    return BlacklistedToken.objects.filter(token__jti=jti).exists()
+
+
+def record_revocation(jti):
+    revocation_filter = get_revocation_filter()
+    if revocation_filter is not None:
+        revocation_filter.add(jti)
+
+
+@receiver(setting_changed)
+def reset_revocation_filter(setting, **kwargs):
+    global _revocation_filter
+    if setting.startswith("TOKEN_REVOCATION_FILTER"):
+        with _revocation_filter_lock:
+            _revocation_filter = None
@@ -0,0 +1,45 @@
+import hashlib
+
+from django.db.models import Q
+
+from api_app.caching import MISS, get_user_search_cache
+
+
+def filter_users(queryset, params):
+    """
+    `?q=` autocomplete: active users whose username or email starts with q
+    (case-insensitive). Served by the upper(...) text_pattern_ops indexes on
+    PostgreSQL (migration 0010).
+    """
+    if "q" not in params:
+        return queryset
+    query = params.get("q", "").strip()
+    if not query:
+        return queryset.none()
+    return queryset.filter(
+        Q(username__istartswith=query) | Q(email__istartswith=query), is_active=True
+    )
+
+
+def _cache_key(request):
+    params = request.query_params
+    raw = "|".join([
+        request.get_host(),
+        params.get("q", "").strip().lower(),
+        params.get("page_size", ""),
+        params.get("cursor", ""),
+    ])
+    return (hashlib.md5(raw.encode("utf-8"), usedforsecurity=False).hexdigest(),)
+
+
+def cached_user_search(request, render):
+    """Return the cached page for this query, or render() and cache it."""
+    cache = get_user_search_cache()
+    if cache is None:
+        return render()
+    key = _cache_key(request)
+    data = cache.get(key)
+    if data is MISS:
+        data = render()
+        cache.set(key, data)
+    return data
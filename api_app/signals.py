@@ -1,7 +1,17 @@
-from django.db.models.signals import post_save
+from django.contrib.auth import get_user_model
+from django.db import connections
+from django.db.models.signals import post_delete, post_migrate, post_save
 from django.dispatch import receiver
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
 
-from .models import Task, UserTask, UserTaskRole
+from .caching import invalidate_dashboards, invalidate_role_on_commit, invalidate_user_fields
+from .services.dashboard_service import invalidate_task_dashboards
+from .services.search_service import restore_sqlite_search
+from .services.subtask_service import adjust_subtask_counters, done_count
+from .services.sync_service import record_membership_tombstone
+from .services.token_service import record_revocation
+from .models import Subtask, Task, TokenUser, UserTask, UserTaskRole
 
 
 @receiver(post_save, sender=Task)
@@ -18,3 +28,80 @@ def ensure_task_owner(sender, instance: Task, created: bool, **kwargs):
         user=instance.assigned_by,
         defaults={"role": UserTaskRole.OWNER},
     )
+
+
+@receiver(post_save, sender=UserTask)
+@receiver(post_delete, sender=UserTask)
+def invalidate_cached_role(sender, instance: UserTask, **kwargs):
+    # Also runs for rows removed by cascade (task or user deletion).
+    # Queryset.update()/bulk_create() bypass signals and must invalidate explicitly.
+    invalidate_role_on_commit(instance.user_id, instance.task_id)
+
+
+@receiver(post_save, sender=UserTask)
+@receiver(post_delete, sender=UserTask)
+def invalidate_member_dashboard(sender, instance: UserTask, **kwargs):
+    invalidate_dashboards([instance.user_id])
+
+
+@receiver(post_save, sender=Task)
+def invalidate_task_dashboards_on_save(sender, instance: Task, created: bool, update_fields=None, **kwargs):
+    # A new task reaches dashboards through its owner membership.
+    if created or kwargs.get("raw", False):
+        return
+    # TaskSerializer.update saves only the fields that changed.
+    if update_fields is not None and not Task.DASHBOARD_FIELDS & update_fields:
+        return
+    invalidate_task_dashboards([instance.id])
+
+
+@receiver(post_delete, sender=UserTask)
+def record_membership_deletion(sender, instance: UserTask, **kwargs):
+    # Covers removal from a task and deletion of the task itself (cascade).
+    record_membership_tombstone(instance)
+
+
+@receiver(post_save, sender=Subtask)
+def count_created_subtask(sender, instance: Subtask, created: bool, **kwargs):
+    # Status changes and deletes adjust the counters in subtask_service, where
+    # the previous status is read under a row lock; bulk_create() bypasses
+    # signals and adjusts explicitly. repair_subtask_counters fixes any drift.
+    if kwargs.get("raw", False) or not created:
+        return
+    adjust_subtask_counters(instance.task_id, total=1, done=done_count(instance.status))
+
+
+@receiver(post_save, sender=get_user_model())
+@receiver(post_delete, sender=get_user_model())
+@receiver(post_save, sender=TokenUser)
+@receiver(post_delete, sender=TokenUser)
+def invalidate_token_user(sender, instance, **kwargs):
+    # Other processes see the change once their TOKEN_USER_CACHE_TTL runs out.
+    invalidate_user_fields(instance.pk)
+
+
+@receiver(post_save, sender=get_user_model())
+@receiver(post_save, sender=TokenUser)
+def touch_member_rows(sender, instance, created: bool, update_fields=None, **kwargs):
+    # Membership rows show the member's username and email. Moving their
+    # updated_at lets the membership list ETag (count + max(updated_at)) and
+    # delta sync see a rename without reading the users. Logins and password
+    # re-hashes save other fields only.
+    if created or kwargs.get("raw", False):
+        return
+    if update_fields is not None and not {"username", "email"} & set(update_fields):
+        return
+    UserTask.objects.filter(user_id=instance.pk).update(updated_at=timezone.now())
+
+
+@receiver(post_save, sender=BlacklistedToken)
+def add_revoked_token(sender, instance: BlacklistedToken, created: bool, **kwargs):
+    if created:
+        record_revocation(instance.token.jti)
+
+
+@receiver(post_migrate)
+def restore_search_triggers(sender, using, **kwargs):
+    # post_migrate is sent once per app after all migrations have run.
+    if sender.name == "api_app":
+        restore_sqlite_search(connections[using])
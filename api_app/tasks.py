@@ -1,12 +1,51 @@
-import time
 from celery import shared_task
 
+from api_app.services.notification_service import send_task_created_notifications
+from api_app.services.outbox_service import relay_outbox as relay_outbox_messages
+from api_app.services.reminder_service import send_deadline_reminders as send_due_reminders
+from api_app.services.sync_service import prune_tombstones
+from api_app.services.token_service import prune_expired_tokens as prune_tokens
+
+
 @shared_task
 def notify_task_created(task_id: int) -> dict:
     """
-    Example async job: simulates sending a notification after task creation.
-    Using sleep to visibly demonstrate background execution.
+    Single-task notification, kept for messages enqueued before batching.
+    New code enqueues notify_tasks_created instead.
+    """
+    return notify_tasks_created([task_id])
+
+
+@shared_task
+def notify_tasks_created(task_ids: list) -> dict:
+    """
+    Notify every member of the given tasks, one digest per recipient.
+
+    The outbox relay merges pending calls into messages of up to
+    NOTIFICATION_BATCH_SIZE ids, so a bulk import is a handful of messages.
     """
-    time.sleep(2)
-    print(f"[celery] Task created notification sent for task_id={task_id}")
-    return {"task_id": task_id, "status": "sent"}
+    return {"status": "sent", **send_task_created_notifications(task_ids)}
+
+
+@shared_task
+def relay_outbox() -> dict:
+    """Periodic (beat) job: publish pending outbox messages to the broker."""
+    return {"published": relay_outbox_messages()}
+
+
+@shared_task
+def send_deadline_reminders() -> dict:
+    """Periodic (beat) job: remind members of open tasks that are due soon."""
+    return send_due_reminders()
+
+
+@shared_task
+def prune_expired_tokens() -> dict:
+    """Periodic (beat) job: delete expired outstanding/blacklisted JWT rows."""
+    return {"deleted": prune_tokens()}
+
+
+@shared_task
+def prune_old_tombstones() -> dict:
+    """Periodic (beat) job: delete delta-sync tombstones past their retention."""
+    return {"deleted": prune_tombstones()}
@@ -0,0 +1,211 @@
+import io
+import threading
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management import call_command
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient, APIRequestFactory
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+
+from api_app.authentication import StatelessJWTAuthentication
+from api_app.caching import invalidate_user_fields
+from api_app.hashers import run_hashing
+from api_app.models import TokenUser
+from api_app.utils import sign_token
+
+
+class StatelessAuthenticationTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.password = "TestPass123!"
+        self.user = get_user_model().objects.create_user(
+            username="stateless", email="stateless@example.com", password=self.password
+        )
+        invalidate_user_fields(self.user.pk)
+        self.factory = APIRequestFactory()
+
+    def authenticate(self, access):
+        request = self.factory.get("/api/tasks/", HTTP_AUTHORIZATION=f"Bearer {access}")
+        return StatelessJWTAuthentication().authenticate(request)[0]
+
+    def test_user_is_built_from_claims_without_a_query(self):
+        access = sign_token(self.user)["access"]
+        with self.assertNumQueries(0):
+            user = self.authenticate(access)
+            self.assertIsInstance(user, TokenUser)
+            self.assertEqual((user.pk, user.username, user.is_staff), (self.user.pk, "stateless", False))
+
+    def test_other_fields_load_once_and_are_cached(self):
+        access = sign_token(self.user)["access"]
+        user = self.authenticate(access)
+        with self.assertNumQueries(1):
+            self.assertEqual(user.email, "stateless@example.com")
+            self.assertIsNotNone(user.date_joined)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.authenticate(access).email, "stateless@example.com")
+
+    def test_tokens_without_claims_fall_back_to_database(self):
+        access = str(AccessToken.for_user(self.user))
+        with self.assertNumQueries(1):
+            user = self.authenticate(access)
+        self.assertNotIsInstance(user, TokenUser)
+        self.assertEqual(user.pk, self.user.pk)
+
+    def test_profile_and_account_deletion_use_current_password(self):
+        access = sign_token(self.user)["access"]
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {access}")
+        self.assertEqual(self.client.get("/api/profile/").data["email"], "stateless@example.com")
+
+        self.user.set_password("Changed123!")
+        self.user.save()
+        res = self.client.delete("/api/profile/", {"password": self.password}, format="json")
+        self.assertEqual(res.status_code, 400, res.content)
+        res = self.client.delete("/api/profile/", {"password": "Changed123!"}, format="json")
+        self.assertEqual(res.status_code, 204, res.content)
+        self.assertFalse(get_user_model().objects.filter(pk=self.user.pk).exists())
+
+    def test_schema_documents_the_bearer_scheme(self):
+        schema = self.client.get("/api/schema/", {"format": "json"}).json()
+        self.assertEqual(schema["components"]["securitySchemes"]["jwtAuth"]["scheme"], "bearer")
+        self.assertIn({"jwtAuth": []}, schema["paths"]["/api/tasks/"]["get"]["security"])
+
+
+class DeletedAccountTokenTests(TransactionTestCase):
+    # Foreign keys are checked when the write commits, which TestCase never does.
+
+    def test_access_token_of_deleted_account_gets_401(self):
+        password = "TestPass123!"
+        user = get_user_model().objects.create_user(username="deleted", password=password)
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {sign_token(user)['access']}")
+        res = client.delete("/api/profile/", {"password": password}, format="json")
+        self.assertEqual(res.status_code, 204, res.content)
+
+        res = client.post(
+            "/api/tasks/", {"title": "Orphan", "deadline": "2026-01-01", "priority": "Low"}, format="json"
+        )
+        self.assertEqual(res.status_code, 401, res.content)
+        self.assertEqual(client.get("/api/profile/").status_code, 401)
+        self.assertEqual(client.get("/api/tasks/").status_code, 200)
+
+
+class PasswordHashingTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.password = "TestPass123!"
+        self.user = get_user_model().objects.create_user(username="hasher", password=self.password)
+
+    def login(self):
+        return self.client.post(
+            "/api/login/", {"username": "hasher", "password": self.password}, format="json"
+        )
+
+    @override_settings(PBKDF2_ITERATIONS=1000)
+    def test_login_rehashes_when_cost_changes(self):
+        self.assertEqual(self.login().status_code, 200)
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.password.startswith("pbkdf2_sha256$1000$"))
+
+    def test_login_upgrades_to_configured_algorithm(self):
+        hashers = ["api_app.hashers.ScryptPasswordHasher", "api_app.hashers.PBKDF2PasswordHasher"]
+        with override_settings(PASSWORD_HASHERS=hashers):
+            self.assertEqual(self.login().status_code, 200)
+            self.user.refresh_from_db()
+            self.assertTrue(self.user.password.startswith("scrypt$"))
+            self.assertEqual(self.login().status_code, 200)
+
+    def test_login_upgrades_legacy_django_hashes(self):
+        self.user.password = make_password(self.password, hasher="pbkdf2_sha1")
+        self.user.save(update_fields=["password"])
+        self.assertEqual(self.login().status_code, 200)
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.password.startswith("pbkdf2_sha256$"))
+
+    @override_settings(PASSWORD_HASH_WORKERS=1, PASSWORD_HASH_QUEUE_SIZE=0)
+    def test_full_hashing_pool_answers_503(self):
+        started, release = threading.Event(), threading.Event()
+
+        def occupy():
+            started.set()
+            release.wait(5)
+
+        blocker = threading.Thread(target=run_hashing, args=(occupy,))
+        blocker.start()
+        started.wait(5)
+        try:
+            res = self.login()
+            self.assertEqual(res.status_code, 503, res.content)
+            self.assertEqual(res["Retry-After"], "1")
+        finally:
+            release.set()
+            blocker.join()
+
+        self.assertEqual(self.login().status_code, 200)
+
+
+class TokenRevocationTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = get_user_model().objects.create_user(username="revoker", password="TestPass123!")
+
+    def refresh(self, token):
+        return self.client.post("/api/token/refresh/", {"refresh": token}, format="json")
+
+    def outstanding(self, token):
+        return OutstandingToken.objects.filter(jti=RefreshToken(token)["jti"])
+
+    def test_prune_deletes_only_expired_tokens(self):
+        live = sign_token(self.user)["refresh"]
+        expired = sign_token(self.user)["refresh"]
+        expired_row = self.outstanding(expired).get()
+        BlacklistedToken.objects.create(token=expired_row)
+        OutstandingToken.objects.filter(id=expired_row.id).update(expires_at=timezone.now() - timedelta(days=1))
+
+        out = io.StringIO()
+        call_command("prune_tokens", "--batch-size", "1", stdout=out)
+        self.assertIn("Deleted 1", out.getvalue())
+        self.assertEqual(list(OutstandingToken.objects.all()), list(self.outstanding(live)))
+        self.assertFalse(BlacklistedToken.objects.exists())
+
+    @override_settings(TOKEN_REVOCATION_FILTER=True)
+    def test_filter_skips_blacklist_query_and_still_rejects_logged_out_tokens(self):
+        tokens = sign_token(self.user)
+        self.assertEqual(self.refresh(tokens["refresh"]).status_code, 200)
+        # Filter built; a refresh is now only the user lookup.
+        with self.assertNumQueries(1):
+            self.assertEqual(self.refresh(tokens["refresh"]).status_code, 200)
+
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {tokens['access']}")
+        self.assertEqual(self.client.post("/api/logout/", {"refresh": tokens["refresh"]}, format="json").status_code, 200)
+        self.assertEqual(self.refresh(tokens["refresh"]).status_code, 401)
+
+    def test_refresh_restamps_claims_from_current_user(self):
+        self.user.is_staff = True
+        self.user.save()
+        token = sign_token(self.user)["refresh"]
+
+        self.user.is_staff = False
+        self.user.username = "renamed"
+        self.user.save()
+        res = self.refresh(token)
+        self.assertEqual(res.status_code, 200, res.content)
+        access = AccessToken(res.data["access"])
+        self.assertEqual((access["username"], access["is_staff"]), ("renamed", False))
+
+        self.user.is_active = False
+        self.user.save()
+        self.assertEqual(self.refresh(token).status_code, 401)
+
+    @override_settings(TOKEN_REVOCATION_FILTER=True, TOKEN_REVOCATION_FILTER_SYNC_INTERVAL=0)
+    def test_filter_picks_up_revocations_from_other_processes(self):
+        token = sign_token(self.user)["refresh"]
+        self.assertEqual(self.refresh(token).status_code, 200)
+        # Written behind this process's back, e.g. by another worker.
+        with mock.patch("api_app.signals.record_revocation"):
+            BlacklistedToken.objects.create(token=self.outstanding(token).get())
+        self.assertEqual(self.refresh(token).status_code, 401)
@@ -0,0 +1,54 @@
+import io
+import json
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+
+from api_app.models import Subtask, Task, UserTask, UserTaskRole
+from api_app.services.benchmark_service import percentile
+from api_app.services.load_data_service import generate_load_data
+
+
+class LoadDataTests(TestCase):
+    def test_generates_requested_volumes(self):
+        counts = generate_load_data(users=4, tasks_per_user=3, members_per_task=2, subtasks_per_task=2, batch_size=5)
+
+        self.assertEqual((counts["users"], counts["tasks"], counts["subtasks"]), (4, 12, 24))
+        self.assertEqual(get_user_model().objects.filter(username__startswith="load_user_").count(), 4)
+        self.assertEqual(Task.objects.count(), 12)
+        self.assertEqual(UserTask.objects.filter(role=UserTaskRole.OWNER).count(), 12)
+        self.assertEqual(UserTask.objects.exclude(role=UserTaskRole.OWNER).count(), 24)
+        self.assertFalse(Task.objects.exclude(subtask_total=2).exists())
+        self.assertTrue(self.client.login(username="load_user_000000", password="LoadTest123!"))
+
+    def test_same_seed_gives_same_data(self):
+        call_command("generate_load_data", "--users", "2", "--tasks-per-user", "2", "--prefix", "a", stdout=io.StringIO())
+        call_command("generate_load_data", "--users", "2", "--tasks-per-user", "2", "--prefix", "b", stdout=io.StringIO())
+        titles = list(Task.objects.order_by("id").values_list("title", flat=True))
+        self.assertEqual(titles[:4], titles[4:])
+
+
+class BenchmarkTests(TestCase):
+    def test_percentile_uses_nearest_rank(self):
+        values = list(range(1, 101))
+        self.assertEqual((percentile(values, 50), percentile(values, 95), percentile(values, 99)), (50, 95, 99))
+        self.assertEqual(percentile([7], 99), 7)
+
+    def test_benchmark_reports_every_endpoint_and_rolls_back_writes(self):
+        generate_load_data(users=3, tasks_per_user=2, members_per_task=1, subtasks_per_task=2)
+        before = (Task.objects.count(), Subtask.objects.count())
+
+        out = io.StringIO()
+        call_command("benchmark_api", "--requests", "2", "--warmup", "0", stdout=out, stderr=io.StringIO())
+        report = json.loads(out.getvalue())
+
+        endpoints = report["endpoints"]
+        self.assertIn("GET tasks_list_create", endpoints)
+        self.assertIn("POST task_subtasks", endpoints)
+        self.assertIn("GET subtask_detail", endpoints)
+        for name, stats in endpoints.items():
+            self.assertEqual(stats["errors"], 0, name)
+            self.assertLessEqual(stats["p50_ms"], stats["p99_ms"], name)
+        self.assertGreater(endpoints["GET tasks_list_create"]["queries_per_request"], 0)
+        self.assertEqual((Task.objects.count(), Subtask.objects.count()), before)
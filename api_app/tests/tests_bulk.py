@@ -0,0 +1,264 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from api_app.models import Subtask, Task, TaskPriority, TaskStatus, UserTask, UserTaskRole
+
+
+class TaskBulkTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        User = get_user_model()
+
+        self.password = "TestPass123!"
+        self.owner = User.objects.create_user(username="owner_b", password=self.password)
+        self.viewer = User.objects.create_user(username="viewer_b", password=self.password)
+
+        self.task = Task.objects.create(
+            title="Existing",
+            deadline="2026-01-01",
+            priority=TaskPriority.LOW,
+            assigned_by=self.owner,
+        )
+        UserTask.objects.update_or_create(
+            task=self.task, user=self.viewer, defaults={"role": UserTaskRole.VIEWER}
+        )
+
+    def auth(self, user):
+        res = self.client.post(
+            "/api/login/",
+            {"username": user.username, "password": self.password},
+            format="json",
+        )
+        self.assertEqual(res.status_code, 200, res.content)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {res.data['access']}")
+
+    def test_bulk_create_creates_tasks_with_owner_membership(self):
+        self.auth(self.owner)
+        payload = [
+            {"title": f"Imported {i}", "deadline": "2026-02-01", "priority": TaskPriority.HIGH}
+            for i in range(3)
+        ]
+        res = self.client.post("/api/tasks/bulk/", payload, format="json")
+        self.assertEqual(res.status_code, 201, res.content)
+        self.assertEqual([item["title"] for item in res.data], [p["title"] for p in payload])
+        self.assertTrue(all(item["current_user_role"] == UserTaskRole.OWNER for item in res.data))
+
+        ids = [item["id"] for item in res.data]
+        self.assertEqual(
+            UserTask.objects.filter(task_id__in=ids, user=self.owner, role=UserTaskRole.OWNER).count(), 3
+        )
+
+    def test_bulk_create_is_all_or_nothing_with_per_item_errors(self):
+        self.auth(self.owner)
+        payload = [
+            {"title": "Valid", "deadline": "2026-02-01", "priority": TaskPriority.HIGH},
+            {"title": "Invalid", "deadline": "2026-02-01", "priority": "Urgent"},
+        ]
+        res = self.client.post("/api/tasks/bulk/", payload, format="json")
+        self.assertEqual(res.status_code, 400, res.content)
+        self.assertEqual(res.data[0], {})
+        self.assertIn("priority", res.data[1])
+        self.assertFalse(Task.objects.filter(title="Valid").exists())
+
+    def test_bulk_update_applies_changes(self):
+        self.auth(self.owner)
+        other = Task.objects.create(
+            title="Other", deadline="2026-01-01", priority=TaskPriority.LOW, assigned_by=self.owner
+        )
+        res = self.client.patch(
+            "/api/tasks/bulk/",
+            [
+                {"id": self.task.id, "status": TaskStatus.DONE},
+                {"id": other.id, "title": "Renamed"},
+            ],
+            format="json",
+        )
+        self.assertEqual(res.status_code, 200, res.content)
+        self.task.refresh_from_db()
+        other.refresh_from_db()
+        self.assertEqual(self.task.status, TaskStatus.DONE)
+        self.assertEqual(other.title, "Renamed")
+        self.assertGreater(other.updated_at, other.created_at)
+
+    def test_bulk_update_writes_only_changed_columns_per_task(self):
+        self.auth(self.owner)
+        other = Task.objects.create(
+            title="Other", deadline="2026-01-01", priority=TaskPriority.LOW, assigned_by=self.owner
+        )
+        with CaptureQueriesContext(connection) as queries:
+            res = self.client.patch(
+                "/api/tasks/bulk/",
+                [
+                    {"id": self.task.id, "status": TaskStatus.DONE, "title": "Existing"},
+                    {"id": other.id, "title": "Renamed"},
+                ],
+                format="json",
+            )
+        self.assertEqual(res.status_code, 200, res.content)
+        prefix = f'UPDATE "{Task._meta.db_table}"'
+        updates = [query["sql"] for query in queries.captured_queries if query["sql"].startswith(prefix)]
+        self.assertEqual(len(updates), 2)
+        # The unchanged title of the first task is not written with its status.
+        self.assertEqual(sorted(('"title"' in sql, '"status"' in sql) for sql in updates), [(False, True), (True, False)])
+
+    def test_bulk_update_rejects_viewer(self):
+        self.auth(self.viewer)
+        res = self.client.patch(
+            "/api/tasks/bulk/",
+            [{"id": self.task.id, "status": TaskStatus.DONE}],
+            format="json",
+        )
+        self.assertEqual(res.status_code, 400, res.content)
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.status, TaskStatus.TODO)
+
+    def test_bulk_update_rejects_non_integer_ids(self):
+        self.auth(self.owner)
+        res = self.client.patch(
+            "/api/tasks/bulk/",
+            [{"id": True, "title": "zz"}, {"id": str(self.task.id), "title": "zz"}],
+            format="json",
+        )
+        self.assertEqual(res.status_code, 400, res.content)
+        self.assertEqual([list(item) for item in res.data], [["id"], ["id"]])
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.title, "Existing")
+
+    def test_bulk_delete_requires_owner_for_every_task(self):
+        self.auth(self.viewer)
+        res = self.client.delete("/api/tasks/bulk/", {"ids": [self.task.id]}, format="json")
+        self.assertEqual(res.status_code, 400, res.content)
+        self.assertTrue(Task.objects.filter(id=self.task.id).exists())
+
+        self.auth(self.owner)
+        res = self.client.delete("/api/tasks/bulk/", {"ids": [self.task.id]}, format="json")
+        self.assertEqual(res.status_code, 204, res.content)
+        self.assertFalse(Task.objects.filter(id=self.task.id).exists())
+
+
+class SubtaskBatchTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        User = get_user_model()
+
+        self.password = "TestPass123!"
+        self.owner = User.objects.create_user(username="owner_sb", password=self.password)
+        self.assigned = User.objects.create_user(username="assigned_sb", password=self.password)
+
+        self.task = Task.objects.create(
+            title="Checklist",
+            deadline="2026-01-01",
+            priority=TaskPriority.MEDIUM,
+            assigned_by=self.owner,
+        )
+        UserTask.objects.update_or_create(
+            task=self.task, user=self.assigned, defaults={"role": UserTaskRole.ASSIGNED}
+        )
+        self.first = Subtask.objects.create(task=self.task, title="first")
+        self.second = Subtask.objects.create(task=self.task, title="second")
+        self.url = f"/api/tasks/{self.task.id}/subtasks/batch/"
+
+    def auth(self, user):
+        res = self.client.post(
+            "/api/login/",
+            {"username": user.username, "password": self.password},
+            format="json",
+        )
+        self.assertEqual(res.status_code, 200, res.content)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {res.data['access']}")
+
+    def test_assigned_can_create_update_and_reorder(self):
+        self.auth(self.assigned)
+        before = self.first.updated_at
+        res = self.client.post(
+            self.url,
+            {
+                "create": [{"title": "third"}, {"title": "fourth", "status": TaskStatus.DONE}],
+                "update": [{"id": self.first.id, "status": TaskStatus.DONE}],
+                "order": [self.second.id, self.first.id],
+            },
+            format="json",
+        )
+        self.assertEqual(res.status_code, 200, res.content)
+        self.assertEqual(len(res.data["created"]), 2)
+
+        self.first.refresh_from_db()
+        self.assertEqual(self.first.status, TaskStatus.DONE)
+        self.assertGreater(self.first.updated_at, before)
+
+        res = self.client.get(f"/api/tasks/{self.task.id}/subtasks/")
+        titles = [item["title"] for item in res.data]
+        self.assertEqual(titles[-2:], ["second", "first"])
+        self.assertEqual(len(titles), 4)
+
+    def test_partial_order_renumbers_the_unlisted_subtasks_after_it(self):
+        Subtask.objects.create(task=self.task, title="third")
+        self.auth(self.owner)
+        res = self.client.post(self.url, {"order": [self.first.id]}, format="json")
+        self.assertEqual(res.status_code, 200, res.content)
+
+        positions = dict(Subtask.objects.filter(task=self.task).values_list("title", "position"))
+        # The rest keep their previous list order (newest first) behind "first".
+        self.assertEqual(positions, {"first": 1, "third": 2, "second": 3})
+        titles = [item["title"] for item in self.client.get(f"/api/tasks/{self.task.id}/subtasks/").data]
+        self.assertEqual(titles, ["first", "third", "second"])
+
+    def test_rows_write_only_their_changed_columns(self):
+        self.auth(self.owner)
+        with CaptureQueriesContext(connection) as queries:
+            res = self.client.post(
+                self.url,
+                {
+                    "update": [{"id": self.first.id, "status": TaskStatus.DONE}],
+                    "order": [self.first.id, self.second.id],
+                },
+                format="json",
+            )
+        self.assertEqual(res.status_code, 200, res.content)
+        prefix = f'UPDATE "{Subtask._meta.db_table}"'
+        updates = [query["sql"] for query in queries.captured_queries if query["sql"].startswith(prefix)]
+        self.assertEqual(len(updates), 2)
+        self.assertFalse(any('"title"' in sql for sql in updates))
+        self.assertEqual(sum('"status"' in sql for sql in updates), 1)
+
+    def test_assigned_cannot_delete(self):
+        self.auth(self.assigned)
+        res = self.client.post(self.url, {"delete": [self.first.id]}, format="json")
+        self.assertEqual(res.status_code, 403, res.content)
+        self.assertTrue(Subtask.objects.filter(id=self.first.id).exists())
+
+    def test_invalid_item_rolls_back_whole_batch(self):
+        self.auth(self.owner)
+        res = self.client.post(
+            self.url,
+            {
+                "create": [{"title": "ok"}],
+                "update": [{"id": self.first.id, "status": "Blocked"}],
+                "delete": [self.second.id],
+            },
+            format="json",
+        )
+        self.assertEqual(res.status_code, 400, res.content)
+        self.assertIn("update", res.data)
+        self.assertTrue(Subtask.objects.filter(id=self.second.id).exists())
+        self.assertFalse(Subtask.objects.filter(title="ok").exists())
+
+    def test_boolean_ids_are_rejected(self):
+        self.auth(self.owner)
+        for payload in ({"order": [True]}, {"delete": [False]}, {"update": [{"id": True, "title": "zz"}]}):
+            res = self.client.post(self.url, payload, format="json")
+            self.assertEqual(res.status_code, 400, (payload, res.content))
+        self.assertEqual(Subtask.objects.filter(task=self.task, title="zz").count(), 0)
+
+    def test_subtasks_of_other_tasks_are_rejected(self):
+        other = Task.objects.create(
+            title="Other", deadline="2026-01-01", priority=TaskPriority.LOW, assigned_by=self.owner
+        )
+        foreign = Subtask.objects.create(task=other, title="foreign")
+        self.auth(self.owner)
+        res = self.client.post(self.url, {"delete": [foreign.id]}, format="json")
+        self.assertEqual(res.status_code, 400, res.content)
+        self.assertTrue(Subtask.objects.filter(id=foreign.id).exists())
@@ -0,0 +1,127 @@
+import time
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.utils.http import http_date
+from rest_framework.test import APIClient
+
+from api_app.models import Subtask, Task, TaskPriority, TaskStatus, UserTask, UserTaskRole
+
+
+class ConditionalRequestTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        User = get_user_model()
+
+        self.password = "TestPass123!"
+        self.owner = User.objects.create_user(username="owner_e", password=self.password)
+        self.viewer = User.objects.create_user(username="viewer_e", password=self.password)
+
+        self.task = Task.objects.create(
+            title="Polled task",
+            deadline="2026-01-01",
+            priority=TaskPriority.MEDIUM,
+            assigned_by=self.owner,
+        )
+        UserTask.objects.update_or_create(
+            task=self.task, user=self.viewer, defaults={"role": UserTaskRole.VIEWER}
+        )
+        self.subtask = Subtask.objects.create(task=self.task, title="sub")
+
+    def auth(self, user):
+        res = self.client.post(
+            "/api/login/",
+            {"username": user.username, "password": self.password},
+            format="json",
+        )
+        self.assertEqual(res.status_code, 200, res.content)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {res.data['access']}")
+
+    def test_task_detail_returns_304_until_changed(self):
+        self.auth(self.owner)
+        url = f"/api/tasks/{self.task.id}/"
+        res = self.client.get(url)
+        self.assertEqual(res.status_code, 200, res.content)
+        etag = res["ETag"]
+        self.assertTrue(res.has_header("Last-Modified"))
+
+        res = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(res.status_code, 304)
+        self.assertEqual(res["ETag"], etag)
+
+        self.task.title = "Changed"
+        self.task.save()
+        res = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(res.status_code, 200, res.content)
+        self.assertNotEqual(res["ETag"], etag)
+
+    def test_etag_differs_per_role(self):
+        url = f"/api/tasks/{self.task.id}/"
+        self.auth(self.owner)
+        owner_etag = self.client.get(url)["ETag"]
+        self.auth(self.viewer)
+        res = self.client.get(url, HTTP_IF_NONE_MATCH=owner_etag)
+        self.assertEqual(res.status_code, 200, res.content)
+
+    def test_patch_with_stale_if_match_returns_412(self):
+        self.auth(self.owner)
+        url = f"/api/tasks/{self.task.id}/"
+        etag = self.client.get(url)["ETag"]
+
+        res = self.client.patch(url, {"status": TaskStatus.DONE}, format="json", HTTP_IF_MATCH=etag)
+        self.assertEqual(res.status_code, 200, res.content)
+        self.assertNotEqual(res["ETag"], etag)
+
+        res = self.client.patch(url, {"status": TaskStatus.TODO}, format="json", HTTP_IF_MATCH=etag)
+        self.assertEqual(res.status_code, 412)
+        res = self.client.delete(url, HTTP_IF_MATCH=etag)
+        self.assertEqual(res.status_code, 412)
+        self.assertTrue(Task.objects.filter(id=self.task.id).exists())
+
+    def test_subtask_list_etag_tracks_changes(self):
+        self.auth(self.viewer)
+        url = f"/api/tasks/{self.task.id}/subtasks/"
+        etag = self.client.get(url)["ETag"]
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        Subtask.objects.create(task=self.task, title="another")
+        res = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(res.status_code, 200, res.content)
+        self.assertEqual(len(res.data), 2)
+
+    def test_membership_list_etag_tracks_removal(self):
+        self.auth(self.owner)
+        url = f"/api/tasks/{self.task.id}/memberships/"
+        etag = self.client.get(url)["ETag"]
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        UserTask.objects.get(task=self.task, user=self.viewer).delete()
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_membership_list_etag_tracks_member_renames(self):
+        self.auth(self.owner)
+        url = f"/api/tasks/{self.task.id}/memberships/"
+        res = self.client.get(url)
+        self.assertNotIn("Last-Modified", res)
+        etag = res["ETag"]
+
+        self.viewer.email = "viewer_e@example.com"
+        self.viewer.save()
+        res = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(res.status_code, 200, res.content)
+        self.assertIn("viewer_e@example.com", [item["user"]["email"] for item in res.data])
+
+    def test_subtask_list_ignores_if_modified_since_after_delete(self):
+        newest = Subtask.objects.create(task=self.task, title="newest")
+        self.auth(self.owner)
+        url = f"/api/tasks/{self.task.id}/subtasks/"
+        res = self.client.get(url)
+        self.assertNotIn("Last-Modified", res)
+        etag = res["ETag"]
+
+        res = self.client.delete(f"/api/subtasks/{newest.id}/")
+        self.assertEqual(res.status_code, 204, res.content)
+        res = self.client.get(url, HTTP_IF_MODIFIED_SINCE=http_date(time.time() + 60))
+        self.assertEqual(res.status_code, 200, res.content)
+        self.assertEqual([item["id"] for item in res.data], [self.subtask.id])
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
@@ -0,0 +1,88 @@
+from datetime import date, timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from api_app.caching import MISS, cache_dashboard, get_cached_dashboard
+from api_app.models import Task, TaskPriority, TaskStatus, UserTask, UserTaskRole
+from api_app.services.dashboard_service import compute_dashboard
+
+
+class DashboardTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        User = get_user_model()
+
+        self.password = "TestPass123!"
+        self.owner = User.objects.create_user(username="owner_d", password=self.password)
+        self.viewer = User.objects.create_user(username="viewer_d", password=self.password)
+
+        today = timezone.localdate()
+        self.overdue = self.make_task("Overdue", today - timedelta(days=3), TaskPriority.HIGH)
+        self.done = self.make_task("Done", today - timedelta(days=3), TaskPriority.LOW, TaskStatus.DONE)
+        self.later = self.make_task("Later", today + timedelta(days=30), TaskPriority.LOW)
+        UserTask.objects.update_or_create(
+            task=self.later, user=self.viewer, defaults={"role": UserTaskRole.VIEWER}
+        )
+
+    def make_task(self, title, deadline, priority, status=TaskStatus.TODO):
+        return Task.objects.create(
+            title=title, deadline=deadline, priority=priority, status=status, assigned_by=self.owner
+        )
+
+    def auth(self, user):
+        res = self.client.post(
+            "/api/login/",
+            {"username": user.username, "password": self.password},
+            format="json",
+        )
+        self.assertEqual(res.status_code, 200, res.content)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {res.data['access']}")
+
+    def test_counts_for_owner(self):
+        self.auth(self.owner)
+        res = self.client.get("/api/dashboard/")
+        self.assertEqual(res.status_code, 200, res.content)
+        self.assertEqual(res.data["total"], 3)
+        self.assertEqual(res.data["by_status"], {"To do": 2, "In progress": 0, "Done": 1})
+        self.assertEqual(res.data["by_priority"], {"Low": 2, "Medium": 0, "High": 1})
+        self.assertEqual(res.data["by_role"], {"Owner": 3, "Assigned": 0, "Viewer": 0})
+        self.assertEqual(res.data["overdue"], 1)
+
+    def test_due_this_week_runs_through_sunday(self):
+        monday = date(2026, 3, 9)
+        self.make_task("Sunday", date(2026, 3, 15), TaskPriority.LOW)
+        self.make_task("Next Monday", date(2026, 3, 16), TaskPriority.LOW)
+        self.assertEqual(compute_dashboard(self.owner, monday)["due_this_week"], 1)
+
+    @override_settings(DASHBOARD_CACHE_TTL=60)
+    def test_cached_until_task_or_membership_changes(self):
+        self.auth(self.viewer)
+        self.assertEqual(self.client.get("/api/dashboard/").data["by_status"]["To do"], 1)
+        with self.assertNumQueries(0):
+            self.client.get("/api/dashboard/")
+
+        self.later.title = "Renamed"
+        self.later.save(update_fields=["title"])
+        with self.assertNumQueries(0):
+            self.client.get("/api/dashboard/")
+
+        self.later.status = TaskStatus.DONE
+        self.later.save(update_fields=["status"])
+        self.assertEqual(self.client.get("/api/dashboard/").data["by_status"]["Done"], 1)
+
+        UserTask.objects.filter(task=self.later, user=self.viewer).delete()
+        self.assertEqual(self.client.get("/api/dashboard/").data["total"], 0)
+
+    @override_settings(DASHBOARD_CACHE_TTL=60)
+    def test_dashboard_cached_before_commit_is_invalidated_after(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.later.status = TaskStatus.DONE
+            self.later.save(update_fields=["status"])
+            # A concurrent request caches counts from before the commit.
+            cache_dashboard(self.viewer.id, {"total": 1})
+        self.assertIs(get_cached_dashboard(self.viewer.id), MISS)
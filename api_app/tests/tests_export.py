@@ -0,0 +1,187 @@
+import csv
+import io
+import json
+import os
+import tempfile
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from api_app.models import Subtask, Task, TaskPriority, UserTask, UserTaskRole
+from api_app.services.import_service import TaskImporter
+
+
+class TaskExportTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        User = get_user_model()
+
+        self.password = "TestPass123!"
+        self.owner = User.objects.create_user(username="owner_x", password=self.password)
+        self.viewer = User.objects.create_user(username="viewer_x", password=self.password)
+
+        self.task = Task.objects.create(
+            title="Exported", deadline="2026-01-01", priority=TaskPriority.HIGH, assigned_by=self.owner
+        )
+        self.private = Task.objects.create(
+            title="Private", deadline="2026-01-01", priority=TaskPriority.LOW, assigned_by=self.owner
+        )
+        UserTask.objects.update_or_create(
+            task=self.task, user=self.viewer, defaults={"role": UserTaskRole.VIEWER}
+        )
+        Subtask.objects.create(task=self.task, title="step 1")
+        Subtask.objects.create(task=self.task, title="step 2")
+
+    def auth(self, user):
+        res = self.client.post(
+            "/api/login/",
+            {"username": user.username, "password": self.password},
+            format="json",
+        )
+        self.assertEqual(res.status_code, 200, res.content)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {res.data['access']}")
+
+    def stream(self, url):
+        res = self.client.get(url)
+        self.assertEqual(res.status_code, 200)
+        self.assertTrue(res.streaming)
+        return b"".join(res.streaming_content).decode("utf-8")
+
+    def test_ndjson_export_contains_only_member_tasks(self):
+        self.auth(self.viewer)
+        records = [json.loads(line) for line in self.stream("/api/tasks/export/").splitlines()]
+        tasks = [r for r in records if r["type"] == "task"]
+        self.assertEqual([t["id"] for t in tasks], [self.task.id])
+        self.assertEqual(len([r for r in records if r["type"] == "subtask"]), 2)
+        memberships = [r for r in records if r["type"] == "membership"]
+        self.assertCountEqual([m["username"] for m in memberships], ["owner_x", "viewer_x"])
+
+    def test_csv_export_streams_header_and_rows(self):
+        self.auth(self.owner)
+        rows = list(csv.DictReader(io.StringIO(self.stream("/api/tasks/export/?output=csv"))))
+        self.assertEqual(len([r for r in rows if r["type"] == "task"]), 2)
+        self.assertEqual(rows[0]["title"], "Exported")
+
+    def test_export_all_requires_staff(self):
+        self.auth(self.viewer)
+        res = self.client.get("/api/tasks/export/?all=1")
+        self.assertEqual(res.status_code, 403, res.content)
+
+    def test_management_command_exports_in_small_batches(self):
+        out = io.StringIO()
+        call_command("export_tasks", "--batch-size", "1", stdout=out)
+        records = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertEqual(len([r for r in records if r["type"] == "task"]), 2)
+        self.assertEqual(len([r for r in records if r["type"] == "subtask"]), 2)
+
+
+class TaskImportTests(TestCase):
+    def setUp(self):
+        User = get_user_model()
+        self.alice = User.objects.create_user(username="alice_i", password="TestPass123!")
+        self.bob = User.objects.create_user(username="bob_i", password="TestPass123!")
+
+    def run_import(self, content, suffix, *args):
+        handle, path = tempfile.mkstemp(suffix=suffix)
+        self.addCleanup(os.remove, path)
+        with os.fdopen(handle, "w", encoding="utf-8") as file:
+            file.write(content)
+        out, err = io.StringIO(), io.StringIO()
+        call_command("import_tasks", path, *args, stdout=out, stderr=err)
+        return out.getvalue(), err.getvalue()
+
+    def test_ndjson_import_maps_users_and_children(self):
+        lines = [
+            {"type": "task", "id": 901, "title": "Legacy", "deadline": "2026-05-01",
+             "priority": "High", "assigned_by": "alice_i"},
+            {"type": "subtask", "task_id": 901, "title": "step", "status": "Done"},
+            {"type": "membership", "task_id": 901, "username": "bob_i", "role": "Viewer"},
+            {"type": "membership", "task_id": 901, "username": "ghost", "role": "Viewer"},
+        ]
+        out, err = self.run_import("\n".join(json.dumps(line) for line in lines), ".ndjson", "--batch-size", "2")
+
+        task = Task.objects.get(title="Legacy")
+        self.assertEqual(task.assigned_by, self.alice)
+        self.assertEqual(task.subtasks.get().status, "Done")
+        roles = dict(UserTask.objects.filter(task=task).values_list("user__username", "role"))
+        self.assertEqual(roles, {"alice_i": UserTaskRole.OWNER, "bob_i": UserTaskRole.VIEWER})
+        self.assertIn("skipped=1", out)
+        self.assertIn("ghost", err)
+
+    def test_csv_export_round_trips_through_import(self):
+        task = Task.objects.create(
+            title="Round trip", deadline="2026-01-01", priority=TaskPriority.LOW, assigned_by=self.alice
+        )
+        Subtask.objects.create(task=task, title="child")
+        exported = io.StringIO()
+        call_command("export_tasks", "--format", "csv", stdout=exported)
+        task.delete()
+
+        self.run_import(exported.getvalue(), ".csv")
+        imported = Task.objects.get(title="Round trip")
+        self.assertEqual(imported.subtasks.count(), 1)
+        self.assertEqual(imported.subtask_total, 1)
+        self.assertTrue(
+            UserTask.objects.filter(task=imported, user=self.alice, role=UserTaskRole.OWNER).exists()
+        )
+
+    def test_ndjson_round_trip_keeps_empty_descriptions_apart_from_null(self):
+        task = Task.objects.create(
+            title="Blank", description="", deadline="2026-01-01", priority=TaskPriority.LOW, assigned_by=self.alice
+        )
+        Subtask.objects.create(task=task, title="empty", description="")
+        Subtask.objects.create(task=task, title="null", description=None)
+        exported = io.StringIO()
+        call_command("export_tasks", stdout=exported)
+        task.delete()
+
+        self.run_import(exported.getvalue(), ".ndjson")
+        imported = Task.objects.get(title="Blank")
+        self.assertEqual(imported.description, "")
+        self.assertEqual(
+            dict(imported.subtasks.values_list("title", "description")), {"empty": "", "null": None}
+        )
+
+    def test_older_tasks_fall_out_of_the_task_window(self):
+        task = {"type": "task", "deadline": "2026-05-01", "priority": "Low", "assigned_by": "alice_i"}
+        records = [
+            {**task, "id": "1", "title": "First"},
+            {**task, "id": "2", "title": "Second"},
+            {"type": "subtask", "task_id": "2", "title": "kept"},
+            {"type": "subtask", "task_id": "1", "title": "too late"},
+        ]
+        importer = TaskImporter(batch_size=1, task_window=1)
+        for line_no, record in enumerate(records, start=1):
+            importer.feed(record, line_no)
+        counts = importer.finish()
+
+        self.assertEqual((counts["tasks"], counts["subtasks"], counts["skipped"]), (2, 1, 1))
+        self.assertEqual(list(importer.task_ids), ["2"])
+        self.assertIn("subtask of task 1: unknown task", importer.errors)
+
+    def test_records_over_column_limits_are_skipped(self):
+        task = {"type": "task", "deadline": "2026-05-01", "priority": "Low", "assigned_by": "alice_i"}
+        records = [
+            {**task, "id": "1", "title": "x" * 201},
+            {**task, "id": "2", "title": "Fits", "status": "Someday"},
+            {**task, "id": "3", "title": "Kept"},
+            {"type": "subtask", "task_id": "3", "title": "y" * 256},
+            {"type": "subtask", "task_id": "3", "title": "step", "position": -1},
+        ]
+        importer = TaskImporter()
+        for line_no, record in enumerate(records, start=1):
+            importer.feed(record, line_no)
+        counts = importer.finish()
+
+        self.assertEqual((counts["tasks"], counts["subtasks"], counts["skipped"]), (1, 0, 4))
+        self.assertEqual(list(Task.objects.values_list("title", flat=True)), ["Kept"])
+        self.assertIn("record 1: title is longer than 200 characters", importer.errors)
+        self.assertIn("record 4: title is longer than 255 characters", importer.errors)
+
+    def test_copy_rows_keep_empty_strings_apart_from_null(self):
+        fields = [Subtask._meta.get_field("title"), Subtask._meta.get_field("description")]
+        rows = [Subtask(title='Say "hi", then\nleave', description=None), Subtask(title="x", description="")]
+        buffer = TaskImporter()._copy_buffer(fields, rows)
+        self.assertEqual(buffer.getvalue(), '"Say ""hi"", then\nleave",\n"x",""\n')
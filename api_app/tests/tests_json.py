@@ -0,0 +1,98 @@
+import datetime
+import decimal
+import io
+import json
+import uuid
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+from django.utils.functional import lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from api_app.models import Task, TaskPriority
+from api_app.parsers import FastJSONParser
+from api_app.renderers import FastJSONRenderer, orjson
+from api_app.services.benchmark_service import benchmark_json
+from api_app.utils import sign_token
+
+PAYLOAD = {
+    "deadline": datetime.date(2026, 1, 31),
+    "created_at": datetime.datetime(2026, 1, 2, 3, 4, 5, 678901, tzinfo=datetime.timezone.utc),
+    "local": datetime.datetime(2026, 1, 2, 3, 4, 5, tzinfo=datetime.timezone(datetime.timedelta(hours=2))),
+    "naive": datetime.datetime(2026, 1, 2, 3, 4, 5),
+    "time": datetime.time(9, 30),
+    "duration": datetime.timedelta(minutes=90),
+    "amount": decimal.Decimal("12.50"),
+    "uuid": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+    "label": lazy(lambda: "Zadanie \u2028 ąę", str)(),
+    "counts": {1: "one", 2: "two"},
+    "tags": ("a", "b"),
+    "nothing": None,
+}
+
+# Search ranks and similar: same values, but orjson may spell them differently.
+FLOATS = {"rank": [0.0607927, 1e-06, 1e16, 1.5e-300, -0.0, 2.0], "score": 0.1}
+
+
+class FastJSONRendererTests(SimpleTestCase):
+    def test_output_matches_stdlib_renderer(self):
+        self.assertEqual(FastJSONRenderer().render(PAYLOAD), JSONRenderer().render(PAYLOAD))
+
+    def test_floats_parse_to_the_same_values(self):
+        fast, stdlib = FastJSONRenderer().render(FLOATS), JSONRenderer().render(FLOATS)
+        self.assertEqual(json.loads(fast), json.loads(stdlib))
+        if orjson is not None:
+            self.assertNotEqual(fast, stdlib)
+        self.assertEqual(FastJSONParser().parse(io.BytesIO(fast)), FLOATS)
+        self.assertEqual(benchmark_json(FLOATS, rounds=1)["orjson"], orjson is not None)
+
+    def test_non_finite_floats_render_as_null(self):
+        with self.assertRaises(ValueError):
+            JSONRenderer().render({"rank": float("nan")})
+        if orjson is not None:
+            self.assertEqual(FastJSONRenderer().render({"rank": float("nan")}), b'{"rank":null}')
+
+    def test_indent_and_missing_orjson_fall_back_to_stdlib(self):
+        media_type = "application/json; indent=2"
+        self.assertEqual(
+            FastJSONRenderer().render(PAYLOAD, media_type), JSONRenderer().render(PAYLOAD, media_type)
+        )
+        with mock.patch("api_app.renderers.orjson", None):
+            self.assertEqual(FastJSONRenderer().render(PAYLOAD), JSONRenderer().render(PAYLOAD))
+
+    def test_none_renders_empty_body(self):
+        self.assertEqual(FastJSONRenderer().render(None), b"")
+
+
+class FastJSONParserTests(SimpleTestCase):
+    def parse(self, body):
+        return FastJSONParser().parse(io.BytesIO(body), parser_context={"encoding": "utf-8"})
+
+    def test_parses_utf8_json(self):
+        self.assertEqual(self.parse('{"title": "Zadanie ąę", "ids": [1, 2]}'.encode()), {"title": "Zadanie ąę", "ids": [1, 2]})
+
+    def test_rejects_invalid_json_and_non_finite_numbers(self):
+        for body in (b'{"title": ', b'{"value": NaN}'):
+            with self.subTest(body=body), self.assertRaises(ParseError):
+                self.parse(body)
+
+
+class FastJSONApiTests(TestCase):
+    def test_task_endpoints_round_trip_dates(self):
+        user = get_user_model().objects.create_user(username="jsonista", password="TestPass123!")
+        task = Task.objects.create(title="Dated", deadline="2026-03-01", priority=TaskPriority.LOW, assigned_by=user)
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {sign_token(user)['access']}")
+
+        res = client.patch(f"/api/tasks/{task.id}/", b'{"deadline": "2026-04-15"}', content_type="application/json")
+        self.assertEqual(res.status_code, 200, res.content)
+        self.assertEqual(res["Content-Type"], "application/json")
+        body = res.json()
+        self.assertEqual(body["deadline"], "2026-04-15")
+        task.refresh_from_db()
+        self.assertEqual(task.deadline, datetime.date(2026, 4, 15))
+        self.assertEqual(body["updated_at"], timezone.localtime(task.updated_at).isoformat().replace("+00:00", "Z"))
@@ -0,0 +1,68 @@
+from urllib.parse import parse_qs, urlsplit
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from api_app.models import Subtask, Task, UserTaskRole
+from api_app.services.load_data_service import generate_load_data
+from api_app.utils import sign_token
+
+
+@override_settings(TIME_ZONE="Europe/Warsaw")
+class LeanListSerializerTests(TestCase):
+    """GET lists use the lean serializers; each item must equal its detail response."""
+
+    def setUp(self):
+        generate_load_data(users=3, tasks_per_user=3, members_per_task=2, subtasks_per_task=2, prefix="lean")
+        self.user = get_user_model().objects.get(username="lean_user_000000")
+        self.task = Task.objects.filter(assigned_by=self.user).order_by("id").first()
+        Subtask.objects.filter(task=self.task).update(description="Step details")
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {sign_token(self.user)['access']}")
+
+    def assertMatchesDetail(self, items, detail_path):
+        self.assertTrue(items)
+        for item in items:
+            detail = self.client.get(detail_path(item))
+            self.assertEqual(detail.status_code, 200)
+            self.assertEqual(item, detail.json())
+            self.assertEqual(list(item), list(detail.json()))
+
+    def test_task_list_matches_task_detail(self):
+        res = self.client.get("/api/tasks/")
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(len(res.json()), Task.objects.filter(memberships__user=self.user).count())
+        self.assertMatchesDetail(res.json(), lambda item: f"/api/tasks/{item['id']}/")
+
+    def test_subtask_list_matches_subtask_detail(self):
+        res = self.client.get(f"/api/tasks/{self.task.id}/subtasks/")
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.json()[0]["description"], "Step details")
+        self.assertMatchesDetail(res.json(), lambda item: f"/api/subtasks/{item['id']}/")
+
+    def test_membership_list_matches_membership_detail(self):
+        res = self.client.get(f"/api/tasks/{self.task.id}/memberships/")
+        self.assertEqual(res.status_code, 200)
+        self.assertMatchesDetail(
+            res.json(), lambda item: f"/api/tasks/{self.task.id}/memberships/{item['user']['id']}/"
+        )
+
+    def test_keyset_pages_over_lean_rows(self):
+        expected = [item["id"] for item in self.client.get("/api/tasks/", {"ordering": "-priority"}).json()]
+        seen, params = [], {"ordering": "-priority", "page_size": 2}
+        while True:
+            page = self.client.get("/api/tasks/", params).json()
+            seen += [item["id"] for item in page["results"]]
+            if page["next"] is None:
+                break
+            params["cursor"] = parse_qs(urlsplit(page["next"]).query)["cursor"][0]
+        self.assertEqual(seen, expected)
+
+    def test_writes_still_use_full_serializer(self):
+        res = self.client.post(
+            "/api/tasks/", {"title": "New", "deadline": "2030-01-01", "priority": "Low"}, format="json"
+        )
+        self.assertEqual(res.status_code, 201)
+        self.assertEqual(res.json()["assigned_by"], self.user.username)
+        self.assertEqual(res.json()["current_user_role"], UserTaskRole.OWNER)
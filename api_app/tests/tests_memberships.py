@@ -1,8 +1,20 @@
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from rest_framework.test import APIClient
 
-from api_app.models import Task, UserTask, UserTaskRole, TaskPriority
+from api_app.caching import (
+    MISS,
+    LRUCache,
+    SharedCache,
+    cache_role,
+    clear_role_cache,
+    get_cached_role,
+    get_role_cache,
+)
+from api_app.checks import check_role_cache
+from api_app.models import Subtask, Task, UserTask, UserTaskRole, TaskPriority
 
 
 class TaskMembershipTests(TestCase):
@@ -115,3 +127,178 @@ class TaskMembershipTests(TestCase):
         self.auth(self.assigned)
         res = self.client.delete(f"/api/tasks/{self.task.id}/memberships/{self.viewer.id}/")
         self.assertIn(res.status_code, (403, 404), res.content)
+
+
+class MembershipLookupTests(TestCase):
+    """The caller's user_tasks row is read at most once per request."""
+
+    def setUp(self):
+        self.client = APIClient()
+        User = get_user_model()
+
+        self.password = "TestPass123!"
+        self.owner = User.objects.create_user(username="owner_l", password=self.password)
+        self.assigned = User.objects.create_user(username="assigned_l", password=self.password)
+
+        self.task = Task.objects.create(
+            title="Lookup task",
+            deadline="2026-01-01",
+            priority=TaskPriority.MEDIUM,
+            assigned_by=self.owner,
+        )
+        UserTask.objects.update_or_create(
+            task=self.task,
+            user=self.assigned,
+            defaults={"role": UserTaskRole.ASSIGNED},
+        )
+        self.subtask = Subtask.objects.create(task=self.task, title="sub")
+
+    def auth(self, user):
+        res = self.client.post(
+            "/api/login/",
+            {"username": user.username, "password": self.password},
+            format="json",
+        )
+        self.assertEqual(res.status_code, 200, res.content)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {res.data['access']}")
+
+    def membership_reads(self, method, url, data=None):
+        with CaptureQueriesContext(connection) as ctx:
+            res = getattr(self.client, method)(url, data, format="json")
+        reads = [
+            q["sql"] for q in ctx.captured_queries
+            if '"user_tasks"' in q["sql"] and q["sql"].lstrip().upper().startswith("SELECT")
+        ]
+        return res, reads
+
+    def test_task_patch_reads_membership_once(self):
+        self.auth(self.assigned)
+        res, reads = self.membership_reads("patch", f"/api/tasks/{self.task.id}/", {"title": "new"})
+        self.assertEqual(res.status_code, 200, res.content)
+        self.assertEqual(res.data["current_user_role"], UserTaskRole.ASSIGNED)
+        self.assertEqual(len(reads), 1, reads)
+
+    def test_subtask_patch_reads_membership_once(self):
+        self.auth(self.assigned)
+        res, reads = self.membership_reads("patch", f"/api/subtasks/{self.subtask.id}/", {"title": "new"})
+        self.assertEqual(res.status_code, 200, res.content)
+        self.assertEqual(len(reads), 1, reads)
+
+    def test_membership_patch_reads_caller_role_once(self):
+        self.auth(self.owner)
+        res, reads = self.membership_reads(
+            "patch",
+            f"/api/tasks/{self.task.id}/memberships/{self.assigned.id}/",
+            {"role": UserTaskRole.VIEWER},
+        )
+        self.assertEqual(res.status_code, 200, res.content)
+        # One read for the caller's role, one for the target membership row.
+        self.assertEqual(len(reads), 2, reads)
+
+
+class LRUCacheTests(SimpleTestCase):
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(max_size=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIs(cache.get("b"), MISS)
+        self.assertEqual(len(cache), 2)
+
+    def test_expired_entries_are_misses(self):
+        cache = LRUCache(max_size=2, ttl=0)
+        cache.set("a", 1)
+        self.assertIs(cache.get("a"), MISS)
+
+
+class RoleCacheCheckTests(SimpleTestCase):
+    def setUp(self):
+        clear_role_cache()
+        self.addCleanup(clear_role_cache)
+
+    @override_settings(ROLE_CACHE_BACKEND="local", WEB_CONCURRENCY=4)
+    def test_local_backend_with_several_workers_warns(self):
+        self.assertEqual([warning.id for warning in check_role_cache(None)], ["api_app.W001"])
+        with self.assertLogs("api_app.caching", "WARNING"):
+            self.assertIsInstance(get_role_cache(), LRUCache)
+
+    @override_settings(ROLE_CACHE_BACKEND="local", WEB_CONCURRENCY=1)
+    def test_local_backend_with_one_worker_passes(self):
+        self.assertEqual(check_role_cache(None), [])
+
+    @override_settings(
+        ROLE_CACHE_BACKEND="redis",
+        WEB_CONCURRENCY=4,
+        CACHES={"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}},
+    )
+    def test_other_backends_use_the_shared_cache(self):
+        self.assertEqual(check_role_cache(None), [])
+        self.assertIsInstance(get_role_cache(), SharedCache)
+
+
+@override_settings(ROLE_CACHE_BACKEND="local")
+class RoleCacheTests(TestCase):
+    def setUp(self):
+        # Ids are reused between rolled-back tests, so start from an empty cache.
+        clear_role_cache()
+        self.addCleanup(clear_role_cache)
+        self.client = APIClient()
+        User = get_user_model()
+
+        self.password = "TestPass123!"
+        self.owner = User.objects.create_user(username="owner_c", password=self.password)
+        self.viewer = User.objects.create_user(username="viewer_c", password=self.password)
+        self.task = Task.objects.create(
+            title="Cached task",
+            deadline="2026-01-01",
+            priority=TaskPriority.MEDIUM,
+            assigned_by=self.owner,
+        )
+        UserTask.objects.update_or_create(
+            task=self.task,
+            user=self.viewer,
+            defaults={"role": UserTaskRole.VIEWER},
+        )
+
+    def auth(self, user):
+        res = self.client.post(
+            "/api/login/",
+            {"username": user.username, "password": self.password},
+            format="json",
+        )
+        self.assertEqual(res.status_code, 200, res.content)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {res.data['access']}")
+
+    def role_reads(self, url):
+        with CaptureQueriesContext(connection) as ctx:
+            res = self.client.get(url)
+        reads = [q for q in ctx.captured_queries if q["sql"].startswith('SELECT "user_tasks"."role"')]
+        return res, len(reads)
+
+    def test_repeated_requests_skip_role_query(self):
+        self.auth(self.viewer)
+        url = f"/api/tasks/{self.task.id}/memberships/"
+        res, reads = self.role_reads(url)
+        self.assertEqual(res.status_code, 200, res.content)
+        self.assertEqual(reads, 1)
+        res, reads = self.role_reads(url)
+        self.assertEqual(res.status_code, 200, res.content)
+        self.assertEqual(reads, 0)
+
+    def test_role_cached_before_commit_is_invalidated_after(self):
+        membership = UserTask.objects.get(task=self.task, user=self.viewer)
+        with self.captureOnCommitCallbacks(execute=True):
+            membership.delete()
+            # A concurrent request reads the not yet committed role and caches it.
+            cache_role(self.viewer.id, self.task.id, UserTaskRole.VIEWER)
+        self.assertIs(get_cached_role(self.viewer.id, self.task.id), MISS)
+
+    def test_removed_member_loses_access_immediately(self):
+        self.auth(self.viewer)
+        url = f"/api/tasks/{self.task.id}/memberships/"
+        self.assertEqual(self.client.get(url).status_code, 200)
+
+        UserTask.objects.filter(task=self.task, user=self.viewer).get().delete()
+        self.assertIn(self.client.get(url).status_code, (403, 404))
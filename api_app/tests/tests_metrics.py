@@ -0,0 +1,75 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from api_app.metrics import clear_metrics
+from api_app.models import Task, TaskPriority
+
+
+@override_settings(METRICS_TOKEN="s3cret")
+class MetricsTests(TestCase):
+    def setUp(self):
+        clear_metrics()
+        self.client = APIClient()
+        self.password = "TestPass123!"
+        self.user = get_user_model().objects.create_user(username="metered", password=self.password)
+        Task.objects.create(title="Counted", deadline="2026-01-01", priority=TaskPriority.LOW, assigned_by=self.user)
+
+    def auth(self, user):
+        res = self.client.post(
+            "/api/login/",
+            {"username": user.username, "password": self.password},
+            format="json",
+        )
+        self.assertEqual(res.status_code, 200, res.content)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {res.data['access']}")
+
+    def scrape(self):
+        # A separate client: the scraper has no user token.
+        res = APIClient().get("/api/metrics/", HTTP_AUTHORIZATION="Bearer s3cret")
+        self.assertEqual(res.status_code, 200, res.content)
+        self.assertTrue(res["Content-Type"].startswith("text/plain; version=0.0.4"))
+        return res.content.decode()
+
+    def test_requests_are_recorded_per_url_name(self):
+        self.auth(self.user)
+        self.client.get("/api/tasks/")
+        self.client.get("/api/tasks/")
+        body = self.scrape()
+
+        labels = 'view="tasks_list_create",method="GET"'
+        self.assertIn(f"http_request_duration_seconds_count{{{labels}}} 2", body)
+        self.assertIn(f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}} 2', body)
+        self.assertIn(f"http_request_db_queries_count{{{labels}}} 2", body)
+        self.assertIn('http_request_db_queries_count{view="login",method="POST"} 1', body)
+        queries = next(line for line in body.splitlines() if line.startswith(f"http_request_db_queries_sum{{{labels}}}"))
+        self.assertGreater(float(queries.split()[-1]), 0)
+
+    def test_unknown_methods_and_paths_share_one_series(self):
+        for method in ("X0", "X1", "X2"):
+            self.client.generic(method, "/api/tasks/")
+        self.client.get("/api/no-such-page-1/")
+        self.client.get("/api/no-such-page-2/")
+        body = self.scrape()
+
+        self.assertIn('http_request_duration_seconds_count{view="tasks_list_create",method="OTHER"} 3', body)
+        self.assertIn('http_request_duration_seconds_count{view="<unresolved>",method="GET"} 2', body)
+        self.assertNotIn('method="X0"', body)
+        self.assertNotIn("no-such-page", body)
+
+    def test_metrics_token_is_required(self):
+        self.assertEqual(self.client.get("/api/metrics/").status_code, 403)
+        self.assertEqual(self.client.get("/api/metrics/", HTTP_AUTHORIZATION="Bearer wrong").status_code, 403)
+        self.scrape()
+        with override_settings(METRICS_TOKEN=""):
+            self.assertEqual(self.client.get("/api/metrics/", HTTP_AUTHORIZATION="Bearer ").status_code, 403)
+
+    def test_sampled_requests_log_slowest_sql(self):
+        self.auth(self.user)
+        with override_settings(METRICS_SQL_SAMPLE_RATE=1.0, METRICS_SQL_TOP=2):
+            with self.assertLogs("api_app.metrics", "INFO") as logs:
+                self.client.get("/api/tasks/")
+        message = logs.output[-1]
+        self.assertIn("GET /api/tasks/ (tasks_list_create)", message)
+        self.assertIn("SELECT", message)
+        self.assertLessEqual(message.count(" ms ["), 2)
@@ -0,0 +1,133 @@
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from api_app.models import OutboxMessage, Task, TaskPriority, UserTask, UserTaskRole
+from api_app.services.notification_service import send_task_created_notifications
+from api_app.services.outbox_service import enqueue, relay_outbox
+from api_app.tasks import notify_task_created, notify_tasks_created
+
+
+@override_settings(NOTIFICATION_COALESCE_WINDOW=0)
+class OutboxTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        User = get_user_model()
+
+        self.password = "TestPass123!"
+        self.owner = User.objects.create_user(username="owner_o", password=self.password)
+
+    def auth(self, user):
+        res = self.client.post(
+            "/api/login/",
+            {"username": user.username, "password": self.password},
+            format="json",
+        )
+        self.assertEqual(res.status_code, 200, res.content)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {res.data['access']}")
+
+    def create_task(self, title="Outboxed"):
+        res = self.client.post(
+            "/api/tasks/",
+            {"title": title, "deadline": "2026-01-01", "priority": TaskPriority.LOW},
+            format="json",
+        )
+        self.assertEqual(res.status_code, 201, res.content)
+        return res.data["id"]
+
+    def test_task_create_writes_outbox_message_without_publishing(self):
+        self.auth(self.owner)
+        with mock.patch("api_app.services.outbox_service.publish") as publish:
+            task_id = self.create_task()
+        publish.assert_not_called()
+
+        message = OutboxMessage.objects.get()
+        self.assertEqual(message.task_name, "api_app.tasks.notify_tasks_created")
+        self.assertEqual(message.args, [[task_id]])
+
+    def test_rolled_back_task_leaves_no_message(self):
+        with self.assertRaises(RuntimeError), transaction.atomic():
+            task = Task.objects.create(
+                title="Doomed", deadline="2026-01-01", priority=TaskPriority.LOW, assigned_by=self.owner
+            )
+            enqueue(notify_task_created, task.id)
+            raise RuntimeError
+        self.assertFalse(OutboxMessage.objects.exists())
+
+    def test_relay_publishes_in_batches_and_deletes(self):
+        enqueue(notify_task_created, 1)
+        enqueue(notify_task_created, 2)
+        enqueue(notify_task_created, 3)
+
+        with mock.patch("api_app.services.outbox_service.publish") as publish:
+            self.assertEqual(relay_outbox(batch_size=2), 3)
+        self.assertEqual(publish.call_count, 3)
+        self.assertFalse(OutboxMessage.objects.exists())
+
+    @override_settings(NOTIFICATION_BATCH_SIZE=4)
+    def test_relay_coalesces_notifications_into_chunks(self):
+        self.auth(self.owner)
+        ids = [self.create_task(f"Task {i}") for i in range(5)]
+
+        with mock.patch("api_app.services.outbox_service.publish") as publish:
+            self.assertEqual(relay_outbox(), 5)
+        self.assertEqual(
+            [call.args for call in publish.call_args_list],
+            [
+                ("api_app.tasks.notify_tasks_created", [ids[:4]], {}),
+                ("api_app.tasks.notify_tasks_created", [ids[4:]], {}),
+            ],
+        )
+        self.assertFalse(OutboxMessage.objects.exists())
+
+    def test_coalesce_window_holds_messages_back(self):
+        enqueue(notify_tasks_created, [1], delay=60)
+        with mock.patch("api_app.services.outbox_service.publish") as publish:
+            self.assertEqual(relay_outbox(), 0)
+        publish.assert_not_called()
+
+    def test_broker_failure_keeps_message_and_backs_off(self):
+        self.auth(self.owner)
+        self.create_task()
+
+        with mock.patch(
+            "api_app.services.outbox_service.publish", side_effect=ConnectionError("broker down")
+        ):
+            self.assertEqual(relay_outbox(), 0)
+        message = OutboxMessage.objects.get()
+        self.assertEqual(message.attempts, 1)
+        self.assertIn("broker down", message.last_error)
+
+        # Backed off: not retried until available_at.
+        with mock.patch("api_app.services.outbox_service.publish") as publish:
+            self.assertEqual(relay_outbox(), 0)
+        publish.assert_not_called()
+
+
+class NotificationDigestTests(TestCase):
+    def setUp(self):
+        User = get_user_model()
+        self.owner = User.objects.create_user(username="owner_n", password="TestPass123!")
+        self.viewer = User.objects.create_user(username="viewer_n", password="TestPass123!")
+        self.tasks = [
+            Task.objects.create(
+                title=f"Task {i}", deadline="2026-01-01", priority=TaskPriority.LOW, assigned_by=self.owner
+            )
+            for i in range(3)
+        ]
+        UserTask.objects.update_or_create(
+            task=self.tasks[0], user=self.viewer, defaults={"role": UserTaskRole.VIEWER}
+        )
+
+    def test_one_digest_per_recipient_with_one_query(self):
+        with mock.patch("api_app.services.notification_service.deliver") as deliver:
+            with self.assertNumQueries(1):
+                result = send_task_created_notifications([task.id for task in self.tasks])
+
+        self.assertEqual(result, {"tasks": 3, "recipients": 2})
+        digests = {call.args[0].username: call.args[1] for call in deliver.call_args_list}
+        self.assertEqual(digests["owner_n"], self.tasks)
+        self.assertEqual(digests["viewer_n"], self.tasks[:1])
@@ -0,0 +1,113 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from api_app.models import Subtask, Task, UserTask, UserTaskRole
+from api_app.services.load_data_service import generate_load_data
+from api_app.utils import sign_token
+
+# Data sizes: each user owns SIZE + 1 tasks with SIZE subtasks and SIZE other
+# members, so every list below grows with SIZE.
+SIZES = (1, 4, 12)
+
+# Upper bound on queries per request. Requests are authenticated from the JWT
+# claims, so the budgets do not include a user lookup.
+QUERY_BUDGETS = {
+    "GET tasks": 1,
+    "GET task": 1,
+    "GET subtasks": 2,
+    "GET subtask": 1,
+    "GET memberships": 3,
+    "GET membership": 2,
+    "GET users": 1,
+    "GET user": 1,
+    "GET profile": 1,
+    "GET dashboard": 1,
+    "PATCH task": 2,
+    "PATCH subtask": 5,
+    "PATCH membership": 3,
+    "POST task": 9,
+    "POST subtask": 3,
+    "POST membership": 3,
+    "DELETE subtask": 7,
+    "DELETE membership": 4,
+    "DELETE task": 8,
+}
+
+
+@override_settings(DASHBOARD_CACHE_TTL=0, USER_SEARCH_CACHE_TTL=0, TOKEN_USER_CACHE_TTL=0, ROLE_CACHE_BACKEND="")
+class QueryBudgetTests(TestCase):
+    """
+    Queries per request for each endpoint stay within QUERY_BUDGETS and do not
+    grow with the number of rows returned or stored.
+    """
+
+    def setUp(self):
+        self.client = APIClient()
+
+    def build(self, size):
+        prefix = f"budget{size}"
+        generate_load_data(
+            users=size + 1,
+            tasks_per_user=size + 1,
+            members_per_task=size,
+            subtasks_per_task=size,
+            prefix=prefix,
+        )
+        User = get_user_model()
+        user = User.objects.get(username=f"{prefix}_user_000000")
+        tasks = list(Task.objects.filter(assigned_by=user).order_by("id").values_list("id", flat=True))
+        task_id, doomed_task_id = tasks[0], tasks[-1]
+        subtask_ids = list(Subtask.objects.filter(task_id=task_id).order_by("id").values_list("id", flat=True))
+        member_id = (
+            UserTask.objects.filter(task_id=task_id).exclude(user=user).order_by("user_id")
+            .values_list("user_id", flat=True).first()
+        )
+        newcomer = User.objects.create_user(username=f"{prefix}_newcomer", password=None)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {sign_token(user)['access']}")
+
+        task = f"/api/tasks/{task_id}/"
+        membership = f"/api/tasks/{task_id}/memberships/{member_id}/"
+        # Reads first, then writes, each on rows the later requests do not need.
+        return [
+            ("GET tasks", "get", "/api/tasks/", None),
+            ("GET task", "get", task, None),
+            ("GET subtasks", "get", f"{task}subtasks/", None),
+            ("GET subtask", "get", f"/api/subtasks/{subtask_ids[0]}/", None),
+            ("GET memberships", "get", f"{task}memberships/", None),
+            ("GET membership", "get", membership, None),
+            ("GET users", "get", "/api/users/", None),
+            ("GET user", "get", f"/api/users/{member_id}/", None),
+            ("GET profile", "get", "/api/profile/", None),
+            ("GET dashboard", "get", "/api/dashboard/", None),
+            ("PATCH task", "patch", task, {"title": "Renamed"}),
+            ("PATCH subtask", "patch", f"/api/subtasks/{subtask_ids[0]}/", {"status": "Done"}),
+            ("PATCH membership", "patch", membership, {"role": UserTaskRole.VIEWER}),
+            ("POST task", "post", "/api/tasks/", {"title": "New", "deadline": "2030-01-01", "priority": "Low"}),
+            ("POST subtask", "post", f"{task}subtasks/", {"title": "New step"}),
+            ("POST membership", "post", f"{task}memberships/", {"user_id": newcomer.id, "role": UserTaskRole.VIEWER}),
+            ("DELETE subtask", "delete", f"/api/subtasks/{subtask_ids[-1]}/", None),
+            ("DELETE membership", "delete", membership, None),
+            ("DELETE task", "delete", f"/api/tasks/{doomed_task_id}/", None),
+        ]
+
+    def measure(self, method, path, data):
+        with CaptureQueriesContext(connection) as queries:
+            res = getattr(self.client, method)(path, data, format="json")
+            if res.streaming:
+                b"".join(res.streaming_content)
+        self.assertLess(res.status_code, 300, (path, res.content))
+        return len(queries)
+
+    def test_queries_per_request_are_bounded_and_constant(self):
+        counts = {}
+        for size in SIZES:
+            for name, method, path, data in self.build(size):
+                counts.setdefault(name, {})[size] = self.measure(method, path, data)
+
+        for name, by_size in counts.items():
+            with self.subTest(endpoint=name):
+                self.assertLessEqual(max(by_size.values()), QUERY_BUDGETS[name], by_size)
+                self.assertEqual(len(set(by_size.values())), 1, f"query count grows with data: {by_size}")
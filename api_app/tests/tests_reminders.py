@@ -0,0 +1,61 @@
+from datetime import date
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from api_app.models import Task, TaskPriority, TaskStatus, UserTask, UserTaskRole
+from api_app.services.reminder_service import send_deadline_reminders
+
+
+class DeadlineReminderTests(TestCase):
+    def setUp(self):
+        User = get_user_model()
+        self.owner = User.objects.create_user(username="owner_r", password="TestPass123!")
+        self.assigned = User.objects.create_user(username="assigned_r", password="TestPass123!")
+        self.viewer = User.objects.create_user(username="viewer_r", password="TestPass123!")
+        self.today = date(2026, 3, 10)
+
+        self.due = [self.make_task(f"Due {i}", date(2026, 3, 10 + i % 2)) for i in range(3)]
+        self.done = self.make_task("Done", date(2026, 3, 10), status=TaskStatus.DONE)
+        self.later = self.make_task("Later", date(2026, 4, 1))
+        self.overdue = self.make_task("Overdue", date(2026, 3, 1))
+        for task in self.due:
+            UserTask.objects.update_or_create(
+                task=task, user=self.assigned, defaults={"role": UserTaskRole.ASSIGNED}
+            )
+            UserTask.objects.update_or_create(
+                task=task, user=self.viewer, defaults={"role": UserTaskRole.VIEWER}
+            )
+
+    def make_task(self, title, deadline, status=TaskStatus.TODO):
+        return Task.objects.create(
+            title=title, deadline=deadline, priority=TaskPriority.LOW, status=status, assigned_by=self.owner
+        )
+
+    def run_reminders(self, **kwargs):
+        with mock.patch("api_app.services.reminder_service.deliver_reminder") as deliver:
+            result = send_deadline_reminders(today=self.today, horizon_days=1, **kwargs)
+        sent = {}
+        for call in deliver.call_args_list:
+            sent.setdefault(call.args[0].username, []).extend(task.title for task in call.args[1])
+        return result, sent
+
+    def test_reminds_owner_and_assigned_of_open_tasks_in_horizon(self):
+        result, sent = self.run_reminders(batch_size=2)
+        self.assertEqual(result, {"tasks": 3, "reminders": 4})
+        self.assertEqual(set(sent), {"owner_r", "assigned_r"})
+        self.assertEqual(sorted(sum(sent.values(), [])), sorted(2 * [task.title for task in self.due]))
+
+    def test_rerun_is_idempotent_until_deadline_moves(self):
+        self.run_reminders()
+        with self.assertNumQueries(1):
+            result, sent = self.run_reminders()
+        self.assertEqual(result, {"tasks": 0, "reminders": 0})
+
+        moved = self.due[0]
+        moved.deadline = date(2026, 3, 11)
+        moved.save()
+        result, sent = self.run_reminders()
+        self.assertEqual(result["tasks"], 1)
+        self.assertEqual(sent["assigned_r"], [moved.title])
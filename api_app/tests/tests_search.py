@@ -0,0 +1,114 @@
+from unittest import mock, skipUnless
+
+from django.apps import apps
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from api_app.models import Subtask, Task, TaskPriority
+from api_app.pagination import RankedHitPagination
+from api_app.services.search_service import SEARCH_ORDERING
+from api_app.signals import restore_search_triggers
+
+
+class SearchTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        User = get_user_model()
+
+        self.password = "TestPass123!"
+        self.owner = User.objects.create_user(username="owner_s", password=self.password)
+        self.other = User.objects.create_user(username="other_s", password=self.password)
+
+        self.report = self.make_task("Quarterly report", "Numbers for the board", self.owner)
+        self.meeting = self.make_task("Board meeting", "Prepare the reports deck", self.owner)
+        self.hidden = self.make_task("Secret report", None, self.other)
+        self.step = Subtask.objects.create(task=self.meeting, title="Print reporting pack")
+
+    def make_task(self, title, description, user):
+        return Task.objects.create(
+            title=title, description=description, deadline="2026-01-01",
+            priority=TaskPriority.LOW, assigned_by=user,
+        )
+
+    def auth(self, user):
+        res = self.client.post(
+            "/api/login/",
+            {"username": user.username, "password": self.password},
+            format="json",
+        )
+        self.assertEqual(res.status_code, 200, res.content)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {res.data['access']}")
+
+    def hits(self, url):
+        res = self.client.get(url)
+        self.assertEqual(res.status_code, 200, res.content)
+        return res.data
+
+    def test_ranked_hits_over_member_tasks_and_subtasks(self):
+        self.auth(self.owner)
+        results = self.hits("/api/search/?q=reports")["results"]
+        found = [(hit["type"], hit["id"]) for hit in results]
+        # Stemmed match; the title hit outranks the description hit.
+        self.assertLess(found.index(("task", self.report.id)), found.index(("task", self.meeting.id)))
+        self.assertCountEqual(
+            found, [("task", self.report.id), ("task", self.meeting.id), ("subtask", self.step.id)]
+        )
+        self.assertNotIn(("task", self.hidden.id), found)
+
+    def test_index_follows_updates_and_deletes(self):
+        self.auth(self.owner)
+        self.report.title = "Annual summary"
+        self.report.description = ""
+        self.report.save()
+        self.step.delete()
+        found = [hit["id"] for hit in self.hits("/api/search/?q=report")["results"]]
+        self.assertEqual(found, [self.meeting.id])
+
+    def test_pages_with_cursor(self):
+        self.auth(self.owner)
+        seen = []
+        url = "/api/search/?q=report&page_size=1"
+        while url:
+            page = self.hits(url)
+            self.assertLessEqual(len(page["results"]), 1)
+            seen += [(hit["type"], hit["id"]) for hit in page["results"]]
+            url = page["next"]
+        self.assertEqual(len(seen), 3)
+        self.assertEqual(len(set(seen)), 3)
+
+    def test_tampered_cursor_returns_404(self):
+        self.auth(self.owner)
+        paginator = RankedHitPagination()
+        paginator.ordering_fields = SEARCH_ORDERING
+        for values in (["garbage", "task", 1], [0.5, "task", "x"], [0.5, "task", None]):
+            with self.subTest(values=values):
+                res = self.client.get("/api/search/", {"q": "report", "cursor": paginator.encode_cursor(values)})
+                self.assertEqual(res.status_code, 404, res.content)
+
+    def test_unsupported_database_answers_501(self):
+        self.auth(self.owner)
+        with mock.patch("api_app.services.search_service.connection") as connection:
+            connection.vendor = "mysql"
+            res = self.client.get("/api/search/?q=report")
+        self.assertEqual(res.status_code, 501, res.content)
+
+    @skipUnless(connection.vendor == "sqlite", "SQLite keeps the search index with triggers")
+    def test_post_migrate_restores_dropped_sqlite_triggers(self):
+        # What a later migration that rebuilds the table does to them.
+        with connection.cursor() as cursor:
+            cursor.execute("DROP TRIGGER tasks_fts_ai")
+        self.make_task("Orphaned report", None, self.owner)
+
+        restore_search_triggers(sender=apps.get_app_config("api_app"), using=connection.alias)
+        self.auth(self.owner)
+        titles = [hit["title"] for hit in self.hits("/api/search/?q=orphaned")["results"]]
+        self.assertEqual(titles, ["Orphaned report"])
+        self.make_task("Another orphan", None, self.owner)
+        self.assertEqual(len(self.hits("/api/search/?q=orphan")["results"]), 2)
+
+    def test_query_is_required_and_operators_are_literal(self):
+        self.auth(self.owner)
+        self.assertEqual(self.client.get("/api/search/").status_code, 400)
+        self.assertEqual(self.hits('/api/search/?q="board" (')["results"][0]["type"], "task")
@@ -0,0 +1,109 @@
+import io
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from api_app.models import Subtask, Task, TaskPriority, TaskStatus
+from api_app.serializers import SubtaskSerializer, TaskSerializer
+from api_app.services.subtask_service import adjust_subtask_counters, update_subtask
+
+
+class SubtaskCounterTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        User = get_user_model()
+
+        self.password = "TestPass123!"
+        self.owner = User.objects.create_user(username="owner_c", password=self.password)
+        self.task = Task.objects.create(
+            title="Counted", deadline="2026-01-01", priority=TaskPriority.MEDIUM, assigned_by=self.owner
+        )
+        self.auth(self.owner)
+
+    def auth(self, user):
+        res = self.client.post(
+            "/api/login/",
+            {"username": user.username, "password": self.password},
+            format="json",
+        )
+        self.assertEqual(res.status_code, 200, res.content)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {res.data['access']}")
+
+    def counters(self):
+        res = self.client.get(f"/api/tasks/{self.task.id}/")
+        return res.data["subtask_total"], res.data["subtask_done"]
+
+    def test_counters_follow_create_update_and_delete(self):
+        url = f"/api/tasks/{self.task.id}/subtasks/"
+        first = self.client.post(url, {"title": "one"}, format="json").data["id"]
+        self.client.post(url, {"title": "two", "status": TaskStatus.DONE}, format="json")
+        self.assertEqual(self.counters(), (2, 1))
+
+        self.client.patch(f"/api/subtasks/{first}/", {"status": TaskStatus.DONE}, format="json")
+        self.assertEqual(self.counters(), (2, 2))
+        self.client.patch(f"/api/subtasks/{first}/", {"title": "renamed"}, format="json")
+        self.assertEqual(self.counters(), (2, 2))
+
+        self.client.delete(f"/api/subtasks/{first}/")
+        self.assertEqual(self.counters(), (1, 1))
+
+    def test_counters_follow_batch(self):
+        url = f"/api/tasks/{self.task.id}/subtasks/batch/"
+        res = self.client.post(url, {"create": [{"title": "a"}, {"title": "b"}, {"title": "c"}]}, format="json")
+        a, b, c = (item["id"] for item in res.data["created"])
+
+        res = self.client.post(
+            url,
+            {"update": [{"id": a, "status": TaskStatus.DONE}, {"id": b, "status": TaskStatus.DONE}], "delete": [c]},
+            format="json",
+        )
+        self.assertEqual(res.status_code, 200, res.content)
+        self.assertEqual(self.counters(), (2, 2))
+
+        self.client.post(url, {"delete": [a]}, format="json")
+        self.assertEqual(self.counters(), (1, 1))
+
+    def test_counters_are_read_only(self):
+        res = self.client.patch(f"/api/tasks/{self.task.id}/", {"subtask_total": 99}, format="json")
+        self.assertEqual(res.status_code, 200, res.content)
+        self.assertEqual(self.counters(), (0, 0))
+
+    def test_task_patch_keeps_concurrent_counter_updates(self):
+        stale = Task.objects.get(pk=self.task.pk)
+        # Another request adds a subtask after `stale` was read.
+        adjust_subtask_counters(self.task.id, total=1, done=1)
+        serializer = TaskSerializer(stale, data={"title": "Renamed"}, partial=True)
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        serializer.save()
+        self.task.refresh_from_db()
+        self.assertEqual((self.task.title, self.task.subtask_total, self.task.subtask_done), ("Renamed", 1, 1))
+
+    def test_subtask_rename_keeps_concurrent_status_change(self):
+        url = f"/api/tasks/{self.task.id}/subtasks/"
+        subtask_id = self.client.post(url, {"title": "one"}, format="json").data["id"]
+        stale = Subtask.objects.get(pk=subtask_id)
+        # Another request ticks the subtask after `stale` was read.
+        self.client.patch(f"/api/subtasks/{subtask_id}/", {"status": TaskStatus.DONE}, format="json")
+
+        serializer = SubtaskSerializer(stale, data={"title": "renamed"}, partial=True)
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        update_subtask(serializer)
+        fresh = Subtask.objects.get(pk=subtask_id)
+        self.assertEqual((fresh.title, fresh.status), ("renamed", TaskStatus.DONE))
+        self.assertEqual(self.counters(), (1, 1))
+
+    def test_repair_command_fixes_drift(self):
+        Subtask.objects.bulk_create([
+            Subtask(task=self.task, title="raw", status=TaskStatus.DONE),
+            Subtask(task=self.task, title="raw 2"),
+        ])
+        self.assertEqual(self.counters(), (0, 0))
+        before = Task.objects.get(pk=self.task.pk).updated_at
+
+        out = io.StringIO()
+        call_command("repair_subtask_counters", "--batch-size", "1", stdout=out)
+        self.assertIn("repaired 1", out.getvalue())
+        self.assertEqual(self.counters(), (2, 1))
+        self.assertGreater(Task.objects.get(pk=self.task.pk).updated_at, before)
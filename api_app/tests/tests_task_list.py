@@ -0,0 +1,303 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ImproperlyConfigured
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework import generics
+from rest_framework.test import APIClient
+
+from api_app.conditional import DeltaSyncListMixin
+from api_app.models import Subtask, Task, TaskPriority, TaskStatus, Tombstone, UserTask, UserTaskRole
+from api_app.pagination import KeysetPagination
+from api_app.services.sync_service import record_subtask_tombstones
+from api_app.tasks import prune_old_tombstones
+
+
+class TaskListPaginationTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        User = get_user_model()
+
+        self.password = "TestPass123!"
+        self.owner = User.objects.create_user(username="owner_p", password=self.password)
+        self.other = User.objects.create_user(username="other_p", password=self.password)
+
+        # Two tasks share a created_at to exercise the id tie-breaker.
+        base = timezone.now()
+        self.tasks = []
+        for i in range(5):
+            task = Task.objects.create(
+                title=f"Task {i}",
+                deadline="2026-01-01",
+                priority=TaskPriority.MEDIUM,
+                assigned_by=self.owner,
+                created_at=base - timedelta(minutes=min(i, 3)),
+            )
+            self.tasks.append(task)
+        UserTask.objects.update_or_create(
+            task=self.tasks[0], user=self.other, defaults={"role": UserTaskRole.VIEWER}
+        )
+
+    def auth(self, user):
+        res = self.client.post(
+            "/api/login/",
+            {"username": user.username, "password": self.password},
+            format="json",
+        )
+        self.assertEqual(res.status_code, 200, res.content)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {res.data['access']}")
+
+    def test_list_without_page_params_returns_plain_list(self):
+        self.auth(self.owner)
+        res = self.client.get("/api/tasks/")
+        self.assertEqual(res.status_code, 200, res.content)
+        self.assertIsInstance(res.data, list)
+        self.assertEqual(len(res.data), 5)
+
+    def test_schema_documents_plain_list_and_page(self):
+        schema = self.client.get("/api/schema/", {"format": "json"}).json()
+        response = schema["paths"]["/api/tasks/"]["get"]["responses"]["200"]["content"]["application/json"]
+        name = response["schema"]["$ref"].rsplit("/", 1)[-1]
+        shapes = schema["components"]["schemas"][name]["oneOf"]
+        self.assertEqual([shape["type"] for shape in shapes], ["array", "object"])
+        self.assertEqual(set(shapes[1]["properties"]), {"next", "results"})
+        self.assertIsInstance(next(iter(response["examples"].values()))["value"], list)
+
+    def test_cursor_walks_all_pages_without_duplicates(self):
+        self.auth(self.owner)
+        seen = []
+        url = "/api/tasks/?page_size=2"
+        while url:
+            res = self.client.get(url)
+            self.assertEqual(res.status_code, 200, res.content)
+            self.assertLessEqual(len(res.data["results"]), 2)
+            seen.extend(item["id"] for item in res.data["results"])
+            url = res.data["next"]
+
+        expected = list(
+            Task.objects.filter(memberships__user=self.owner)
+            .order_by("-created_at", "-id")
+            .values_list("id", flat=True)
+        )
+        self.assertEqual(seen, expected)
+
+    def test_only_member_tasks_are_paginated(self):
+        self.auth(self.other)
+        res = self.client.get("/api/tasks/?page_size=10")
+        self.assertEqual(res.status_code, 200, res.content)
+        self.assertEqual([item["id"] for item in res.data["results"]], [self.tasks[0].id])
+        self.assertIsNone(res.data["next"])
+
+    def test_invalid_cursor_returns_404(self):
+        self.auth(self.owner)
+        res = self.client.get("/api/tasks/?cursor=not-a-cursor")
+        self.assertEqual(res.status_code, 404, res.content)
+
+    def test_tampered_cursor_returns_404(self):
+        self.auth(self.owner)
+        paginator = KeysetPagination()
+        paginator.ordering_fields = ("-created_at", "-id")
+        for values in (["garbage", 1], ["2026-01-01T00:00:00+00:00", {"a": 1}], ["2026-01-01T00:00:00+00:00", "x"]):
+            with self.subTest(values=values):
+                res = self.client.get("/api/tasks/", {"cursor": paginator.encode_cursor(values)})
+                self.assertEqual(res.status_code, 404, res.content)
+
+        res = self.client.get("/api/tasks/", {"cursor": "eyJvIjoiLWNyZWF0ZWRfYXQsLWlkIiwidiI6NX0"})  # {"o":...,"v":5}
+        self.assertEqual(res.status_code, 404, res.content)
+
+
+class TaskListFilterTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        User = get_user_model()
+
+        self.password = "TestPass123!"
+        self.owner = User.objects.create_user(username="owner_f", password=self.password)
+        self.member = User.objects.create_user(username="member_f", password=self.password)
+
+        self.urgent = Task.objects.create(
+            title="Fix login bug",
+            deadline="2026-01-05",
+            priority=TaskPriority.HIGH,
+            status=TaskStatus.IN_PROGRESS,
+            assigned_by=self.owner,
+        )
+        self.later = Task.objects.create(
+            title="Write docs",
+            description="Login flow diagrams",
+            deadline="2026-03-01",
+            priority=TaskPriority.LOW,
+            status=TaskStatus.TODO,
+            assigned_by=self.owner,
+        )
+        self.shared = Task.objects.create(
+            title="Shared task",
+            deadline="2026-02-01",
+            priority=TaskPriority.MEDIUM,
+            status=TaskStatus.DONE,
+            assigned_by=self.member,
+        )
+        UserTask.objects.update_or_create(
+            task=self.shared, user=self.owner, defaults={"role": UserTaskRole.VIEWER}
+        )
+
+    def auth(self, user):
+        res = self.client.post(
+            "/api/login/",
+            {"username": user.username, "password": self.password},
+            format="json",
+        )
+        self.assertEqual(res.status_code, 200, res.content)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {res.data['access']}")
+
+    def ids(self, url):
+        res = self.client.get(url)
+        self.assertEqual(res.status_code, 200, res.content)
+        return [item["id"] for item in res.data]
+
+    def test_filter_by_status_and_priority(self):
+        self.auth(self.owner)
+        self.assertEqual(self.ids("/api/tasks/?status=To do"), [self.later.id])
+        self.assertCountEqual(
+            self.ids("/api/tasks/?priority=High&priority=Medium"),
+            [self.urgent.id, self.shared.id],
+        )
+
+    def test_filter_by_deadline_range(self):
+        self.auth(self.owner)
+        self.assertCountEqual(
+            self.ids("/api/tasks/?deadline_after=2026-01-10&deadline_before=2026-02-28"),
+            [self.shared.id],
+        )
+
+    def test_filter_by_role_uses_current_user_membership(self):
+        self.auth(self.owner)
+        self.assertEqual(self.ids("/api/tasks/?role=Viewer"), [self.shared.id])
+        self.assertCountEqual(self.ids("/api/tasks/?role=Owner"), [self.urgent.id, self.later.id])
+
+    def test_search_matches_title_or_description(self):
+        self.auth(self.owner)
+        self.assertCountEqual(self.ids("/api/tasks/?search=login"), [self.urgent.id, self.later.id])
+
+    def test_ordering_by_deadline_and_priority(self):
+        self.auth(self.owner)
+        self.assertEqual(
+            self.ids("/api/tasks/?ordering=deadline"),
+            [self.urgent.id, self.shared.id, self.later.id],
+        )
+        self.assertEqual(
+            self.ids("/api/tasks/?ordering=-priority"),
+            [self.urgent.id, self.shared.id, self.later.id],
+        )
+
+    def test_ordering_is_kept_across_pages(self):
+        self.auth(self.owner)
+        res = self.client.get("/api/tasks/?ordering=-priority&page_size=2")
+        self.assertEqual([item["id"] for item in res.data["results"]], [self.urgent.id, self.shared.id])
+        res = self.client.get(res.data["next"])
+        self.assertEqual([item["id"] for item in res.data["results"]], [self.later.id])
+        self.assertIsNone(res.data["next"])
+
+    def test_invalid_filter_values_return_400(self):
+        self.auth(self.owner)
+        for query in ("status=Blocked", "deadline_after=yesterday", "ordering=title"):
+            res = self.client.get(f"/api/tasks/?{query}")
+            self.assertEqual(res.status_code, 400, query)
+
+
+class DeltaSyncTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        User = get_user_model()
+
+        self.password = "TestPass123!"
+        self.owner = User.objects.create_user(username="owner_s", password=self.password)
+        self.member = User.objects.create_user(username="member_s", password=self.password)
+
+        self.kept = Task.objects.create(
+            title="Kept", deadline="2026-01-01", priority=TaskPriority.LOW, assigned_by=self.owner
+        )
+        self.edited = Task.objects.create(
+            title="Edited", deadline="2026-01-01", priority=TaskPriority.LOW, assigned_by=self.owner
+        )
+        self.removed = Task.objects.create(
+            title="Removed", deadline="2026-01-01", priority=TaskPriority.LOW, assigned_by=self.owner
+        )
+        self.subtask = Subtask.objects.create(task=self.kept, title="sub")
+
+        # Everything above happened well before the watermark.
+        old = timezone.now() - timedelta(hours=2)
+        Task.objects.update(updated_at=old)
+        UserTask.objects.update(updated_at=old)
+        Subtask.objects.update(updated_at=old)
+        self.since = (timezone.now() - timedelta(hours=1)).isoformat()
+
+    def auth(self, user):
+        res = self.client.post(
+            "/api/login/",
+            {"username": user.username, "password": self.password},
+            format="json",
+        )
+        self.assertEqual(res.status_code, 200, res.content)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {res.data['access']}")
+
+    def sync(self, path):
+        res = self.client.get(path, {"updated_since": self.since})
+        self.assertEqual(res.status_code, 200, res.content)
+        return res.data
+
+    def test_task_delta_returns_changes_and_deleted_ids(self):
+        self.edited.title = "Edited again"
+        self.edited.save()
+        removed_id = self.removed.id
+        self.removed.delete()
+
+        self.auth(self.owner)
+        data = self.sync("/api/tasks/")
+        self.assertEqual([item["id"] for item in data["results"]], [self.edited.id])
+        self.assertEqual(data["deleted"], [removed_id])
+        self.assertIn("sync_token", data)
+
+    def test_task_delta_includes_tasks_user_was_added_to(self):
+        UserTask.objects.create(task=self.kept, user=self.member, role=UserTaskRole.VIEWER)
+
+        self.auth(self.member)
+        data = self.sync("/api/tasks/")
+        self.assertEqual([item["id"] for item in data["results"]], [self.kept.id])
+
+        UserTask.objects.get(task=self.kept, user=self.member).delete()
+        data = self.sync("/api/tasks/")
+        self.assertEqual(data["results"], [])
+        self.assertEqual(data["deleted"], [self.kept.id])
+
+    def test_subtask_and_membership_deltas(self):
+        membership = UserTask.objects.create(task=self.kept, user=self.member, role=UserTaskRole.VIEWER)
+        self.auth(self.owner)
+        res = self.client.delete(f"/api/subtasks/{self.subtask.id}/")
+        self.assertEqual(res.status_code, 204, res.content)
+
+        data = self.sync(f"/api/tasks/{self.kept.id}/subtasks/")
+        self.assertEqual(data["results"], [])
+        self.assertEqual(data["deleted"], [self.subtask.id])
+
+        data = self.sync(f"/api/tasks/{self.kept.id}/memberships/")
+        self.assertEqual([item["id"] for item in data["results"]], [membership.id])
+
+    def test_watermark_older_than_history_returns_410(self):
+        self.auth(self.owner)
+        res = self.client.get("/api/tasks/", {"updated_since": "2000-01-01T00:00:00Z"})
+        self.assertEqual(res.status_code, 410, res.content)
+
+    def test_delta_views_must_define_deleted_ids(self):
+        with self.assertRaisesMessage(ImproperlyConfigured, "Forgetful must define get_deleted_ids(since)."):
+            type("Forgetful", (DeltaSyncListMixin, generics.ListAPIView), {})
+
+    @override_settings(SYNC_TOMBSTONE_RETENTION_DAYS=1)
+    def test_beat_job_prunes_expired_tombstones(self):
+        record_subtask_tombstones(self.kept.id, [101, 102])
+        record_subtask_tombstones(self.kept.id, [103])
+        Tombstone.objects.filter(object_id__in=[101, 102]).update(deleted_at=timezone.now() - timedelta(days=2))
+
+        self.assertEqual(prune_old_tombstones(), {"deleted": 2})
+        self.assertEqual(list(Tombstone.objects.values_list("object_id", flat=True)), [103])
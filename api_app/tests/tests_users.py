@@ -0,0 +1,62 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+
+class UserDirectoryTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        User = get_user_model()
+
+        self.password = "TestPass123!"
+        self.me = User.objects.create_user(username="zed", password=self.password)
+        for i in range(5):
+            User.objects.create_user(username=f"anna{i}", email=f"anna{i}@example.com", password=self.password)
+        User.objects.create_user(username="bob", email="Annabel@example.com", password=self.password)
+        User.objects.create_user(username="annie", password=self.password, is_active=False)
+        self.auth(self.me)
+
+    def auth(self, user):
+        res = self.client.post(
+            "/api/login/",
+            {"username": user.username, "password": self.password},
+            format="json",
+        )
+        self.assertEqual(res.status_code, 200, res.content)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {res.data['access']}")
+
+    def test_plain_list_still_returns_all_users(self):
+        res = self.client.get("/api/users/")
+        self.assertEqual(res.status_code, 200, res.content)
+        self.assertEqual(len(res.data), 8)
+
+    def test_schema_documents_plain_list_and_page(self):
+        schema = self.client.get("/api/schema/", {"format": "json"}).json()
+        ref = schema["paths"]["/api/users/"]["get"]["responses"]["200"]["content"]["application/json"]["schema"]
+        shapes = schema["components"]["schemas"][ref["$ref"].rsplit("/", 1)[-1]]["oneOf"]
+        self.assertEqual([shape["type"] for shape in shapes], ["array", "object"])
+
+    def test_prefix_matches_username_or_email_case_insensitively(self):
+        res = self.client.get("/api/users/?q=ANN")
+        self.assertEqual(res.status_code, 200, res.content)
+        usernames = [user["username"] for user in res.data["results"]]
+        self.assertEqual(usernames, ["anna0", "anna1", "anna2", "anna3", "anna4", "bob"])
+
+    @override_settings(USER_SEARCH_MAX_RESULTS=4)
+    def test_results_are_capped_and_paginated(self):
+        res = self.client.get("/api/users/?q=ann&page_size=100")
+        self.assertEqual(len(res.data["results"]), 4)
+        res = self.client.get(res.data["next"])
+        self.assertEqual([user["username"] for user in res.data["results"]], ["anna4", "bob"])
+        self.assertIsNone(res.data["next"])
+
+    def test_responses_are_cached_briefly(self):
+        self.client.get("/api/users/?q=anna")
+        get_user_model().objects.create_user(username="anna9", password=self.password)
+        res = self.client.get("/api/users/?q=Anna")
+        self.assertNotIn("anna9", [user["username"] for user in res.data["results"]])
+        cache.clear()
+        res = self.client.get("/api/users/?q=anna")
+        self.assertIn("anna9", [user["username"] for user in res.data["results"]])
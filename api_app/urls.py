@@ -6,11 +6,17 @@ from .views import (
     UserDetailView,
     RegisterView,
     TaskListCreateView,
+    TaskBulkView,
+    TaskExportView,
     TaskDetailView,
     TaskSubtaskListCreateView,
+    TaskSubtaskBatchView,
     SubtaskDetailView,
     TaskMembershipListCreateView,
     TaskMembershipDetailView,
+    DashboardView,
+    SearchView,
+    MetricsView,
 )
 
 
@@ -18,12 +24,18 @@ urlpatterns = [
     path('users/', UserListView.as_view(), name="users_list"),
     path('users/<int:pk>/', UserDetailView.as_view(), name="users_detail"),
     path("register/", RegisterView.as_view(), name="register"),
-    path("login/", login),
-    path("profile/", profile),
+    path("login/", login, name="login"),
+    path("profile/", profile, name="profile"),
     path("tasks/", TaskListCreateView.as_view(), name="tasks_list_create"),
+    path("tasks/bulk/", TaskBulkView.as_view(), name="tasks_bulk"),
+    path("tasks/export/", TaskExportView.as_view(), name="tasks_export"),
     path("tasks/<int:pk>/", TaskDetailView.as_view(), name="task_detail"),
     path("tasks/<int:task_id>/subtasks/", TaskSubtaskListCreateView.as_view(), name="task_subtasks"),
+    path("tasks/<int:task_id>/subtasks/batch/", TaskSubtaskBatchView.as_view(), name="task_subtasks_batch"),
     path("subtasks/<int:pk>/", SubtaskDetailView.as_view(), name="subtask_detail"),
     path("tasks/<int:task_id>/memberships/", TaskMembershipListCreateView.as_view(), name="task_memberships"),
     path("tasks/<int:task_id>/memberships/<int:user_id>/", TaskMembershipDetailView.as_view(), name="task_membership_detail"),
+    path("dashboard/", DashboardView.as_view(), name="dashboard"),
+    path("search/", SearchView.as_view(), name="search"),
+    path("metrics/", MetricsView.as_view(), name="metrics"),
 ]
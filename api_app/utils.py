@@ -1,7 +1,23 @@
 from rest_framework_simplejwt.tokens import RefreshToken
 
+from api_app.models import TokenUser
+
+
+def is_id(value):
+    """Whether a parsed JSON value is an integer id; bool is an int subclass."""
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def stamp_user_claims(token, user):
+    # Copied into every access token derived from this refresh token and read
+    # back by StatelessJWTAuthentication instead of loading the user.
+    for claim in TokenUser.CLAIM_FIELDS:
+        token[claim] = getattr(user, claim)
+
+
 def sign_token(user):
     refresh = RefreshToken.for_user(user)
+    stamp_user_claims(refresh, user)
     return {
         "access": str(refresh.access_token),
         "refresh": str(refresh),
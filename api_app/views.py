@@ -1,44 +1,117 @@
 from django.contrib.auth import get_user_model
-from django.db.models import Prefetch
-from django.shortcuts import get_object_or_404
+from django.db.models import F
+from django.http import HttpResponse, StreamingHttpResponse
+from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import (
     OpenApiExample,
+    OpenApiParameter,
     OpenApiResponse,
     extend_schema,
     extend_schema_view,
 )
 from rest_framework import generics, status
 from rest_framework.decorators import api_view, permission_classes
-from rest_framework.exceptions import ValidationError
+from rest_framework.exceptions import PermissionDenied, ValidationError
+from rest_framework.negotiation import BaseContentNegotiation
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
-
-from api_app.models import Subtask, Task, UserTask
-from api_app.permissions import TaskMembershipPermission, TaskRolePermission
+from rest_framework.views import APIView
+
+from api_app.conditional import ConditionalListMixin, ConditionalObjectMixin, DeltaSyncListMixin, make_etag
+from api_app.filters import (
+    annotate_priority_rank,
+    get_task_filters,
+    get_task_membership_filters,
+    get_task_ordering,
+)
+from api_app.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, render_metrics
+from api_app.models import Subtask, Task, UserTask, UserTaskRole
+from api_app.pagination import KeysetPagination, RankedHitPagination, UserSearchPagination
+from api_app.permissions import HasMetricsToken, TaskMembershipPermission, TaskRolePermission
 from api_app.serializers import (
+    DashboardSerializer,
     DeleteAccountSerializer,
     LoginRequestSerializer,
     ProfileSerializer,
     RegisterResponseSerializer,
+    SearchHitSerializer,
+    SubtaskBatchRequestSerializer,
+    SubtaskBatchResultSerializer,
+    SubtaskListSerializer,
     SubtaskSerializer,
+    TaskBulkDeleteSerializer,
+    TaskListSerializer,
     TaskSerializer,
     TokenPairSerializer,
     UserRegisterSerializer,
     UserSerializer,
+    UserTaskListSerializer,
     UserTaskSerializer,
 )
 from api_app.services.auth_service import login_and_issue_tokens, register_user_and_issue_tokens
-from api_app.services.membership_service import create_membership_for_task
+from api_app.services.dashboard_service import get_dashboard
+from api_app.services.export_service import EXPORT_FORMATS, iter_export_records, render_export
+from api_app.services.membership_service import create_membership_for_task, get_membership_resolver
+from api_app.services.search_service import (
+    SEARCH_CURSOR_TYPES,
+    SEARCH_ORDERING,
+    parse_search_query,
+    search_tasks,
+)
 from api_app.services.subtask_service import (
+    apply_subtask_batch,
     create_subtask_for_task,
+    delete_subtask,
     ensure_can_delete_subtask,
     ensure_can_edit_subtask,
+    update_subtask,
+)
+from api_app.services.sync_service import (
+    get_deleted_membership_ids,
+    get_deleted_subtask_ids,
+    get_deleted_task_ids,
+)
+from api_app.services.task_service import (
+    bulk_create_tasks_for_user,
+    bulk_delete_tasks_for_user,
+    bulk_update_tasks_for_user,
+    create_task_for_user,
+    delete_task,
+    ensure_bulk_size,
 )
-from api_app.services.task_service import create_task_for_user
+from api_app.services.user_directory_service import cached_user_search, filter_users
 
 User = get_user_model()
 
 
+class LeanListMixin:
+    """
+    Serves GET lists through `list_serializer_class` (a LeanListSerializer)
+    from `.values()` rows, skipping model instances and per-field serializer
+    machinery. Other methods, and schema generation, keep `serializer_class`.
+    """
+
+    list_serializer_class = None
+
+    def is_lean_list(self):
+        return self.request.method == "GET" and not getattr(self, "swagger_fake_view", False)
+
+    def get_serializer_class(self):
+        if self.is_lean_list():
+            return self.list_serializer_class
+        return super().get_serializer_class()
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if not self.is_lean_list():
+            return queryset
+        # Keyset pagination reads the cursor from the ordering columns of the last row.
+        get_keyset_ordering = getattr(self, "get_keyset_ordering", None)
+        ordering = [field.lstrip("-") for field in get_keyset_ordering()] if get_keyset_ordering else []
+        names = self.list_serializer_class.value_names()
+        return queryset.values(*names, *(name for name in ordering if name not in names))
+
+
 TASK_REQUEST_EXAMPLE = OpenApiExample(
     "Create task request",
     value={
@@ -107,6 +180,35 @@ SUBTASK_RESPONSE_EXAMPLE = OpenApiExample(
     response_only=True,
 )
 
+UPDATED_SINCE_PARAMETER = OpenApiParameter(
+    "updated_since",
+    OpenApiTypes.DATETIME,
+    description=(
+        "Delta sync: return only rows changed at or after this time as "
+        '`{"results": [...], "deleted": [ids], "sync_token": ...}`. Pass `sync_token` '
+        "as the next `updated_since`. Returns 410 when older than the sync history."
+    ),
+)
+
+TASK_LIST_PARAMETERS = [
+    OpenApiParameter("status", OpenApiTypes.STR, many=True, description="Filter by status (repeatable)."),
+    OpenApiParameter("priority", OpenApiTypes.STR, many=True, description="Filter by priority (repeatable)."),
+    OpenApiParameter("role", OpenApiTypes.STR, many=True, description="Filter by current user's role (repeatable)."),
+    OpenApiParameter("deadline_after", OpenApiTypes.DATE, description="Deadline on or after this date."),
+    OpenApiParameter("deadline_before", OpenApiTypes.DATE, description="Deadline on or before this date."),
+    OpenApiParameter("search", OpenApiTypes.STR, description="Case-insensitive match in title or description."),
+    OpenApiParameter(
+        "ordering",
+        OpenApiTypes.STR,
+        enum=["created_at", "-created_at", "updated_at", "-updated_at", "deadline", "-deadline", "priority", "-priority"],
+        description="Sort order (default -created_at). Priority sorts Low < Medium < High.",
+    ),
+    OpenApiParameter("page_size", OpenApiTypes.INT, description="Enable keyset pagination with this page size."),
+    OpenApiParameter("cursor", OpenApiTypes.STR, description="Opaque cursor taken from `next`."),
+    UPDATED_SINCE_PARAMETER,
+]
+
+
 MEMBERSHIP_REQUEST_EXAMPLE = OpenApiExample(
     "Create membership request",
     value={"user_id": 5, "role": "Assigned"},
@@ -128,14 +230,38 @@ MEMBERSHIP_RESPONSE_EXAMPLE = OpenApiExample(
 @extend_schema_view(
     get=extend_schema(
         tags=["Users"],
+        parameters=[
+            OpenApiParameter(
+                "q", OpenApiTypes.STR,
+                description="Username/email prefix (autocomplete). Always paginated when given.",
+            ),
+            OpenApiParameter("page_size", OpenApiTypes.INT, description="Users per page."),
+            OpenApiParameter("cursor", OpenApiTypes.STR, description="Opaque cursor from `next`."),
+        ],
         responses={200: UserSerializer(many=True), 401: OpenApiResponse(description="Unauthorized")},
-        description="List all users (authenticated).",
+        description=(
+            "List users (authenticated). Without `q`, `page_size` or `cursor` the response "
+            "is a plain list. With `q`, return a page of users whose username or email "
+            "starts with it, at most USER_SEARCH_MAX_RESULTS per page."
+        ),
     )
 )
 class UserListView(generics.ListAPIView):
-    queryset = User.objects.all()
     serializer_class = UserSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = UserSearchPagination
+
+    def get_queryset(self):
+        return filter_users(User.objects.all(), self.request.query_params)
+
+    def list(self, request, *args, **kwargs):
+        if "q" not in request.query_params:
+            return super().list(request, *args, **kwargs)
+        return Response(cached_user_search(request, self.render_search_page))
+
+    def render_search_page(self):
+        page = self.paginate_queryset(self.filter_queryset(self.get_queryset()))
+        return dict(self.get_paginated_response(self.get_serializer(page, many=True).data).data)
 
 
 @extend_schema_view(
@@ -249,7 +375,12 @@ def profile(request):
             200: TaskSerializer(many=True),
             401: OpenApiResponse(description="Unauthorized"),
         },
-        description="List tasks where current user has membership.",
+        description=(
+            "List tasks where current user has membership. Pass `page_size` and/or "
+            "`cursor` to get keyset-paginated results ordered by newest first; "
+            "follow `next` until it is null."
+        ),
+        parameters=TASK_LIST_PARAMETERS,
         examples=[TASK_LIST_RESPONSE_EXAMPLE],
     ),
     post=extend_schema(
@@ -264,23 +395,113 @@ def profile(request):
         examples=[TASK_REQUEST_EXAMPLE, TASK_RESPONSE_EXAMPLE],
     ),
 )
-class TaskListCreateView(generics.ListCreateAPIView):
+class TaskListCreateView(LeanListMixin, DeltaSyncListMixin, generics.ListCreateAPIView):
     serializer_class = TaskSerializer
+    list_serializer_class = TaskListSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = KeysetPagination
+
+    def get_keyset_ordering(self):
+        return get_task_ordering(self.request.query_params)
+
+    def get_deleted_ids(self, since):
+        return get_deleted_task_ids(self.request.user, since)
 
     def get_queryset(self):
-        membership_qs = UserTask.objects.filter(user=self.request.user).only("task_id", "role")
-        return (
-            Task.objects.filter(memberships__user=self.request.user)
-            .prefetch_related(
-                Prefetch("memberships", queryset=membership_qs, to_attr="current_user_memberships")
-            )
-            .order_by("-created_at")
-            .distinct()
+        params = self.request.query_params
+        membership_filters = get_task_membership_filters(
+            params, self.request.user, updated_since=self.updated_since
         )
+        # (task, user) is unique in user_tasks, so the join yields each task once
+        # and carries the caller's role along.
+        queryset = (
+            Task.objects.filter(membership_filters)
+            .filter(get_task_filters(params))
+            .annotate(membership_role=F("memberships__role"))
+            .select_related("assigned_by")
+        )
+        return annotate_priority_rank(queryset).order_by(*self.get_keyset_ordering())
 
     def perform_create(self, serializer):
-        create_task_for_user(serializer=serializer, user=self.request.user)
+        task = create_task_for_user(serializer=serializer, user=self.request.user)
+        get_membership_resolver(self.request).prime(task.id, UserTaskRole.OWNER)
+
+
+@extend_schema_view(
+    post=extend_schema(
+        tags=["Tasks"],
+        request=TaskSerializer(many=True),
+        responses={
+            201: TaskSerializer(many=True),
+            400: OpenApiResponse(description="Validation error (list of per-item errors)"),
+            401: OpenApiResponse(description="Unauthorized"),
+        },
+        description=(
+            "Create many tasks in one transaction, each with an Owner membership for the "
+            "current user. All-or-nothing: on error nothing is created and the response is "
+            "a list of per-item errors aligned with the input."
+        ),
+    ),
+    patch=extend_schema(
+        tags=["Tasks"],
+        request=TaskSerializer(many=True, partial=True),
+        responses={
+            200: TaskSerializer(many=True),
+            400: OpenApiResponse(description="Validation error (list of per-item errors)"),
+            401: OpenApiResponse(description="Unauthorized"),
+        },
+        description=(
+            "Partially update many tasks (Owner/Assigned). Each item needs an `id`. "
+            "All-or-nothing, with per-item errors like bulk create."
+        ),
+    ),
+    delete=extend_schema(
+        tags=["Tasks"],
+        request=TaskBulkDeleteSerializer,
+        responses={
+            204: OpenApiResponse(description="Tasks deleted"),
+            400: OpenApiResponse(description="Validation error or task not deletable"),
+            401: OpenApiResponse(description="Unauthorized"),
+        },
+        description="Delete many tasks (Owner only). All-or-nothing.",
+    ),
+)
+class TaskBulkView(generics.GenericAPIView):
+    serializer_class = TaskSerializer
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, *args, **kwargs):
+        ensure_bulk_size(request.data)
+        serializer = self.get_serializer(data=request.data, many=True)
+        serializer.is_valid(raise_exception=True)
+        tasks = bulk_create_tasks_for_user(serializer=serializer, user=request.user)
+
+        resolver = get_membership_resolver(request)
+        for task in tasks:
+            resolver.prime(task.id, UserTaskRole.OWNER)
+        return Response(self.get_serializer(tasks, many=True).data, status=status.HTTP_201_CREATED)
+
+    def patch(self, request, *args, **kwargs):
+        ensure_bulk_size(request.data)
+        tasks, roles = bulk_update_tasks_for_user(
+            items=request.data,
+            user=request.user,
+            serializer_class=self.get_serializer_class(),
+            context=self.get_serializer_context(),
+        )
+
+        resolver = get_membership_resolver(request)
+        for task_id, role in roles.items():
+            resolver.prime(task_id, role)
+        return Response(self.get_serializer(tasks, many=True).data, status=status.HTTP_200_OK)
+
+    def delete(self, request, *args, **kwargs):
+        serializer = TaskBulkDeleteSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        ids = serializer.validated_data["ids"]
+        ensure_bulk_size(ids)
+        bulk_delete_tasks_for_user(task_ids=ids, user=request.user)
+        return Response(status=status.HTTP_204_NO_CONTENT)
 
 
 @extend_schema_view(
@@ -292,6 +513,7 @@ class TaskListCreateView(generics.ListCreateAPIView):
             403: OpenApiResponse(description="Forbidden"),
         },
         description="List subtasks for a task where current user has membership.",
+        parameters=[UPDATED_SINCE_PARAMETER],
         examples=[SUBTASK_RESPONSE_EXAMPLE],
     ),
     post=extend_schema(
@@ -308,20 +530,69 @@ class TaskListCreateView(generics.ListCreateAPIView):
         examples=[SUBTASK_REQUEST_EXAMPLE, SUBTASK_RESPONSE_EXAMPLE],
     ),
 )
-class TaskSubtaskListCreateView(generics.ListCreateAPIView):
+class TaskSubtaskListCreateView(LeanListMixin, ConditionalListMixin, DeltaSyncListMixin, generics.ListCreateAPIView):
     serializer_class = SubtaskSerializer
+    list_serializer_class = SubtaskListSerializer
     permission_classes = [IsAuthenticated, TaskRolePermission]
 
+    def get_deleted_ids(self, since):
+        task_id = self.kwargs["task_id"]
+        if get_membership_resolver(self.request).get_role(task_id) is None:
+            return []
+        return get_deleted_subtask_ids(task_id, since)
+
     def get_queryset(self):
         task_id = self.kwargs["task_id"]
-        return Subtask.objects.filter(
+        queryset = Subtask.objects.filter(
             task_id=task_id,
             task__memberships__user=self.request.user,
-        ).order_by("-created_at")
+        )
+        if self.updated_since is not None:
+            queryset = queryset.filter(updated_at__gte=self.updated_since)
+        return queryset.order_by("position", "-created_at", "-id")
 
     def perform_create(self, serializer):
         task_id = self.kwargs["task_id"]
-        create_subtask_for_task(serializer=serializer, task_id=task_id, user=self.request.user)
+        create_subtask_for_task(
+            serializer=serializer,
+            task_id=task_id,
+            user=self.request.user,
+            resolver=get_membership_resolver(self.request),
+        )
+
+
+@extend_schema_view(
+    post=extend_schema(
+        tags=["Subtasks"],
+        request=SubtaskBatchRequestSerializer,
+        responses={
+            200: SubtaskBatchResultSerializer,
+            400: OpenApiResponse(description="Validation error"),
+            401: OpenApiResponse(description="Unauthorized"),
+            403: OpenApiResponse(description="Forbidden"),
+            404: OpenApiResponse(description="Task not found"),
+        },
+        description=(
+            "Create, update, reorder and delete subtasks of a task in one transaction. "
+            "`order` lists subtask ids in display order; unlisted subtasks follow it. Owner/Assigned may create, update "
+            "and reorder; deleting requires Owner."
+        ),
+    ),
+)
+class TaskSubtaskBatchView(generics.GenericAPIView):
+    serializer_class = SubtaskSerializer
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, *args, **kwargs):
+        result = apply_subtask_batch(
+            data=request.data,
+            task_id=self.kwargs["task_id"],
+            user=request.user,
+            serializer_class=self.get_serializer_class(),
+            context=self.get_serializer_context(),
+            resolver=get_membership_resolver(request),
+        )
+        return Response(SubtaskBatchResultSerializer(result).data, status=status.HTTP_200_OK)
 
 
 @extend_schema_view(
@@ -333,6 +604,7 @@ class TaskSubtaskListCreateView(generics.ListCreateAPIView):
             403: OpenApiResponse(description="Forbidden"),
         },
         description="List memberships for a task.",
+        parameters=[UPDATED_SINCE_PARAMETER],
         examples=[MEMBERSHIP_RESPONSE_EXAMPLE],
     ),
     post=extend_schema(
@@ -348,13 +620,20 @@ class TaskSubtaskListCreateView(generics.ListCreateAPIView):
         examples=[MEMBERSHIP_REQUEST_EXAMPLE, MEMBERSHIP_RESPONSE_EXAMPLE],
     ),
 )
-class TaskMembershipListCreateView(generics.ListCreateAPIView):
+class TaskMembershipListCreateView(LeanListMixin, ConditionalListMixin, DeltaSyncListMixin, generics.ListCreateAPIView):
     serializer_class = UserTaskSerializer
+    list_serializer_class = UserTaskListSerializer
     permission_classes = [IsAuthenticated, TaskMembershipPermission]
 
+    def get_deleted_ids(self, since):
+        return get_deleted_membership_ids(self.kwargs["task_id"], since)
+
     def get_queryset(self):
         task_id = self.kwargs["task_id"]
-        return UserTask.objects.filter(task_id=task_id).select_related("user").order_by("id")
+        queryset = UserTask.objects.filter(task_id=task_id).select_related("user")
+        if self.updated_since is not None:
+            queryset = queryset.filter(updated_at__gte=self.updated_since)
+        return queryset.order_by("id")
 
     def perform_create(self, serializer):
         task_id = self.kwargs["task_id"]
@@ -395,21 +674,21 @@ class TaskMembershipListCreateView(generics.ListCreateAPIView):
         description="Remove membership (Owner only).",
     ),
 )
-class TaskMembershipDetailView(generics.RetrieveUpdateDestroyAPIView):
+class TaskMembershipDetailView(ConditionalObjectMixin, generics.RetrieveUpdateDestroyAPIView):
     serializer_class = UserTaskSerializer
     permission_classes = [IsAuthenticated, TaskMembershipPermission]
+    lookup_field = "user_id"
 
     def get_queryset(self):
         task_id = self.kwargs["task_id"]
         return UserTask.objects.filter(task_id=task_id).select_related("user")
 
-    def get_object(self):
-        task_id = self.kwargs["task_id"]
-        user_id = self.kwargs["user_id"]
-        return get_object_or_404(UserTask, task_id=task_id, user_id=user_id)
+    def get_object_validators(self, obj):
+        etag = make_etag(obj.pk, obj.updated_at.isoformat(), obj.role, obj.user.username, obj.user.email)
+        return etag, obj.updated_at
 
     def perform_update(self, serializer):
-        membership = self.get_object()
+        membership = serializer.instance
         if membership.user_id == self.request.user.id:
             raise ValidationError({"detail": "You cannot change your own role in this task."})
         serializer.save()
@@ -456,20 +735,25 @@ class TaskMembershipDetailView(generics.RetrieveUpdateDestroyAPIView):
         description="Delete task (Owner only).",
     ),
 )
-class TaskDetailView(generics.RetrieveUpdateDestroyAPIView):
+class TaskDetailView(ConditionalObjectMixin, generics.RetrieveUpdateDestroyAPIView):
     serializer_class = TaskSerializer
     permission_classes = [IsAuthenticated, TaskRolePermission]
 
+    def get_object_validators(self, obj):
+        # current_user_role is part of the body, so it is part of the ETag.
+        role = get_membership_resolver(self.request).role_for_task(obj)
+        return make_etag(obj.pk, obj.updated_at.isoformat(), role), obj.updated_at
+
     def get_queryset(self):
-        membership_qs = UserTask.objects.filter(user=self.request.user).only("task_id", "role")
         return (
             Task.objects.filter(memberships__user=self.request.user)
-            .prefetch_related(
-                Prefetch("memberships", queryset=membership_qs, to_attr="current_user_memberships")
-            )
-            .distinct()
+            .annotate(membership_role=F("memberships__role"))
+            .select_related("assigned_by")
         )
 
+    def perform_destroy(self, instance):
+        delete_task(instance)
+
 
 @extend_schema_view(
     get=extend_schema(
@@ -507,18 +791,147 @@ class TaskDetailView(generics.RetrieveUpdateDestroyAPIView):
         description="Delete subtask (Owner only).",
     ),
 )
-class SubtaskDetailView(generics.RetrieveUpdateDestroyAPIView):
+class SubtaskDetailView(ConditionalObjectMixin, generics.RetrieveUpdateDestroyAPIView):
     serializer_class = SubtaskSerializer
     permission_classes = [IsAuthenticated]
 
     def get_queryset(self):
-        return Subtask.objects.filter(task__memberships__user=self.request.user)
+        return Subtask.objects.filter(task__memberships__user=self.request.user).annotate(
+            membership_role=F("task__memberships__role")
+        )
 
     def perform_update(self, serializer):
-        subtask = self.get_object()
-        ensure_can_edit_subtask(subtask=subtask, user=self.request.user)
-        serializer.save()
+        ensure_can_edit_subtask(
+            subtask=serializer.instance,
+            user=self.request.user,
+            resolver=get_membership_resolver(self.request),
+        )
+        update_subtask(serializer)
 
     def perform_destroy(self, instance):
-        ensure_can_delete_subtask(subtask=instance, user=self.request.user)
-        instance.delete()
+        ensure_can_delete_subtask(
+            subtask=instance,
+            user=self.request.user,
+            resolver=get_membership_resolver(self.request),
+        )
+        delete_subtask(instance)
+
+
+@extend_schema(
+    tags=["Tasks"],
+    responses={
+        200: DashboardSerializer,
+        401: OpenApiResponse(description="Unauthorized"),
+    },
+    description=(
+        "Counts of the current user's tasks by status, priority and role, plus tasks "
+        "overdue and due this week (not Done). Cached per user."
+    ),
+)
+class DashboardView(generics.GenericAPIView):
+    serializer_class = DashboardSerializer
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, *args, **kwargs):
+        return Response(get_dashboard(request.user), status=status.HTTP_200_OK)
+
+
+@extend_schema(
+    tags=["Tasks"],
+    parameters=[
+        OpenApiParameter("q", OpenApiTypes.STR, required=True, description="Search words."),
+        OpenApiParameter("page_size", OpenApiTypes.INT, description="Hits per page."),
+        OpenApiParameter("cursor", OpenApiTypes.STR, description="Opaque cursor from `next`."),
+    ],
+    responses={
+        200: SearchHitSerializer(many=True),
+        400: OpenApiResponse(description="Missing or too long query"),
+        401: OpenApiResponse(description="Unauthorized"),
+    },
+    description=(
+        "Full-text search over titles and descriptions of the current user's tasks and "
+        "their subtasks. Hits are ranked by relevance and always paginated."
+    ),
+)
+class SearchView(generics.GenericAPIView):
+    serializer_class = SearchHitSerializer
+    permission_classes = [IsAuthenticated]
+    pagination_class = RankedHitPagination
+
+    def get(self, request, *args, **kwargs):
+        query = parse_search_query(request.query_params)
+        hits = self.paginator.paginate_hits(
+            lambda limit, after: search_tasks(request.user, query, limit=limit, after=after),
+            SEARCH_ORDERING,
+            SEARCH_CURSOR_TYPES,
+            request,
+        )
+        return self.get_paginated_response(self.get_serializer(hits, many=True).data)
+
+
+@extend_schema(
+    tags=["Monitoring"],
+    responses={(200, "text/plain"): OpenApiTypes.STR, 403: OpenApiResponse(description="Wrong metrics token")},
+    description=(
+        "Per-view request latency, database query count and database time histograms of "
+        "this process, in Prometheus text format."
+    ),
+)
+class MetricsView(APIView):
+    # Scrapers send METRICS_TOKEN, not a JWT.
+    authentication_classes = []
+    permission_classes = [HasMetricsToken]
+
+    def get(self, request, *args, **kwargs):
+        return HttpResponse(render_metrics(), content_type=METRICS_CONTENT_TYPE)
+
+
+class IgnoreClientContentNegotiation(BaseContentNegotiation):
+    """The export picks its media type from `?output=`, not from Accept."""
+
+    def select_parser(self, request, parsers):
+        return parsers[0]
+
+    def select_renderer(self, request, renderers, format_suffix=None):
+        return (renderers[0], renderers[0].media_type)
+
+
+@extend_schema(
+    tags=["Tasks"],
+    parameters=[
+        OpenApiParameter("output", OpenApiTypes.STR, enum=sorted(EXPORT_FORMATS), description="ndjson (default) or csv."),
+        OpenApiParameter("all", OpenApiTypes.BOOL, description="Staff only: export every task."),
+    ],
+    responses={
+        (200, "application/x-ndjson"): OpenApiTypes.STR,
+        (200, "text/csv"): OpenApiTypes.STR,
+        400: OpenApiResponse(description="Unknown output format"),
+        401: OpenApiResponse(description="Unauthorized"),
+        403: OpenApiResponse(description="Forbidden"),
+    },
+    description=(
+        "Stream every task the current user is a member of, followed by its subtasks and "
+        "memberships, one record per line (`type` = task/subtask/membership)."
+    ),
+)
+class TaskExportView(generics.GenericAPIView):
+    permission_classes = [IsAuthenticated]
+    content_negotiation_class = IgnoreClientContentNegotiation
+
+    def get(self, request, *args, **kwargs):
+        export_format = request.query_params.get("output", "ndjson")
+        if export_format not in EXPORT_FORMATS:
+            raise ValidationError({"output": [f"Choose one of: {', '.join(sorted(EXPORT_FORMATS))}."]})
+
+        user = request.user
+        if request.query_params.get("all") in ("1", "true"):
+            if not request.user.is_staff:
+                raise PermissionDenied("Only staff can export all tasks.")
+            user = None
+
+        response = StreamingHttpResponse(
+            render_export(iter_export_records(user=user), export_format),
+            content_type=EXPORT_FORMATS[export_format],
+        )
+        response["Content-Disposition"] = f'attachment; filename="tasks.{export_format}"'
+        return response
@@ -56,6 +56,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'api_app.middleware.MetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -128,6 +129,34 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 
+# Password hashing (api_app/hashers.py). PASSWORD_HASHER picks the algorithm
+# for new hashes: "pbkdf2", "scrypt" or "argon2" (needs argon2-cffi). Hashes
+# made with the others, or with Django's other default hashers (pbkdf2_sha1,
+# bcrypt_sha256), still verify and are upgraded on the next login, as they
+# are when a cost below changes (0 keeps Django's default).
+PASSWORD_HASHER = os.environ.get("PASSWORD_HASHER", "pbkdf2")
+_PASSWORD_HASHERS = {
+    "pbkdf2": "api_app.hashers.PBKDF2PasswordHasher",
+    "scrypt": "api_app.hashers.ScryptPasswordHasher",
+    "argon2": "api_app.hashers.Argon2PasswordHasher",
+}
+PASSWORD_HASHERS = [_PASSWORD_HASHERS[PASSWORD_HASHER]] + [
+    path for name, path in _PASSWORD_HASHERS.items() if name != PASSWORD_HASHER
+] + [
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
+]
+PBKDF2_ITERATIONS = int(os.environ.get("PBKDF2_ITERATIONS", "0"))
+SCRYPT_WORK_FACTOR = int(os.environ.get("SCRYPT_WORK_FACTOR", "0"))
+ARGON2_TIME_COST = int(os.environ.get("ARGON2_TIME_COST", "0"))
+ARGON2_MEMORY_COST = int(os.environ.get("ARGON2_MEMORY_COST", "0"))
+# Hash/verify on this many threads per process, with at most
+# PASSWORD_HASH_QUEUE_SIZE more waiting; beyond that, login and register
+# answer 503. 0 hashes on the request thread.
+PASSWORD_HASH_WORKERS = int(os.environ.get("PASSWORD_HASH_WORKERS", "0"))
+PASSWORD_HASH_QUEUE_SIZE = int(os.environ.get("PASSWORD_HASH_QUEUE_SIZE", "16"))
+
+
 # Internationalization
 # https://docs.djangoproject.com/en/5.2/topics/i18n/
 
@@ -151,18 +180,109 @@ STATIC_URL = 'static/'
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 REST_FRAMEWORK = {
-    'DEFAULT_AUTHENTICATION_CLASSES': [
-    'rest_framework_simplejwt.authentication.JWTAuthentication'],
+    "DEFAULT_AUTHENTICATION_CLASSES": [
+        "api_app.authentication.StatelessJWTAuthentication",
+    ],
+    # 401 instead of a 500 for access tokens of deleted accounts.
+    "EXCEPTION_HANDLER": "api_app.exceptions.stateless_exception_handler",
+    # orjson-backed JSON when installed, stdlib json otherwise.
+    "DEFAULT_RENDERER_CLASSES": [
+        "api_app.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "api_app.parsers.FastJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
 }
 
+# Keyset pagination (opt-in via ?page_size= / ?cursor= on list endpoints)
+API_PAGE_SIZE = int(os.environ.get("API_PAGE_SIZE", "50"))
+API_MAX_PAGE_SIZE = int(os.environ.get("API_MAX_PAGE_SIZE", "200"))
+
+# Maximum items accepted by one /api/tasks/bulk/ request
+TASK_BULK_MAX_ITEMS = int(os.environ.get("TASK_BULK_MAX_ITEMS", "1000"))
+
+# Tasks per keyset batch when streaming exports
+EXPORT_BATCH_SIZE = int(os.environ.get("EXPORT_BATCH_SIZE", "500"))
+
+# How long deletions are remembered for ?updated_since= delta sync; older
+# tombstones are deleted by the `prune_old_tombstones` beat job (or the
+# `prune_tombstones` command).
+SYNC_TOMBSTONE_RETENTION_DAYS = int(os.environ.get("SYNC_TOMBSTONE_RETENTION_DAYS", "30"))
+TOMBSTONE_PRUNE_INTERVAL = float(os.environ.get("TOMBSTONE_PRUNE_INTERVAL", "3600"))
+
+# Cross-request cache of (user, task) -> role used for authorization.
+# "" disables it. "shared" (or any value but "local") uses the Django cache
+# alias below; with several workers it must be shared by all of them (e.g.
+# Redis). "local" is a per-process LRU for a single worker: membership
+# changes only invalidate the writing process, so other processes keep a
+# revoked or downgraded role for up to ROLE_CACHE_TTL seconds. System check
+# api_app.W001 warns when either would be stale with WEB_CONCURRENCY > 1.
+ROLE_CACHE_BACKEND = os.environ.get("ROLE_CACHE_BACKEND", "")
+ROLE_CACHE_ALIAS = os.environ.get("ROLE_CACHE_ALIAS", "default")
+ROLE_CACHE_MAX_SIZE = int(os.environ.get("ROLE_CACHE_MAX_SIZE", "10000"))
+ROLE_CACHE_TTL = int(os.environ.get("ROLE_CACHE_TTL", "60"))
+# Web worker processes per deployment (gunicorn reads the same variable).
+WEB_CONCURRENCY = int(os.environ.get("WEB_CONCURRENCY", "1"))
+
+# Per-user /api/dashboard/ aggregate, cached in a Django cache alias and
+# invalidated on task/membership changes. 0 (default) disables caching. Only
+# enable it with an alias shared by all workers (e.g. Redis): no CACHES are
+# configured here, so "default" is a per-process LocMemCache that other
+# workers' invalidations never reach.
+DASHBOARD_CACHE_ALIAS = os.environ.get("DASHBOARD_CACHE_ALIAS", "default")
+DASHBOARD_CACHE_TTL = int(os.environ.get("DASHBOARD_CACHE_TTL", "0"))
+
+# /api/users/?q= autocomplete: page size cap and short-TTL response cache
+# (seconds, 0 disables).
+USER_SEARCH_MAX_RESULTS = int(os.environ.get("USER_SEARCH_MAX_RESULTS", "20"))
+USER_SEARCH_CACHE_ALIAS = os.environ.get("USER_SEARCH_CACHE_ALIAS", "default")
+USER_SEARCH_CACHE_TTL = int(os.environ.get("USER_SEARCH_CACHE_TTL", "30"))
+
+# Fields of the authenticated user that are not in the JWT (email, ...) are
+# loaded on first use and cached per process for this many seconds.
+TOKEN_USER_CACHE_SIZE = int(os.environ.get("TOKEN_USER_CACHE_SIZE", "1000"))
+TOKEN_USER_CACHE_TTL = int(os.environ.get("TOKEN_USER_CACHE_TTL", "60"))
+
+# Per-view latency/query histograms served at /api/metrics/ (Prometheus
+# format; requires `Bearer METRICS_TOKEN`, and is closed while it is unset).
+# A METRICS_SQL_SAMPLE_RATE fraction of requests log their METRICS_SQL_TOP
+# slowest SQL statements.
+METRICS_ENABLED = os.environ.get("METRICS_ENABLED", "1") == "1"
+METRICS_TOKEN = os.environ.get("METRICS_TOKEN", "")
+METRICS_SQL_SAMPLE_RATE = float(os.environ.get("METRICS_SQL_SAMPLE_RATE", "0"))
+METRICS_SQL_TOP = int(os.environ.get("METRICS_SQL_TOP", "5"))
+
+# Console output for the "api_app.*" loggers
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {"console": {"class": "logging.StreamHandler"}},
+    "loggers": {"api_app": {"handlers": ["console"], "level": "INFO"}},
+}
+
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(minutes=30),
     "REFRESH_TOKEN_LIFETIME": timedelta(days=7),
     "ROTATE_REFRESH_TOKENS": False,
     "BLACKLIST_AFTER_ROTATION": True,
+    "TOKEN_REFRESH_SERIALIZER": "api_app.serializers.FilteredTokenRefreshSerializer",
 }
 
+# Expired rows of the JWT outstanding/blacklist tables are deleted by the
+# `prune_expired_tokens` beat job (or `prune_tokens` command) in batches.
+TOKEN_PRUNE_BATCH_SIZE = int(os.environ.get("TOKEN_PRUNE_BATCH_SIZE", "1000"))
+TOKEN_PRUNE_INTERVAL = float(os.environ.get("TOKEN_PRUNE_INTERVAL", "3600"))
+# Per-process Bloom filter of revoked refresh tokens checked before the
+# blacklist table on /api/token/refresh/. Logouts in other processes reach it
+# within TOKEN_REVOCATION_FILTER_SYNC_INTERVAL seconds.
+TOKEN_REVOCATION_FILTER = os.environ.get("TOKEN_REVOCATION_FILTER", "0") == "1"
+TOKEN_REVOCATION_FILTER_CAPACITY = int(os.environ.get("TOKEN_REVOCATION_FILTER_CAPACITY", "100000"))
+TOKEN_REVOCATION_FILTER_SYNC_INTERVAL = float(os.environ.get("TOKEN_REVOCATION_FILTER_SYNC_INTERVAL", "5"))
+
 SPECTACULAR_SETTINGS = {
     "TITLE": "TaskTracker API",
     "DESCRIPTION": "Task management API with JWT auth and role-based access control.",
@@ -180,3 +300,39 @@ CELERY_ACCEPT_CONTENT = ["json"]
 CELERY_TASK_SERIALIZER = "json"
 CELERY_RESULT_SERIALIZER = "json"
 CELERY_TIMEZONE = os.environ.get("CELERY_TIMEZONE", "UTC")
+
+# Outbox relay: notifications are written to outbox_messages with the task
+# rows and published by the `relay_outbox` beat job (or management command).
+OUTBOX_RELAY_BATCH_SIZE = int(os.environ.get("OUTBOX_RELAY_BATCH_SIZE", "100"))
+OUTBOX_RELAY_INTERVAL = float(os.environ.get("OUTBOX_RELAY_INTERVAL", "5"))
+# Task-created notifications wait this many seconds in the outbox so that
+# calls arriving close together go out as one message, in chunks of at most
+# NOTIFICATION_BATCH_SIZE task ids (one digest per recipient per chunk).
+NOTIFICATION_COALESCE_WINDOW = float(os.environ.get("NOTIFICATION_COALESCE_WINDOW", "2"))
+NOTIFICATION_BATCH_SIZE = int(os.environ.get("NOTIFICATION_BATCH_SIZE", "500"))
+CELERY_WORKER_PREFETCH_MULTIPLIER = int(os.environ.get("CELERY_WORKER_PREFETCH_MULTIPLIER", "4"))
+
+# Deadline reminders: open tasks due within the next N days, scanned in
+# keyset batches every DEADLINE_REMINDER_INTERVAL seconds.
+DEADLINE_REMINDER_HORIZON_DAYS = int(os.environ.get("DEADLINE_REMINDER_HORIZON_DAYS", "1"))
+DEADLINE_REMINDER_BATCH_SIZE = int(os.environ.get("DEADLINE_REMINDER_BATCH_SIZE", "500"))
+DEADLINE_REMINDER_INTERVAL = float(os.environ.get("DEADLINE_REMINDER_INTERVAL", "3600"))
+
+CELERY_BEAT_SCHEDULE = {
+    "relay-outbox": {
+        "task": "api_app.tasks.relay_outbox",
+        "schedule": OUTBOX_RELAY_INTERVAL,
+    },
+    "send-deadline-reminders": {
+        "task": "api_app.tasks.send_deadline_reminders",
+        "schedule": DEADLINE_REMINDER_INTERVAL,
+    },
+    "prune-expired-tokens": {
+        "task": "api_app.tasks.prune_expired_tokens",
+        "schedule": TOKEN_PRUNE_INTERVAL,
+    },
+    "prune-old-tombstones": {
+        "task": "api_app.tasks.prune_old_tombstones",
+        "schedule": TOMBSTONE_PRUNE_INTERVAL,
+    },
+}
@@ -174,6 +174,7 @@ function App() {
   const [bootError, setBootError] = useState("");
   const [bootLoading, setBootLoading] = useState(false);
   const [users, setUsers] = useState([]);
+  const [userQuery, setUserQuery] = useState("");
 
   const [taskForm, setTaskForm] = useState(EMPTY_TASK_FORM);
   const [taskCreateBusy, setTaskCreateBusy] = useState(false);
@@ -213,6 +214,7 @@ function App() {
     setSubtasks([]);
     setMemberships([]);
     setUsers([]);
+    setUserQuery("");
     setDeleteAccountOpen(false);
     setDeleteAccountPassword("");
     setDeleteAccountError("");
@@ -263,14 +265,27 @@ function App() {
     }
   }, [api]);
 
-  const loadUsers = useCallback(async () => {
-    try {
-      const data = await api.get("/users/");
-      setUsers(data);
-    } catch {
+  const searchUsers = useCallback(
+    async (query) => {
+      try {
+        const data = await api.get(`/users/?q=${encodeURIComponent(query)}`);
+        setUsers(data.results);
+      } catch {
+        setUsers([]);
+      }
+    },
+    [api],
+  );
+
+  useEffect(() => {
+    const query = userQuery.trim();
+    if (!tokens.access || !query) {
       setUsers([]);
+      return undefined;
     }
-  }, [api]);
+    const timer = setTimeout(() => searchUsers(query), 250);
+    return () => clearTimeout(timer);
+  }, [tokens.access, userQuery, searchUsers]);
 
   useEffect(() => {
     if (!selectedTask) return;
@@ -327,7 +342,7 @@ function App() {
       setBootLoading(true);
       setBootError("");
       try {
-        const [me] = await Promise.all([api.get("/profile/"), loadTasks(), loadUsers()]);
+        const [me] = await Promise.all([api.get("/profile/"), loadTasks()]);
         if (mounted) {
           setProfile(me);
         }
@@ -345,7 +360,7 @@ function App() {
     return () => {
       mounted = false;
     };
-  }, [tokens.access, api, loadTasks, loadUsers]);
+  }, [tokens.access, api, loadTasks]);
 
   useEffect(() => {
     if (!tokens.access || !selectedTaskId) return;
@@ -660,6 +675,8 @@ function App() {
             currentUserId={profile?.id ?? null}
             canManageMemberships={canManageMemberships}
             users={users}
+            userQuery={userQuery}
+            setUserQuery={setUserQuery}
             memberships={memberships}
             membershipsLoading={membershipsLoading}
             membershipsError={membershipsError}
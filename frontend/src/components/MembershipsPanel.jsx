@@ -5,6 +5,8 @@ function MembershipsPanel({
   currentUserId,
   canManageMemberships,
   users,
+  userQuery,
+  setUserQuery,
   memberships,
   membershipsLoading,
   membershipsError,
@@ -30,6 +32,15 @@ function MembershipsPanel({
 
       {selectedTask && canManageMemberships && (
         <form className="form-grid" onSubmit={onMembershipCreate}>
+          <label className="field">
+            <span>Find user</span>
+            <input
+              type="search"
+              value={userQuery}
+              onChange={(event) => setUserQuery(event.target.value)}
+              placeholder="Username or email"
+            />
+          </label>
           <div className="row two-col">
             <label className="field">
               <span>User</span>
@@ -40,7 +51,7 @@ function MembershipsPanel({
                 }
                 required
               >
-                <option value="">Select user</option>
+                <option value="">{userQuery.trim() ? "Select user" : "Type to search users"}</option>
                 {users.map((user) => (
                   <option key={user.id} value={user.id}>
                     {user.username}